@@ -17,6 +17,14 @@ from modules.managers import (
     mouse_follower,
     event_bus,
     uuid_manager,
+    image_cache_manager,
+    render_manager,
+    globe_rotation_manager,
+    hit_test_manager,
+    keybind_manager,
+    visibility_manager,
+    frame_scheduler,
+    frame_profiler,
 )
 from modules.interface_components.labels import money_label
 from modules.constructs.fonts import font
@@ -199,6 +207,28 @@ AchievementManager: achievement_manager.achievement_manager = (
 JobScheduler: job_scheduler.job_scheduler = job_scheduler.job_scheduler()
 EventBus: event_bus.event_bus = event_bus.event_bus()
 UuidManager: uuid_manager.uuid_manager = uuid_manager.uuid_manager()
+IMAGE_CACHE_BYTE_BUDGET: int = (
+    256 * 1024 * 1024
+)  # Estimated size of unpinned cached images before the least recently used are evicted
+ImageCacheManager: image_cache_manager.image_cache_manager = (
+    image_cache_manager.image_cache_manager(IMAGE_CACHE_BYTE_BUDGET)
+)
+RenderManager: render_manager.render_manager = render_manager.render_manager()
+GlobeRotationManager: globe_rotation_manager.globe_rotation_manager = (
+    globe_rotation_manager.globe_rotation_manager()
+)
+HitTestManager: hit_test_manager.hit_test_manager = hit_test_manager.hit_test_manager()
+KeybindManager: keybind_manager.keybind_manager = keybind_manager.keybind_manager()
+VisibilityManager: visibility_manager.visibility_manager = (
+    None  # requires additional setup before initialization
+)
+FRAME_RATE_CAP: int = 60  # Maximum frames per second, or 0 for uncapped
+POWER_SAVE_FRAME_RATE_CAP: int = 30  # Maximum frames per second with power_save
+MAX_IDLE_WAIT: float = (
+    0.5  # Longest time the main loop blocks for input while nothing is animating
+)
+FrameScheduler: frame_scheduler.frame_scheduler = frame_scheduler.frame_scheduler()
+FrameProfiler: frame_profiler.frame_profiler = frame_profiler.frame_profiler()
 NotificationManager: notification_manager.notification_manager = (
     None  # requires additional setup before initialization
 )
@@ -579,7 +609,7 @@ if EffectManager.effect_active("speed_loading"):
     DETAIL_LEVEL: float = 1.0
     BUNDLE_IMAGE_DETAIL_LEVEL: float = 0.1
     BUTTON_DETAIL_LEVEL: float = 1.0
-    GLOBE_PROJECTION_DETAIL_LEVEL: float = 1.0
+    GLOBE_PROJECTION_DETAIL_LEVEL: float = 0.5
     TERRAIN_DETAIL_LEVEL: float = 0.1
     CLOUDS_DETAIL_LEVEL: float = 0.1
 else:
@@ -589,6 +619,8 @@ else:
     GLOBE_PROJECTION_DETAIL_LEVEL: float = 1.0
     TERRAIN_DETAIL_LEVEL: float = 0.5
     CLOUDS_DETAIL_LEVEL: float = 0.15
+# Globe projection detail levels at or below this are rendered by remapping each location's color rather than composing each location's images
+GLOBE_PROJECTION_REMAP_DETAIL_LEVEL: float = 0.5
 
 TERRAIN_KNOWLEDGE: str = "terrain"
 TERRAIN_KNOWLEDGE_REQUIREMENT: int = 0
@@ -1064,6 +1096,11 @@ IMAGE_ID_LIST_VEHICLE_UNCREWED: str = "image_id_list_vehicle_uncrewed"
 IMAGE_ID_LIST_VEHICLE_MOVING: str = "image_id_list_vehicle_moving"
 IMAGE_ID_LIST_FULL_MOB: str = "image_id_list_full_mob"
 
+BUTTON_HIT_LAYER: str = "button_hit_layer"
+CELL_HIT_LAYER: str = "cell_hit_layer"
+FREE_IMAGE_HIT_LAYER: str = "free_image_hit_layer"
+# Layers of the hit test manager's spatial index, each queried separately
+
 HABITABILITY_PERFECT: int = 5
 HABITABILITY_TOLERABLE: int = 4
 HABITABILITY_UNPLEASANT: int = 3
@@ -1111,6 +1148,8 @@ DISPLAYED_LOCATION_INVENTORY_ENDPOINT: str = "displayed_location_inventory_endpo
 DISPLAYED_MINISTER_ENDPOINT: str = "displayed_minister_endpoint"
 DISPLAYED_PROSECUTION_ENDPOINT: str = "displayed_prosecution_endpoint"
 DISPLAYED_DEFENSE_ENDPOINT: str = "displayed_defense_endpoint"
+INTERFACE_VISIBILITY_ENDPOINT: str = "interface_visibility_endpoint"
+# Any subscriptions watching changes that may change which interface elements are showing
 
 LOCATION_SET_PARAMETER_ROUTE: str = "location_set_parameter_route"
 LOCATION_ADD_BUILDING_ROUTE: str = "location_add_building_route"
@@ -1129,6 +1168,11 @@ WORLD_SET_PARAMETER_ROUTE: str = "world_set_parameter_route"
 WORLD_UPDATE_TARGET_AVERAGE_TEMPERATURE_ROUTE: str = (
     "world_update_target_average_temperature_route"
 )
+SET_GAME_MODE_ROUTE: str = "set_game_mode_route"
+CALIBRATE_INFO_DISPLAY_ROUTE: str = "calibrate_info_display_route"
+UPDATE_INTERFACE_ELEMENTS_ROUTE: str = "update_interface_elements_route"
+INPUT_EVENT_ROUTE: str = "input_event_route"
+ACTIVATE_JOB_ROUTE: str = "activate_job_route"
 
 ABSOLUTE_ZERO_BANNER: str = "absolute_zero_banner"
 TERRAIN_DETAILS_BANNER: str = "terrain_details_banner"
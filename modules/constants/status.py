@@ -1,5 +1,6 @@
 import pygame
-from typing import Dict, List, Any
+import weakref
+from typing import Dict, List, Set, Any
 from modules.constructs.actor_types.mobs import mob
 from modules.constructs.ministers import minister
 from modules.constructs.building_types import building_type
@@ -65,13 +66,18 @@ displayed_defense: minister = None
 displayed_prosecution: minister = None
 displayed_notification: notification = None
 
-cached_images: Dict[str, pygame.Surface] = {}
+bundle_compositions: weakref.WeakValueDictionary = (
+    weakref.WeakValueDictionary()
+)  # Combined surfaces shared by identical image bundles, keyed by member image specs and size
 globe_projection_image: free_image = None
 globe_projection_surface: pygame.Surface = None
 to_strategic_button: switch_game_mode_button = None
 to_earth_button: switch_game_mode_button = None
 
 button_list: List[button] = []
+outlined_buttons: Set[button] = (
+    set()
+)  # Buttons currently showing their outlines, maintained by button.showing_outline
 instructions_list: List[str] = []
 minister_list: List[minister] = []
 available_minister_list: List[minister] = []
@@ -140,6 +146,7 @@ reorganize_vehicle_left_button: reorganize_unit_button = None
 reorganize_vehicle_right_button: reorganize_unit_button = None
 minister_loading_image: actor_icon = None
 albedo_free_image: free_image = None
+orbital_view_color_free_image: free_image = None
 cursor_image: pygame.image = None
 next_boarded_vehicle: pmob = None
 text_box_destination: callable = None
@@ -3,7 +3,7 @@ import math
 from typing import List, Dict, Any
 from modules.util import actor_utility, main_loop_utility, utility
 from modules.constructs.actor_types import actors
-from modules.constructs import world_handlers, item_types, settlements
+from modules.constructs import world_handlers, item_types, settlements, image_specs
 from modules.constants import constants, status, flags
 
 
@@ -38,7 +38,10 @@ class location(actors.actor):
         self.y: int = input_dict["coordinates"][1]
         self.adjacent_list: List[location] = []
         self.adjacent_locations: Dict[str, location] = {}
-        self.terrain_parameters: Dict[str, int] = input_dict.get(
+        self.terrain_parameter_arrays: Dict[str, Any] = (
+            self.world_handler.terrain_parameter_arrays
+        )  # This location's terrain parameters are stored at index (x, y) of its world's parameter arrays
+        for parameter_name, value in input_dict.get(
             "terrain_parameters",
             {
                 constants.KNOWLEDGE: 0,
@@ -49,7 +52,10 @@ class location(actors.actor):
                 constants.SOIL: 0,
                 constants.WATER: 0,
             },
-        )
+        ).items():
+            self.world_handler.set_location_parameter(
+                self.x, self.y, parameter_name, value
+            )
         self.local_weather_offset = input_dict.get(
             "local_weather_offset", random.uniform(-0.2, 0.2)
         )
@@ -69,9 +75,8 @@ class location(actors.actor):
         for terrain_feature in input_dict.get("terrain_features", {}).values():
             self.add_terrain_feature(terrain_feature)
         self.set_terrain(
-            constants.TerrainManager.classify(self.terrain_parameters),
-            update_image_bundle=False,
-        )
+            self.classify_terrain(), update_image_bundle=False
+        )  # Classified immediately even during bulk edits, since this location's image bundle is created below
         self.resource: item_types.item_type = status.item_types.get(
             input_dict.get("resource", None), None
         )
@@ -232,6 +237,7 @@ class location(actors.actor):
         self.expected_temperature_offset = (
             self.get_parameter(constants.TEMPERATURE) - self.get_expected_temperature()
         )
+        self.world_handler.update_temperature_outlier(self)
 
     def local_attrition(self, attrition_type="health"):
         """
@@ -673,7 +679,7 @@ class location(actors.actor):
         """
         self.set_parameter(
             parameter_name,
-            self.terrain_parameters[parameter_name] + change,
+            self.get_parameter(parameter_name) + change,
             update_display=update_display,
         )
 
@@ -716,16 +722,22 @@ class location(actors.actor):
         Output:
             None
         """
-        overlay_images = self.get_overlay_images()
+        reclassify = (
+            self.world_handler.bulk_edit_depth == 0
+        )  # Bulk edits reclassify each location's terrain once when they end
+        if reclassify:
+            overlay_images = self.get_overlay_images()
         if parameter_name in [constants.WATER, constants.TEMPERATURE]:
-            old_value = self.terrain_parameters[parameter_name]
-        elif parameter_name == constants.ALTITUDE:
+            old_value = self.get_parameter(parameter_name)
+        elif parameter_name == constants.ALTITUDE and reclassify:
             old_color_filter = self.get_color_filter()
-        self.terrain_parameters[parameter_name] = max(
+        new_value = max(
             self.minima.get(parameter_name, 0),
             min(new_value, self.maxima.get(parameter_name, 5)),
         )
-        new_value = self.terrain_parameters[parameter_name]
+        self.world_handler.set_location_parameter(
+            self.x, self.y, parameter_name, new_value
+        )
         # if parameter_name == constants.WATER and not self.is_abstract_location:
         # self.true_world_handler.update_average_water()
         if parameter_name == constants.ALTITUDE and not self.is_abstract_location:
@@ -742,24 +754,25 @@ class location(actors.actor):
                     self.get_parameter(constants.WATER) - water_displaced,
                     update_display=False,
                 )
-                for i in range(water_displaced):
-                    self.true_world_handler.place_water(update_display=update_display)
-
-        new_terrain = constants.TerrainManager.classify(self.terrain_parameters)
+                self.true_world_handler.place_water(
+                    update_display=update_display, num_units=water_displaced
+                )
 
-        if (
-            constants.current_map_mode != "terrain"
-            or self.terrain != new_terrain
-            or overlay_images != self.get_overlay_images()
-            or (
-                parameter_name == constants.ALTITUDE
-                and old_color_filter != self.get_color_filter()
-            )
-            or parameter_name == constants.KNOWLEDGE
-        ):
-            self.set_terrain(new_terrain, update_image_bundle=update_display)
-            if update_display and not flags.loading:
-                status.current_world.update_globe_projection()
+        if reclassify:
+            new_terrain = self.classify_terrain()
+            if (
+                constants.current_map_mode != "terrain"
+                or self.terrain != new_terrain
+                or overlay_images != self.get_overlay_images()
+                or (
+                    parameter_name == constants.ALTITUDE
+                    and old_color_filter != self.get_color_filter()
+                )
+                or parameter_name == constants.KNOWLEDGE
+            ):
+                self.set_terrain(new_terrain, update_image_bundle=update_display)
+                if update_display and not flags.loading:
+                    status.current_world.update_globe_projection()
 
         if status.displayed_location == self:
             actor_utility.calibrate_actor_info_display(
@@ -767,6 +780,23 @@ class location(actors.actor):
             )
         self.publish_events(constants.LOCATION_SET_PARAMETER_ROUTE, parameter_name)
 
+    def classify_terrain(self) -> str:
+        """
+        Description:
+            Returns the terrain type that this location's terrain parameters classify as
+        Input:
+            None
+        Output:
+            string: Returns this location's terrain type, like 'swamp'
+        """
+        return constants.TerrainManager.classify(
+            self.get_parameter(constants.TEMPERATURE),
+            self.get_parameter(constants.ROUGHNESS),
+            self.get_parameter(constants.VEGETATION),
+            self.get_parameter(constants.SOIL),
+            self.get_parameter(constants.WATER),
+        )
+
     def update_contained_mob_habitability(self) -> None:
         """
         Updates the habitability of all contained mobs in this location
@@ -892,7 +922,17 @@ class location(actors.actor):
         Output:
             None
         """
-        return self.terrain_parameters[parameter_name]
+        return int(self.terrain_parameter_arrays[parameter_name][self.x, self.y])
+
+    @property
+    def terrain_parameters(self) -> Dict[str, int]:
+        """
+        Returns a dictionary of this location's terrain parameters, copied from its world's parameter arrays
+        """
+        return {
+            parameter_name: self.get_parameter(parameter_name)
+            for parameter_name in constants.terrain_parameters
+        }
 
     def set_terrain(self, new_terrain: str, update_image_bundle: bool = True) -> None:
         """
@@ -999,10 +1039,16 @@ class location(actors.actor):
         mob.subscribed_location = None
         self.publish_events(constants.LOCATION_UNSUBSCRIBE_MOB_ROUTE)
 
-    def flow(self) -> None:
+    def flow(self) -> bool:
         """
-        Recursively flows water from this location to any adjacent locations, if possible. Water flows between locations based on altitude and temperature - water flows to
-            non-higher altitudes if there is much more water at the origin and if the origin water is liquid
+        Description:
+            Flows water from this location to any adjacent locations, if possible. Water flows between locations based on altitude and temperature - water flows to
+                non-higher altitudes if there is much more water at the origin and if the origin water is liquid
+            Does not flow any further - use the world handler's settle_water to flow until no more water can move
+        Input:
+            None
+        Output:
+            bool: Returns True if any water flowed, otherwise False
         """
         flowed = False
         if (
@@ -1022,17 +1068,14 @@ class location(actors.actor):
                 ):
                     if (
                         adjacent_location.get_parameter(constants.WATER)
-                        <= self.terrain_parameters[constants.WATER] - 2
+                        <= self.get_parameter(constants.WATER) - 2
                     ):
                         adjacent_location.change_parameter(
                             constants.WATER, 1, update_display=False
                         )
                         self.change_parameter(constants.WATER, -1, update_display=False)
                         flowed = True
-
-        if flowed:  # Flow could recursively trigger flows in adjacent cells
-            for adjacent_location in self.adjacent_list:
-                adjacent_location.flow()
+        return flowed
 
     def get_color_filter(self) -> Dict[str, int]:
         """
@@ -1135,23 +1178,9 @@ class location(actors.actor):
         if self.is_earth_location:
             return 1.0 - self.true_world_handler.get_tuning("earth_albedo_multiplier")
         elif not self.is_abstract_location:
-            status.albedo_free_image.set_image(
+            return self.world_handler.get_terrain_brightness(
                 self.image_dict[constants.IMAGE_ID_LIST_ALBEDO]
             )
-            return (
-                sum(
-                    [
-                        sum(
-                            status.albedo_free_image.image.combined_surface.get_at(
-                                (x, y)
-                            )[0:3]
-                        )
-                        / 3
-                        for x, y in [(0, 0), (0, 1), (1, 0), (1, 1)]
-                    ]
-                )
-                / 4
-            )
         else:  # Orbital world and other abstract worlds don't need brightness calculation
             return 1.0
 
@@ -1403,33 +1432,43 @@ class location(actors.actor):
                 self.image_dict[constants.IMAGE_ID_LIST_ALBEDO] = override_image
             else:
                 self.image_dict[constants.IMAGE_ID_LIST_DEFAULT] = (
-                    self.get_image_id_list()
+                    image_specs.get_image_spec_list(self.get_image_id_list())
                 )  # Includes buildings, terrain, clouds, etc. - whatever shows in strategic map (includes mapmodes and toggleable clouds)
                 self.image_dict[constants.IMAGE_ID_LIST_TERRAIN] = (
-                    self.get_image_id_list(terrain_only=True)
+                    image_specs.get_image_spec_list(
+                        self.get_image_id_list(terrain_only=True)
+                    )
                 )  # Includes terrain, clouds, etc. - whatever shows in tactical map (includes mapmodes and toggleable clouds)
                 self.image_dict[constants.IMAGE_ID_LIST_ORBITAL_VIEW] = (
-                    self.get_image_id_list(terrain_only=True, force_clouds=True)
+                    image_specs.get_image_spec_list(
+                        self.get_image_id_list(terrain_only=True, force_clouds=True)
+                    )
                 )  # Includes terrain, clouds, etc. - view from space (no mapmodes, clouds always show)
                 self.image_dict[constants.IMAGE_ID_LIST_ALBEDO] = (
-                    self.get_image_id_list(
-                        terrain_only=True,
-                        force_pixellated=True,
-                        allow_mapmodes=False,
-                        allow_clouds=False,
+                    image_specs.get_image_spec_list(
+                        self.get_image_id_list(
+                            terrain_only=True,
+                            force_pixellated=True,
+                            allow_mapmodes=False,
+                            allow_clouds=False,
+                        )
                     )
                 )  # Pixellated pure terrain appearance with no clouds for terrain albedo calculation
 
-        self.image_dict[constants.IMAGE_ID_LIST_INCLUDE_MOB] = (
-            self.image_dict[constants.IMAGE_ID_LIST_DEFAULT]
-            + self.get_mob_image_id_list()
-        )
+        self.image_dict[constants.IMAGE_ID_LIST_INCLUDE_MOB] = self.image_dict[
+            constants.IMAGE_ID_LIST_DEFAULT
+        ] + image_specs.get_image_spec_list(self.get_mob_image_id_list())
 
         self.image_dict[constants.IMAGE_ID_LIST_INCLUDE_MINIMAP_OVERLAY] = (
             self.image_dict[constants.IMAGE_ID_LIST_INCLUDE_MOB]
-            + self.get_minimap_overlay_image_id_list()
+            + image_specs.get_image_spec_list(self.get_minimap_overlay_image_id_list())
         )
 
+        if previous_image_dict.get(
+            constants.IMAGE_ID_LIST_ORBITAL_VIEW
+        ) != self.image_dict.get(constants.IMAGE_ID_LIST_ORBITAL_VIEW):
+            self.world_handler.orbital_view_version += 1
+
         if previous_image_dict != self.image_dict:
             if (
                 previous_mob_image_id_list
@@ -0,0 +1,184 @@
+# Contains frozen, interned offset image dictionaries that act as cheap cache keys and image ID list elements
+
+import weakref
+import pygame
+from typing import Dict, Any
+from modules.constants import constants
+
+
+class image_spec(dict):
+    """
+    Frozen offset image dictionary with a precomputed hash - equal specs are interned to the same object, so comparing or looking up specs only
+        requires identity and hash checks rather than deep dictionary comparisons
+    Can be read anywhere an offset image dictionary is expected, but must be copied before being modified
+    """
+
+    def __init__(self, image_id: Dict[str, Any], frozen_key: tuple):
+        """
+        Description:
+            Initializes this object - use get_image_spec instead, which returns the interned spec for an offset image dictionary
+        Input:
+            dictionary image_id: Offset image dictionary to freeze
+            tuple frozen_key: Hashable equivalent of the dictionary, as returned by freeze
+        Output:
+            None
+        """
+        super().__init__(
+            {key: copy_containers(item) for key, item in image_id.items()}
+        )  # Copied so that later changes to nested values can't change an interned spec
+        self.frozen_key: tuple = frozen_key
+        self.hash: int = hash(frozen_key)
+        self.surface_spec: image_spec = None
+        self.non_pixellated_surface_spec: image_spec = None
+
+    def __hash__(self) -> int:
+        """
+        Returns this spec's precomputed hash
+        """
+        return self.hash
+
+    def __eq__(self, other) -> bool:
+        """
+        Returns whether this spec is equal to the inputted spec or dictionary - equal specs are always interned to the same object
+        """
+        if isinstance(other, image_spec):
+            return self is other
+        return super().__eq__(other)
+
+    def __ne__(self, other) -> bool:
+        """
+        Returns whether this spec is not equal to the inputted spec or dictionary
+        """
+        return not self == other
+
+    def __reduce__(self):
+        """
+        Saves this spec as a plain dictionary
+        """
+        return (dict, (dict(self),))
+
+    def frozen(self, *args, **kwargs):
+        """
+        Prevents this spec from being modified, since it may be shared by any number of images
+        """
+        raise TypeError("image_spec is frozen - copy it before modifying it")
+
+    __setitem__ = frozen
+    __delitem__ = frozen
+    __ior__ = frozen
+    clear = frozen
+    pop = frozen
+    popitem = frozen
+    setdefault = frozen
+    update = frozen
+
+    def get_surface_spec(self, pixellated: bool = True) -> "image_spec":
+        """
+        Description:
+            Returns the interned spec of only the values that affect this image's loaded surface, for use as its image cache key - size, offsets,
+                and level don't change the loaded surface, so images that only differ in those share a cached surface
+        Input:
+            boolean pixellated = True: Whether to include pixellation and alpha, or to return the key of the surface before they are applied
+        Output:
+            image_spec: Returns the interned surface spec
+        """
+        if self.surface_spec == None:
+            surface_dict = {
+                "image_id": self["image_id"],
+                "detail_level": self.get(
+                    "detail_level", constants.BUNDLE_IMAGE_DETAIL_LEVEL
+                ),
+            }
+            for key in ["green_screen", "override_green_screen_colors", "color_filter"]:
+                if key in self:
+                    surface_dict[key] = self[key]
+            self.non_pixellated_surface_spec = get_image_spec(surface_dict)
+            if self.get("pixellated", False):
+                surface_dict["pixellated"] = True
+            if self.get("alpha", 255) != 255:
+                surface_dict["alpha"] = self["alpha"]
+            self.surface_spec = get_image_spec(surface_dict)
+        if pixellated:
+            return self.surface_spec
+        else:
+            return self.non_pixellated_surface_spec
+
+
+interned_image_specs: weakref.WeakValueDictionary = (
+    weakref.WeakValueDictionary()
+)  # Specs are forgotten once nothing displays them
+
+
+def freeze(value: Any) -> Any:
+    """
+    Description:
+        Recursively converts the inputted value into a hashable equivalent - containers are tagged with their type, since image loading treats
+            lists, tuples, and dictionaries differently, and dictionaries keep their order, since smart green screens match terrains in order
+    Input:
+        any type value: Value to convert
+    Output:
+        any type: Returns hashable equivalent of the inputted value
+    """
+    if isinstance(value, image_spec):
+        return value.frozen_key
+    elif isinstance(value, dict):
+        return (
+            dict,
+            tuple((key, freeze(item)) for key, item in value.items()),
+        )
+    elif isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(item) for item in value))
+    elif isinstance(value, pygame.Color):
+        return (tuple, tuple(value))
+    return value
+
+
+def copy_containers(value: Any) -> Any:
+    """
+    Description:
+        Recursively copies the dictionaries and lists within the inputted value, leaving any other values shared
+    Input:
+        any type value: Value to copy
+    Output:
+        any type: Returns copy of the inputted value
+    """
+    if isinstance(value, image_spec):
+        return value
+    elif isinstance(value, dict):
+        return {key: copy_containers(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [copy_containers(item) for item in value]
+    return value
+
+
+def get_image_spec(image_id: Any) -> Any:
+    """
+    Description:
+        Returns the interned image spec equal to the inputted offset image dictionary, creating it if necessary
+    Input:
+        string/dictionary image_id: String image file path or offset image dictionary
+    Output:
+        string/image_spec: Returns the inputted string, or the interned spec equal to the inputted dictionary
+    """
+    if isinstance(image_id, image_spec) or not isinstance(image_id, dict):
+        return image_id
+    frozen_key = freeze(image_id)
+    spec = interned_image_specs.get(frozen_key, None)
+    if spec == None:
+        spec = image_spec(image_id, frozen_key)
+        interned_image_specs[frozen_key] = spec
+    return spec
+
+
+def get_image_spec_list(image_id_list: Any) -> Any:
+    """
+    Description:
+        Returns a copy of the inputted image ID list with each offset image dictionary replaced by its interned image spec
+    Input:
+        list image_id_list: List of string image file paths and/or offset image dictionaries, or an image bundle
+    Output:
+        list: Returns list of string image file paths and/or image specs, or the inputted value if it is not a list
+    """
+    if not isinstance(image_id_list, list):
+        return image_id_list
+    return [get_image_spec(image_id) for image_id in image_id_list]
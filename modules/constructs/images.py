@@ -2,6 +2,7 @@
 
 import pygame
 import math
+import numpy as np
 from typing import List
 from modules.util import (
     utility,
@@ -10,6 +11,7 @@ from modules.util import (
     scaling,
     minister_utility,
 )
+from modules.constructs import image_specs
 from modules.constants import constants, status, flags
 
 
@@ -59,7 +61,23 @@ class image:
         """
         Removes this object from relevant lists and prevents it from further appearing in or affecting the program
         """
-        return
+        self.pin_cached_image(None)
+
+    def pin_cached_image(self, key):
+        """
+        Description:
+            Pins the cached image with the inputted key so that it isn't evicted while this image displays it, releasing any previously pinned
+                cached image
+        Input:
+            hashable key: Key of the cached image to pin, like a file path or image specs tuple, or None to only release the previous pin
+        Output:
+            None
+        """
+        if hasattr(self, "pinned_image_key") and self.pinned_image_key:
+            constants.ImageCacheManager.unpin(self.pinned_image_key)
+        self.pinned_image_key = key
+        if key:
+            constants.ImageCacheManager.pin(key)
 
     def can_show(self, skip_parent_collection=False):
         """
@@ -131,19 +149,34 @@ class image_bundle(image):
         super().__init__(parent_image.width, parent_image.height)
         self.parent_image = parent_image
         self.members = []
+        self.composition: bundle_composition = None
         if isinstance(image_id_list, list):
-            for current_image_id in image_id_list:
-                self.add_member(current_image_id, generate_combined_surface=False)
-            self.combined_surface = (
-                self.generate_combined_surface()
-            )  # Avoid calling generate_combined_surface on each component
+            image_spec_list = sorted(
+                image_specs.get_image_spec_list(image_id_list),
+                key=lambda image_id: (
+                    0 if isinstance(image_id, str) else image_id.get("level", 0)
+                ),
+            )  # Stable sort matches the order that members are inserted in
+            composition_key = (tuple(image_spec_list), self.width, self.height)
+            self.composition = status.bundle_compositions.get(composition_key, None)
+            if self.composition == None:
+                for current_image_id in image_spec_list:
+                    self.add_member(current_image_id, generate_combined_surface=False)
+                self.update_combined_surface()  # Avoid calling generate_combined_surface on each component
+            else:
+                self.members = self.composition.members.copy()
+                self.combined_surface = self.composition.combined_surface
         else:
             if image_id_list.contains_bundle:
                 image_id_list = image_id_list.image
             self.members = image_id_list.members
-            self.combined_surface = pygame.transform.scale(
-                image_id_list.combined_surface, (self.width, self.height)
-            )
+            self.composition = image_id_list.composition
+            if (self.width, self.height) == image_id_list.combined_surface.get_size():
+                self.combined_surface = image_id_list.combined_surface
+            else:
+                self.combined_surface = pygame.transform.scale(
+                    image_id_list.combined_surface, (self.width, self.height)
+                )
         self.scale()
 
     def copy(self):
@@ -187,7 +220,7 @@ class image_bundle(image):
             index += 1
         self.members.insert(index, new_member)
         if generate_combined_surface:
-            self.combined_surface = self.generate_combined_surface()
+            self.update_combined_surface()
 
     def get_blit_sequence(self):
         """
@@ -216,6 +249,24 @@ class image_bundle(image):
                     blit_sequence.append((member.image, (0, 0)))
         return blit_sequence
 
+    def update_combined_surface(self):
+        """
+        Sets this bundle's combined surface to the shared composition of its current members at its current size, only generating a new combined
+            surface if no other bundle currently uses an identical composition
+        """
+        composition_key = (
+            tuple(member.image_spec for member in self.members),
+            self.width,
+            self.height,
+        )
+        self.composition = status.bundle_compositions.get(composition_key, None)
+        if self.composition == None:
+            self.composition = bundle_composition(
+                self.members.copy(), self.generate_combined_surface()
+            )
+            status.bundle_compositions[composition_key] = self.composition
+        self.combined_surface = self.composition.combined_surface
+
     def generate_combined_surface(self):
         """
         Description:
@@ -225,7 +276,6 @@ class image_bundle(image):
         Output:
             pygame.Surface: Returns a Pygame Surface that is a combination of each of this bundle's images
         """
-        # this is running whenever image is set, even if being set to same image as another bundle
         combined_surface = pygame.Surface(
             (self.width, self.height), pygame.HWSURFACE | pygame.DOUBLEBUF
         )  # has strange interaction with smoke effects
@@ -262,7 +312,7 @@ class image_bundle(image):
             if current_member.member_type != member_type:
                 new_member_list.append(current_member)
         self.members = new_member_list
-        self.combined_surface = self.generate_combined_surface()
+        self.update_combined_surface()
 
     def has_member(self, member_type):
         """
@@ -283,7 +333,7 @@ class image_bundle(image):
         Removes all of this bundle's member images
         """
         self.members = []
-        self.combined_surface = self.generate_combined_surface()
+        self.update_combined_surface()
 
     def to_list(self):
         """
@@ -303,6 +353,27 @@ class image_bundle(image):
         return return_list
 
 
+class bundle_composition:
+    """
+    Combined surface and member images shared by each image bundle with the same members and size
+    Compositions are held weakly by status.bundle_compositions, and members don't refer back to their bundles, so reference counting releases
+        each composition once no bundle refers to it
+    """
+
+    def __init__(self, members, combined_surface):
+        """
+        Description:
+            Initializes this object
+        Input:
+            bundle_image list members: Member images of the composed bundle, in blit order
+            pygame.Surface combined_surface: Combination of each member image
+        Output:
+            None
+        """
+        self.members = members
+        self.combined_surface = combined_surface
+
+
 class bundle_image:
     """
     Not a true image, just a width, height, and id for an image in a bundle
@@ -313,7 +384,7 @@ class bundle_image:
         Description:
             Initializes this object
         Input:
-            image_bundle bundle: Image bundle that this bundle image is a member of
+            image_bundle bundle: Image bundle that this bundle image is created for, determining its size
             string/dictionary image_id: String image file path or offset image dictionary to define this image's appearance
                 offset image dictionary: String keys corresponding to extra information for offset images
                     'image'_id': string value - File path to image used for this offset image
@@ -351,16 +422,21 @@ class bundle_image:
         Output:
             None
         """
-        self.bundle = bundle
+        # Only the bundle's size is kept - members are shared through compositions, which shouldn't keep their creating bundle alive
+        self.bundle_width = bundle.width
+        self.bundle_height = bundle.height
         self.image = None
         self.member_type = member_type
         self.is_offset = is_offset
         if not is_offset:
             self.image_id = image_id
+            self.image_spec = image_id
             self.level = 0
             self.detail_level = constants.BUNDLE_IMAGE_DETAIL_LEVEL
         else:
+            image_id = image_specs.get_image_spec(image_id)
             self.image_id_dict = image_id
+            self.image_spec = image_id
             self.image_id = image_id["image_id"]
             self.x_size = image_id.get(
                 "x_size", image_id.get("size", 1)
@@ -426,12 +502,12 @@ class bundle_image:
             double: Returns final x offset of this member image when blitted to bundle's combined surface
         """
         if hasattr(self, "free") and self.free:
-            return self.bundle.width * self.x_offset
+            return self.bundle_width * self.x_offset
         else:
             return (
-                (self.bundle.width * self.x_offset)
+                (self.bundle_width * self.x_offset)
                 - (self.width / 2)
-                + (self.bundle.width / 2)
+                + (self.bundle_width / 2)
             )
 
     def get_blit_y_offset(self):
@@ -444,12 +520,12 @@ class bundle_image:
             double: Returns final y offset of this member image when blitted to bundle's combined surface
         """
         if hasattr(self, "free") and self.free:  # hasattr(self, 'override_width'):
-            return self.bundle.height * self.y_offset * -1
+            return self.bundle_height * self.y_offset * -1
         else:
             return (
-                (self.bundle.height * self.y_offset * -1)
+                (self.bundle_height * self.y_offset * -1)
                 - (self.height / 2)
-                + (self.bundle.height / 2)
+                + (self.bundle_height / 2)
             )
 
     def scale(self):
@@ -460,14 +536,14 @@ class bundle_image:
             if hasattr(self, "override_width"):
                 self.width = self.override_width
             else:
-                self.width = self.bundle.width * self.x_size
+                self.width = self.bundle_width * self.x_size
             if hasattr(self, "override_height"):
                 self.height = self.override_height
             else:
-                self.height = self.bundle.height * self.y_size
+                self.height = self.bundle_height * self.y_size
         else:
-            self.width = self.bundle.width
-            self.height = self.bundle.height
+            self.width = self.bundle_width
+            self.height = self.bundle_height
 
     def get_color_difference(self, color1, color2):
         """
@@ -494,17 +570,19 @@ class bundle_image:
         key = str(full_image_id) + str(self.detail_level)
         no_green_screen_key = key
         if self.is_offset:
-            if self.has_green_screen:
-                key += str(self.green_screen_colors)
-            if self.has_color_filter:
-                key += str(self.color_filter)
-            if self.pixellated:
+            if self.has_green_screen or self.has_color_filter:
+                non_pixellated_key = self.image_id_dict.get_surface_spec(
+                    pixellated=False
+                )
+            else:
                 non_pixellated_key = key
-                key += "pixellated"
-            if self.alpha != 255:
-                key += str(self.alpha)
-        if key in status.cached_images:  # if image already loaded, use it
-            self.image = status.cached_images[key]
+            if self.pixellated or self.alpha != 255:
+                key = self.image_id_dict.get_surface_spec()
+            else:
+                key = non_pixellated_key
+        cached_image = constants.ImageCacheManager.get(key)
+        if cached_image != None:  # if image already loaded, use it
+            self.image = cached_image
         else:  # If image not loaded, load it and add it to the loaded images
             try:
                 if full_image_id.endswith(".png"):
@@ -528,7 +606,9 @@ class bundle_image:
                         self.apply_per_pixel_mutations()
                 else:
                     self.text = True
-                    self.image = text_utility.text(self.image_id, self.font)
+                    self.image = text_utility.text(
+                        self.image_id, self.font
+                    ).copy()  # Text surfaces are shared through the text cache, so this image's alpha shouldn't be set on the cached surface
             except:
                 raise Exception(f"Invalid image id: {self.image_id}")
             if self.is_offset:
@@ -541,7 +621,7 @@ class bundle_image:
                         ),
                     )
                 if self.pixellated:
-                    status.cached_images[non_pixellated_key] = self.image
+                    constants.ImageCacheManager.set(non_pixellated_key, self.image)
                     self.image = pygame.transform.scale(
                         self.image,
                         (constants.PIXELLATED_SIZE, constants.PIXELLATED_SIZE),
@@ -555,156 +635,116 @@ class bundle_image:
                         self.image = pygame.transform.flip(self.image, False, True)
             if self.is_offset and self.alpha != 255:
                 self.image.set_alpha(self.alpha)
-            status.cached_images[key] = self.image
+            constants.ImageCacheManager.set(key, self.image)
 
     def apply_per_pixel_mutations(self):
         """
-        Applies green screen and color filter changes to this image
+        Description:
+            Applies green screen and color filter changes to this image
+            Each distinct color in the image is mutated once as a row of a color table, and the mutated table is then mapped back onto every pixel
+                through a surfarray view, leaving alpha unchanged
+        Input:
+            None
+        Output:
+            None
         """
-        width, height = self.image.get_size()
-        smart_green_screen = (
-            self.has_green_screen and type(self.green_screen_colors) == dict
+        pixels = pygame.surfarray.array3d(self.image)
+        packed_pixels = (
+            (pixels[..., 0].astype(np.int32) << 16)
+            | (pixels[..., 1].astype(np.int32) << 8)
+            | pixels[..., 2]
         )
-        color_cache = (
-            {}
-        )  # Avoid re-computing color changes for that starting color for the rest of the image
-        for x in range(width):
-            for y in range(height):
-                (
-                    original_red,
-                    original_green,
-                    original_blue,
-                    alpha,
-                ) = self.image.get_at((x, y))
-                red, green, blue = (
-                    original_red,
-                    original_green,
-                    original_blue,
-                )
-                if (
-                    color_cache.get((original_red, original_green, original_blue), None)
-                    == None
-                ):
-                    if self.has_green_screen:
-                        if smart_green_screen:
-                            replaced = False
-                            for terrain_type in self.green_screen_colors:
-                                if not replaced:
-                                    metadata = self.green_screen_colors[terrain_type]
-                                    for base_color in metadata["base_colors"]:
-                                        displacement = self.get_color_difference(
-                                            (red, green, blue),
-                                            base_color,
-                                        )
-                                        if (
-                                            sum([abs(a) for a in displacement])
-                                            <= metadata["tolerance"]
-                                        ):
-                                            replaced = True
-                                            difference_proportion = (
-                                                min(red / base_color[0], 1.5),
-                                                min(
-                                                    green / base_color[1],
-                                                    1.5,
-                                                ),
-                                                min(
-                                                    blue / base_color[2],
-                                                    1.5,
-                                                ),
-                                            )
-                                            red = min(
-                                                max(
-                                                    round(
-                                                        metadata["replacement_color"][0]
-                                                        * difference_proportion[0]
-                                                    ),
-                                                    0,
-                                                ),
-                                                255,
-                                            )
-                                            green = min(
-                                                max(
-                                                    round(
-                                                        metadata["replacement_color"][1]
-                                                        * difference_proportion[1]
-                                                    ),
-                                                    0,
-                                                ),
-                                                255,
-                                            )
-                                            blue = min(
-                                                max(
-                                                    round(
-                                                        metadata["replacement_color"][2]
-                                                        * difference_proportion[2]
-                                                    ),
-                                                    0,
-                                                ),
-                                                255,
-                                            )
-                                            break
-                                else:
-                                    break
-                        else:
-                            if self.override_green_screen_colors:
-                                replaced_colors = self.override_green_screen_colors
-                            else:
-                                replaced_colors = constants.green_screen_colors
-                            for index, current_replaced_color in enumerate(
-                                replaced_colors
-                            ):
-                                # If pixel matches preset green screen color, replace it with the image's corresponding replacement color
-                                if (
-                                    red,
-                                    green,
-                                    blue,
-                                ) == current_replaced_color:
-                                    (
-                                        red,
-                                        green,
-                                        blue,
-                                    ) = self.green_screen_colors[index]
-                                    break
-                    if self.has_color_filter:
-                        red = round(
-                            max(
-                                min(
-                                    self.color_filter.get(constants.COLOR_RED, 1) * red,
-                                    255,
-                                ),
-                                0,
-                            )
+        packed_colors, color_indices = np.unique(
+            packed_pixels.ravel(), return_inverse=True
+        )
+        original_colors = np.stack(
+            [
+                (packed_colors >> 16) & 255,
+                (packed_colors >> 8) & 255,
+                packed_colors & 255,
+            ],
+            axis=-1,
+        )
+        mutated_colors = self.get_mutated_colors(original_colors)
+        changed = np.any(mutated_colors != original_colors, axis=-1)
+        if not changed.any():
+            return
+        mutated_pixels = mutated_colors[color_indices.ravel()].reshape(pixels.shape)
+        try:
+            pixel_view = pygame.surfarray.pixels3d(self.image)
+        except ValueError:
+            # Surfaces without 24 or 32 bit pixels can't be referenced directly, so only changed pixels are set individually
+            changed_pixels = changed[color_indices.ravel()].reshape(pixels.shape[:2])
+            for x, y in zip(*np.nonzero(changed_pixels)):
+                alpha = self.image.get_at((x, y))[3]
+                self.image.set_at((x, y), (*mutated_pixels[x, y], alpha))
+        else:
+            pixel_view[...] = mutated_pixels
+            del pixel_view  # Unlocks the surface
+
+    def get_mutated_colors(self, colors):
+        """
+        Description:
+            Calculates and returns the result of applying this image's green screen and color filter changes to each of the inputted colors
+            Matches the original per-pixel rules exactly - smart green screen colors match the first base color whose summed channel difference is
+                within its tolerance, preset green screen colors must match exactly, and channels are rounded half to even like Python's round
+        Input:
+            ndarray colors: n x 3 array of RGB colors
+        Output:
+            ndarray: Returns n x 3 array of mutated RGB colors
+        """
+        new_colors = colors.astype(np.float64)
+        if self.has_green_screen:
+            replaced = np.zeros(len(colors), dtype=bool)
+            if type(self.green_screen_colors) == dict:  # Smart green screen
+                for metadata in self.green_screen_colors.values():
+                    replacement_color = np.array(
+                        metadata["replacement_color"][:3], dtype=np.float64
+                    )
+                    for base_color in metadata["base_colors"]:
+                        base_color = np.array(base_color[:3], dtype=np.float64)
+                        matches = ~replaced & (
+                            np.abs(colors - base_color).sum(axis=-1)
+                            <= metadata["tolerance"]
                         )
-                        green = round(
-                            max(
-                                min(
-                                    self.color_filter.get(constants.COLOR_GREEN, 1)
-                                    * green,
-                                    255,
-                                ),
-                                0,
+                        if matches.any():
+                            difference_proportion = np.minimum(
+                                colors[matches] / base_color, 1.5
                             )
-                        )
-                        blue = round(
-                            max(
-                                min(
-                                    self.color_filter.get(constants.COLOR_BLUE, 1)
-                                    * blue,
-                                    255,
-                                ),
+                            new_colors[matches] = np.clip(
+                                np.rint(replacement_color * difference_proportion),
                                 0,
+                                255,
                             )
-                        )
-                    color_cache[(original_red, original_green, original_blue)] = (
-                        red,
-                        green,
-                        blue,
-                    )
+                            replaced |= matches
+            else:
+                if self.override_green_screen_colors:
+                    replaced_colors = self.override_green_screen_colors
                 else:
-                    red, green, blue = color_cache[
-                        (original_red, original_green, original_blue)
-                    ]
-                self.image.set_at((x, y), (red, green, blue, alpha))
+                    replaced_colors = constants.green_screen_colors
+                for current_replaced_color, replacement_color in zip(
+                    replaced_colors, self.green_screen_colors
+                ):
+                    # If color matches preset green screen color, replace it with the image's corresponding replacement color
+                    matches = ~replaced & np.all(
+                        colors == np.array(current_replaced_color[:3]), axis=-1
+                    )
+                    new_colors[matches] = replacement_color
+                    replaced |= matches
+        if self.has_color_filter:
+            for channel, color_key in enumerate(
+                [constants.COLOR_RED, constants.COLOR_GREEN, constants.COLOR_BLUE]
+            ):
+                new_colors[:, channel] = np.rint(
+                    np.clip(
+                        self.color_filter.get(color_key, 1) * new_colors[:, channel],
+                        0,
+                        255,
+                    )
+                )
+        return np.trunc(new_colors).astype(
+            np.int64
+        )  # Non-integer replacement colors are truncated when set, like in Surface.set_at
 
 
 class free_image(image):
@@ -758,6 +798,10 @@ class free_image(image):
 
         self.to_front = input_dict.get("to_front", False)
         status.free_image_list.append(self)
+        constants.EventBus.publish(
+            constants.INTERFACE_VISIBILITY_ENDPOINT,
+            constants.UPDATE_INTERFACE_ELEMENTS_ROUTE,
+        )
 
     def calibrate(self, new_actor):
         return
@@ -777,6 +821,7 @@ class free_image(image):
         if hasattr(self, "Rect") and self.Rect:
             self.Rect.x = self.x
             self.Rect.y = constants.display_height - (new_y + self.height)
+            constants.HitTestManager.update(self)
         if self.has_parent_collection:
             self.x_offset = new_x - self.parent_collection.x
             self.y_offset = new_y - self.parent_collection.y
@@ -828,6 +873,11 @@ class free_image(image):
             status.independent_interface_elements, self
         )
         status.free_image_list = utility.remove_from_list(status.free_image_list, self)
+        constants.HitTestManager.unregister(self)
+        constants.EventBus.publish(
+            constants.INTERFACE_VISIBILITY_ENDPOINT,
+            constants.UPDATE_INTERFACE_ELEMENTS_ROUTE,
+        )
 
     def remove_recursive(self):
         """
@@ -845,9 +895,11 @@ class free_image(image):
             None
         """
         if isinstance(new_image, image_bundle):
+            self.pin_cached_image(None)
             self.contains_bundle = True
             self.image = new_image.copy()
         elif isinstance(new_image, pygame.Surface):
+            self.pin_cached_image(None)
             self.image = new_image
             self.contains_bundle = False
         else:
@@ -861,8 +913,10 @@ class free_image(image):
                     else:
                         self.text = True
                         full_image_id = self.image_id
-                    if full_image_id in status.cached_images:
-                        self.image = status.cached_images[full_image_id]
+                    self.pin_cached_image(full_image_id)
+                    cached_image = constants.ImageCacheManager.get(full_image_id)
+                    if cached_image != None:
+                        self.image = cached_image
                     else:
                         if not self.text:
                             try:  # use if there are any image path issues to help with file troubleshooting, shows the file location in which an image was expected
@@ -882,13 +936,14 @@ class free_image(image):
                                 math.floor(size[1] * constants.DETAIL_LEVEL),
                             ),
                         )
-                        status.cached_images[full_image_id] = self.image
+                        constants.ImageCacheManager.set(full_image_id, self.image)
                     self.image = pygame.transform.scale(
                         self.image, (self.width, self.height)
                     )
                     if self.color_key:
                         self.image.set_colorkey(self.color_key)
                 else:  # if set to image path list
+                    self.pin_cached_image(None)
                     self.contains_bundle = True
                     self.image = image_bundle(self, self.image_id)
         if (
@@ -1009,6 +1064,9 @@ class tooltip_free_image(free_image):
             self.height,
         )
         self.Rect.y = self.y - self.height
+        constants.HitTestManager.register(
+            self, constants.FREE_IMAGE_HIT_LAYER, visible=self.showing
+        )
         self.preset_tooltip_text = input_dict.get("preset_tooltip_text", [])
 
     @property
@@ -1399,8 +1457,10 @@ class button_image(image):  # Used to be attached to actor_image
         if isinstance(self.image_id, str):  # If set to string image path
             self.contains_bundle = False
             full_image_id = f"graphics/{self.image_id}"
-            if full_image_id in status.cached_images:
-                self.image = status.cached_images[full_image_id]
+            self.pin_cached_image(full_image_id)
+            cached_image = constants.ImageCacheManager.get(full_image_id)
+            if cached_image != None:
+                self.image = cached_image
             else:
                 try:  # Use if there are any image path issues to help with file troubleshooting, shows the file location in which an image was expected
                     self.image = pygame.image.load(full_image_id)
@@ -1415,12 +1475,14 @@ class button_image(image):  # Used to be attached to actor_image
                         math.floor(size[1] * constants.BUTTON_DETAIL_LEVEL),
                     ),
                 )
-                status.cached_images[full_image_id] = self.image
+                constants.ImageCacheManager.set(full_image_id, self.image)
             self.image = pygame.transform.scale(self.image, (self.width, self.height))
         elif isinstance(new_image_id, pygame.Surface):
+            self.pin_cached_image(None)
             self.image = new_image_id
             self.contains_bundle = False
         else:  # If set to image path list
+            self.pin_cached_image(None)
             self.contains_bundle = True
             self.image = image_bundle(self, self.image_id)
 
@@ -1481,10 +1543,14 @@ class cell_image(image):
             font = constants.fonts["max_detail_white"]
             font_width = self.width * 0.13 * 1.3
             font_height = self.width * 0.3 * 1.3
-            textsurface = font.pygame_font.render(message, False, font.color)
-            textsurface = pygame.transform.scale(
-                textsurface, (font_width * len(message), font_height)
-            )
+            size = (font_width * len(message), font_height)
+            key = ("scaled_text", message, font, size)
+            textsurface = constants.ImageCacheManager.get(key)
+            if textsurface == None:
+                textsurface = pygame.transform.scale(
+                    text_utility.text(message, font), size
+                )
+                constants.ImageCacheManager.set(key, textsurface)
             text_x = self.x + self.width - (font_width * (len(message) + 0.3))
             text_y = self.y + (-0.8 * self.height) - (0.5 * font_height)
-            constants.game_display.blit(textsurface, (text_x, text_y))
+            drawing_utility.display_image(textsurface, text_x, text_y)
@@ -1,10 +1,13 @@
 import pygame
 import math
+import numpy as np
 import random
 import time
-from typing import List, Dict, Tuple, Any
-from modules.util import actor_utility, world_utility, utility
-from modules.constructs import world_handlers
+from collections import deque
+from contextlib import contextmanager
+from typing import List, Dict, Tuple, Any, Iterable, Iterator
+from modules.util import actor_utility, world_utility, utility, terrain_array_utility
+from modules.constructs import world_handlers, images
 from modules.constants import constants, status, flags
 
 
@@ -257,6 +260,10 @@ class full_world_handler(world_handlers.world_handler):
         Output:
             None
         """
+        # Built when first needed for water placement, then kept up to date by each altitude, temperature, and water edit
+        self.water_placement_pools: Dict[str, terrain_array_utility.ranked_pool] = None
+        # Weighted walk step tables for each weight parameter, built when first needed and discarded whenever their weights change
+        self.walk_step_tables: Dict[str, List[List[List[float]]]] = {}
         super().__init__(from_save, input_dict)
 
         constants.EventBus.subscribe(
@@ -273,21 +280,31 @@ class full_world_handler(world_handlers.world_handler):
 
         self.latitude_lines_setup()
 
+        # Seconds spent in each world generation phase, like altitude or climate_equilibrium
+        self.generation_phase_times: Dict[str, float] = {}
+        # Average brightness of each albedo image ID list, keyed by its interned image specs - locations with the same terrain, variant, and
+        #   overlays share an entry, and entries are cleared whenever update_sky_color changes the water tint
+        self.terrain_brightness_table: Dict[Tuple, float] = {}
         if not from_save:  # Initial full world generation
             if constants.EffectManager.effect_active("benchmark_world_creation"):
                 start_time = time.time()
                 print(f"Starting world creation at time: {start_time}")
             self.update_sky_color(set_initial_offset=True)
-            self.generate_poles_and_equator()
+            with self.bulk_edit(), self.time_generation_phase("poles_and_equator"):
+                self.generate_poles_and_equator()
             self.generate_terrain_parameters()
-            self.generate_terrain_features()
+            with self.bulk_edit(), self.time_generation_phase("features"):
+                self.generate_terrain_features()
             for location in self.get_flat_location_list():
                 location.local_weather_offset = (
                     location.expected_temperature_offset + random.uniform(-0.4, 0.4)
                 )
-            self.apply_low_pressure()
-            self.apply_radiation()
-            self.simulate_climate_equilibrium()
+            self.temperature_outlier_heaps = None
+            with self.bulk_edit(), self.time_generation_phase("radiation"):
+                self.apply_low_pressure()
+                self.apply_radiation()
+            with self.time_generation_phase("climate_equilibrium"):
+                self.simulate_climate_equilibrium()
             if constants.EffectManager.effect_active("benchmark_world_creation"):
                 end_time = time.time()
                 elapsed = end_time - start_time
@@ -295,6 +312,8 @@ class full_world_handler(world_handlers.world_handler):
                 print(
                     f"Finished world creation at time: {end_time}, took {round(elapsed, 2)} seconds ({round(elapsed_per_location, 6)} seconds per location)"
                 )
+                for phase_name, phase_time in self.generation_phase_times.items():
+                    print(f"    {phase_name}: {round(phase_time, 3)} seconds")
 
         self.orbital_world: orbital_world_handler = (
             constants.ActorCreationManager.create(
@@ -310,13 +329,48 @@ class full_world_handler(world_handlers.world_handler):
     def generate_terrain_parameters(self):
         """
         Randomly sets terrain parameters for each cell
+            Generation steps are wrapped in bulk edits, except for climate simulation, which selects locations based on their
+                temperature offsets and requires them to be updated after each change
+        """
+        with self.bulk_edit():
+            with self.time_generation_phase("altitude"):
+                self.generate_altitude()
+            with self.time_generation_phase("roughness"):
+                self.generate_roughness()
+            with self.time_generation_phase("temperature"):
+                self.generate_temperature()
+        with self.time_generation_phase("climate_equilibrium"):
+            self.simulate_climate_equilibrium(
+                estimate_water_vapor=True, update_cloud_images=False
+            )
+        with self.bulk_edit():
+            with self.time_generation_phase("water"):
+                self.generate_water()
+            with self.time_generation_phase("soil"):
+                self.generate_soil()
+            with self.time_generation_phase("vegetation"):
+                self.generate_vegetation()
+
+    @contextmanager
+    def time_generation_phase(self, phase_name: str) -> Iterator[None]:
+        """
+        Description:
+            Context manager that adds the time spent within it to the inputted world generation phase's total
+                Events deferred by bulk edits are invoked after the phases within them, so their time is not attributed to any phase
+        Input:
+            string phase_name: Name of the generation phase, like altitude
+        Output:
+            None
         """
-        self.generate_altitude()
-        self.generate_roughness()
-        self.generate_temperature()
-        self.generate_water()
-        self.generate_soil()
-        self.generate_vegetation()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.generation_phase_times[phase_name] = (
+                self.generation_phase_times.get(phase_name, 0.0)
+                + time.perf_counter()
+                - start_time
+            )
 
     def generate_altitude(self) -> None:
         """
@@ -357,14 +411,12 @@ class full_world_handler(world_handlers.world_handler):
                 bound=random.choice(self.get_tuning("altitude_bounds")),
             )
         if self.get_tuning("smooth_altitude"):
-            while self.smooth(
-                constants.ALTITUDE
-            ):  # Continue running smooth until it doesn't make any more changes
-                pass
+            self.smooth_until_stable(constants.ALTITUDE)
 
     def generate_temperature(self) -> None:
         """
         Randomly generates temperature
+            Must be followed by a climate simulation to reach the target average temperature
         """
         self.update_target_average_temperature(estimate_water_vapor=True)
         default_temperature = round(self.average_temperature)
@@ -381,10 +433,9 @@ class full_world_handler(world_handlers.world_handler):
                 update_display=False,
             )
         if self.get_tuning("smooth_temperature"):
-            while self.smooth(
+            self.smooth_until_stable(
                 constants.TEMPERATURE
-            ):  # Random but smooth initialization to represent weather patterns
-                pass
+            )  # Random but smooth initialization to represent weather patterns
 
         temperature_sources = [
             status.north_pole,
@@ -457,9 +508,6 @@ class full_world_handler(world_handlers.world_handler):
                     start_location=temperature_source,
                     weight_parameter="pole_distance_multiplier",
                 )
-        self.simulate_climate_equilibrium(
-            estimate_water_vapor=True, update_cloud_images=False
-        )
 
     def generate_roughness(self) -> None:
         """
@@ -504,14 +552,44 @@ class full_world_handler(world_handlers.world_handler):
         Randomly generates water, placing enough water to reach the generated target average
             Total water may be less than target average if repeatedly attempting to place in saturated locations, or if radiation removes some of the placed water
         """
-        for _ in range(round(self.average_water_target * (self.world_dimensions**2))):
-            self.place_water(update_display=False, during_setup=True)
+        self.place_water(
+            update_display=False,
+            during_setup=True,
+            num_units=round(self.average_water_target * (self.world_dimensions**2)),
+        )
+        self.settle_water()
         if constants.EffectManager.effect_active("map_customization"):
             attempts = 0
             while attempts < 10000 and not self.find_average(constants.WATER) == 5.0:
                 self.place_water(update_display=False, during_setup=True)
                 attempts += 1
 
+    def settle_water(self, seed_locations: Iterable = None) -> None:
+        """
+        Description:
+            Flows water until no more can move, starting from the inputted locations or from every location
+                Locations are processed from a deduplicated queue - when a location flows, it and its adjacent locations are queued to be
+                    checked again, rather than flowed recursively
+        Input:
+            location list seed_locations: Locations to start flowing from, or None to settle the whole world
+        Output:
+            None
+        """
+        if seed_locations == None:
+            seed_locations = self.get_flat_location_list()
+        queue = deque(dict.fromkeys(seed_locations))
+        queued = set(queue)
+        while queue:
+            current_location = queue.popleft()
+            queued.remove(current_location)
+            if current_location.flow():
+                for affected_location in [current_location] + list(
+                    current_location.adjacent_list
+                ):  # Each flow moves at most 1 unit to each adjacent location, so the flowing location may still have surplus
+                    if not affected_location in queued:
+                        queue.append(affected_location)
+                        queued.add(affected_location)
+
     def apply_radiation(self) -> None:
         """
         Applies radiation effects to water, particularly non-frozen water, based on unmitigated radiation
@@ -553,7 +631,7 @@ class full_world_handler(world_handlers.world_handler):
                 current_location.set_parameter(
                     constants.WATER, water_retained, update_display=False
                 )
-                current_location.flow()
+            self.settle_water()
 
     def apply_low_pressure(self) -> None:
         """
@@ -568,82 +646,217 @@ class full_world_handler(world_handlers.world_handler):
                         constants.WATER, 0, update_display=False
                     )
 
+    def build_water_placement_pools(
+        self, generator: np.random.Generator
+    ) -> Dict[str, terrain_array_utility.ranked_pool]:
+        """
+        Description:
+            Builds pools of the flat indices of unsaturated locations that could receive water
+                Liquid candidates are ordered by altitude, frozen candidates are ordered by temperature, and ties are in random order
+        Input:
+            Generator generator: Random generator to order ties with
+        Output:
+            dictionary: Returns a dictionary of liquid, frozen, and gas ranked pools
+        """
+        temperature = self.get_parameter_array(constants.TEMPERATURE).ravel()
+        altitude = self.get_parameter_array(constants.ALTITUDE).ravel()
+        water = self.get_parameter_array(constants.WATER).ravel()
+        freezing_point = self.get_tuning("water_freezing_point")
+        boiling_point = self.get_tuning("water_boiling_point")
+        tie_order = generator.permutation(temperature.size)
+        tie_locations = np.argsort(tie_order).tolist()
+        unsaturated = np.flatnonzero(water < 5)
+        liquid = unsaturated[
+            (temperature[unsaturated] >= freezing_point)
+            & (temperature[unsaturated] < boiling_point)
+        ]
+        frozen = unsaturated[temperature[unsaturated] <= freezing_point - 1]
+        gas = unsaturated[temperature[unsaturated] >= boiling_point]
+        # Locations bound altitude to 0-5, and temperature to at least the coldest terrain temperature
+        altitude_range = (min(0, int(altitude.min())), max(5, int(altitude.max())))
+        frozen_range = (
+            min(constants.TerrainManager.minimum_temperature, int(temperature.min())),
+            freezing_point - 1,
+        )
+        return {
+            "liquid": terrain_array_utility.ranked_pool(
+                liquid, altitude[liquid], altitude_range, tie_order, tie_locations
+            ),
+            "frozen": terrain_array_utility.ranked_pool(
+                frozen, temperature[frozen], frozen_range, tie_order, tie_locations
+            ),
+            "gas": terrain_array_utility.ranked_pool(
+                gas,
+                np.zeros(len(gas), dtype=np.int64),
+                (0, 0),
+                tie_order,
+                tie_locations,
+            ),
+        }
+
+    def get_water_placement_entry(self, x: int, y: int) -> Tuple[str, int]:
+        """
+        Description:
+            Returns the water placement pool and sort key of the inputted location
+        Input:
+            int x: X coordinate of the location
+            int y: Y coordinate of the location
+        Output:
+            tuple: Returns a tuple of the location's pool type and sort key, or None if the location is saturated
+        """
+        if self.terrain_parameter_arrays[constants.WATER][x, y] >= 5:
+            return None
+        temperature = int(self.terrain_parameter_arrays[constants.TEMPERATURE][x, y])
+        if temperature >= self.get_tuning("water_boiling_point"):
+            return ("gas", 0)
+        elif temperature >= self.get_tuning("water_freezing_point"):
+            return (
+                "liquid",
+                int(self.terrain_parameter_arrays[constants.ALTITUDE][x, y]),
+            )
+        return ("frozen", temperature)
+
+    def move_water_placement_candidate(
+        self, index: int, old_entry: Tuple[str, int], new_entry: Tuple[str, int]
+    ) -> None:
+        """
+        Description:
+            Moves the inputted location from its old position in the water placement pools to its new position, keeping its rank among ties
+        Input:
+            int index: Flat index of the location
+            tuple old_entry: Pool type and sort key the location was in, or None if it was saturated
+            tuple new_entry: Pool type and sort key the location is now in, or None if it is now saturated
+        Output:
+            None
+        """
+        if old_entry:
+            pool_type, key = old_entry
+            self.water_placement_pools[pool_type].update(index, key, -1)
+        if new_entry:
+            pool_type, key = new_entry
+            self.water_placement_pools[pool_type].update(index, key, 1)
+
+    def set_location_parameter(
+        self, x: int, y: int, parameter_name: str, new_value: int
+    ) -> None:
+        """
+        Description:
+            Sets the inputted location's value of a terrain parameter, moving the location within the water placement pools if its altitude,
+                temperature, or saturation changed, and discarding any walk step table weighted by the parameter
+        Input:
+            int x: X coordinate of the location to set
+            int y: Y coordinate of the location to set
+            string parameter_name: Name of the terrain parameter to set
+            int new_value: New value for the parameter, already bounded by the location
+        Output:
+            None
+        """
+        if parameter_name in self.walk_step_tables and new_value != int(
+            self.terrain_parameter_arrays[parameter_name][x, y]
+        ):
+            del self.walk_step_tables[parameter_name]
+        if self.water_placement_pools == None or not parameter_name in [
+            constants.ALTITUDE,
+            constants.TEMPERATURE,
+            constants.WATER,
+        ]:
+            super().set_location_parameter(x, y, parameter_name, new_value)
+            return
+        old_entry = self.get_water_placement_entry(x, y)
+        super().set_location_parameter(x, y, parameter_name, new_value)
+        new_entry = self.get_water_placement_entry(x, y)
+        if old_entry != new_entry:
+            self.move_water_placement_candidate(
+                (x * self.coordinate_height) + y, old_entry, new_entry
+            )
+
     def place_water(
         self,
         update_display: bool = True,
         during_setup: bool = False,
+        num_units: int = 1,
     ) -> None:
         """
         Description:
-            Places 1 unit of water on the map, depending on altitude and temperature
+            Places units of water on the map, depending on altitude and temperature
+                Each unit goes to the best of a random sample of candidates - the lowest liquid, coldest frozen, or any gas location
+                Candidates are drawn from pools kept by this world, rather than by sampling and comparing individual locations
         Input:
-            int frozen_bound: Temperature below which water will "freeze"
+            boolean update_display: Whether to update the display of locations that receive water
+            boolean during_setup: Whether liquid water should flow after being placed
+            int num_units: Number of units of water to place
         Output:
             None
         """
-        best_frozen = None
-        best_liquid = None
-        best_gas = None
-        for candidate in self.sample(
-            k=round(
-                self.get_tuning("water_placement_candidates")
-                * (self.world_dimensions**2)
-                / (20**2)
+        if num_units <= 0:
+            return
+        generator = terrain_array_utility.get_generator()
+        if self.water_placement_pools == None:
+            self.water_placement_pools = self.build_water_placement_pools(generator)
+        population = self.world_dimensions**2
+        num_water_samples = max(
+            round(self.get_tuning("water_placement_candidates") * population / (20**2)),
+            1,
+        )
+        num_ice_samples = max(
+            round(self.get_tuning("ice_placement_candidates") * population / (20**2)),
+            1,
+        )
+        temperature = self.get_parameter_array(constants.TEMPERATURE).ravel()
+        altitude = self.get_parameter_array(constants.ALTITUDE).ravel()
+        units_placed = 0
+        while units_placed < num_units:
+            # Saturated locations are removed from the pools as they are filled
+            candidates = self.water_placement_pools
+            if not any(len(pool) for pool in candidates.values()):
+                return  # Every location that could receive water is saturated
+            # Of the locations that would be sampled, count how many are candidates for each pool
+            liquid_share = len(candidates["liquid"]) / population
+            gas_share = len(candidates["gas"]) / population
+            num_liquid_samples, num_gas_samples, _ = generator.multinomial(
+                num_water_samples,
+                [liquid_share, gas_share, max(1 - liquid_share - gas_share, 0)],
             )
-        ):
-            if candidate.get_parameter(constants.WATER) < 5 and candidate.get_parameter(
+            num_frozen_samples = generator.binomial(
+                num_ice_samples, len(candidates["frozen"]) / population
+            )
+            best_frozen = terrain_array_utility.sample_best_candidate(
+                candidates["frozen"], num_frozen_samples, generator
+            )
+            best_liquid = terrain_array_utility.sample_best_candidate(
+                candidates["liquid"], num_liquid_samples, generator
+            )
+            best_gas = terrain_array_utility.sample_best_candidate(
+                candidates["gas"], num_gas_samples, generator, ordered=False
+            )
+            if best_frozen == None and best_liquid == None and best_gas == None:
+                continue  # Resample if no candidates were found
+            choice = random.choices(
+                [best_frozen, best_liquid, best_gas],
+                weights=[
+                    (
+                        abs(1 - int(temperature[best_frozen]))
+                        if best_frozen != None
+                        else 0
+                    ),  # Weight frozen placement for low temperature
+                    (
+                        abs(16 - int(altitude[best_liquid]))
+                        if best_liquid != None
+                        else 0
+                    ),  # Weight liquid placement for low altitude
+                    13.5 if best_gas != None else 0,
+                ],
+                k=1,
+            )[0]
+            chosen_location = self.find_location(*divmod(choice, self.world_dimensions))
+            chosen_location.change_parameter(
+                constants.WATER, 1, update_display=update_display
+            )
+            if during_setup and chosen_location.get_parameter(
                 constants.TEMPERATURE
             ) >= self.get_tuning("water_freezing_point"):
-                if candidate.get_parameter(constants.TEMPERATURE) >= self.get_tuning(
-                    "water_boiling_point"
-                ):
-                    best_gas = candidate
-                else:
-                    if best_liquid == None or candidate.get_parameter(
-                        constants.ALTITUDE
-                    ) < best_liquid.get_parameter(constants.ALTITUDE):
-                        best_liquid = candidate
-        for candidate in self.sample(
-            k=round(
-                self.get_tuning("ice_placement_candidates")
-                * (self.world_dimensions**2)
-                / (20**2)
-            )
-        ):
-            if candidate.get_parameter(constants.WATER) < 5:
-                if (
-                    candidate.get_parameter(constants.TEMPERATURE)
-                    <= self.get_tuning("water_freezing_point") - 1
-                ):  # Water can go to coldest freezing location
-                    if best_frozen == None or candidate.get_parameter(
-                        constants.TEMPERATURE
-                    ) < best_frozen.get_parameter(constants.TEMPERATURE):
-                        best_frozen = candidate
-        if best_frozen == None and best_liquid == None and best_gas == None:
-            self.place_water(update_display=update_display)
-            return
-        choice = random.choices(
-            [best_frozen, best_liquid, best_gas],
-            weights=[
-                (
-                    abs((1 - best_frozen.get_parameter(constants.TEMPERATURE)))
-                    if best_frozen
-                    else 0
-                ),  # Weight frozen placement for low temperature
-                (
-                    abs(16 - best_liquid.get_parameter(constants.ALTITUDE))
-                    if best_liquid
-                    else 0
-                ),  # Weight liquid placement for low altitude
-                13.5 if best_gas else 0,
-            ],
-            k=1,
-        )[0]
-        choice.change_parameter(constants.WATER, 1, update_display=update_display)
-        if during_setup and choice.get_parameter(
-            constants.TEMPERATURE
-        ) >= self.get_tuning("water_freezing_point"):
-            choice.flow()
+                self.settle_water([chosen_location])
+            units_placed += 1
 
     def remove_water(self, update_display: bool = True) -> None:
         """
@@ -756,14 +969,29 @@ class full_world_handler(world_handlers.world_handler):
         Output:
             None
         """
-        for current_location in self.get_flat_location_list():
-            current_location.set_parameter(
-                parameter,
-                max(
-                    min(current_location.get_parameter(parameter), maximum),
-                    minimum,
-                ),
-                update_display=update_display,
+        self.apply_parameter_array(
+            parameter,
+            np.clip(self.get_parameter_array(parameter), minimum, maximum),
+            update_display=update_display,
+        )
+
+    def apply_parameter_array(
+        self, parameter: str, new_array: np.ndarray, update_display: bool = True
+    ) -> None:
+        """
+        Description:
+            Sets each location's parameter to its value in the inputted array
+                Only changed locations are set, and each goes through set_parameter to maintain any side effects
+        Input:
+            string parameter: Parameter to set
+            ndarray new_array: Array of new values, with the same shape as the parameter's array
+            boolean update_display: Whether to update the display of each changed location
+        Output:
+            None
+        """
+        for x, y in zip(*np.nonzero(new_array != self.get_parameter_array(parameter))):
+            self.find_location(int(x), int(y)).set_parameter(
+                parameter, int(new_array[x, y]), update_display=update_display
             )
 
     def smooth(self, parameter: str, direction: str = None) -> bool:
@@ -776,33 +1004,31 @@ class full_world_handler(world_handlers.world_handler):
         Output:
             bool: Returns True if any locations were smoothed (indicates that smoothing should continue), otherwise False
         """
-        flat_location_list = list(self.get_flat_location_list())
-        random.shuffle(flat_location_list)
-        smoothed = False
-        for current_location in flat_location_list:
-            for adjacent_location in current_location.adjacent_list:
-                if (
-                    abs(
-                        adjacent_location.get_parameter(parameter)
-                        - current_location.get_parameter(parameter)
-                    )
-                    >= 2
-                ):
-                    if current_location.get_parameter(
-                        parameter
-                    ) > adjacent_location.get_parameter(parameter):
-                        if direction != "up":
-                            current_location.change_parameter(
-                                parameter, -1, update_display=False
-                            )
-                    else:
-                        if direction != "down":
-                            current_location.change_parameter(
-                                parameter, 1, update_display=False
-                            )
-                    smoothed = True
+        smoothed_array, smoothed = terrain_array_utility.smooth_step(
+            self.get_parameter_array(parameter), direction=direction
+        )
+        self.apply_parameter_array(parameter, smoothed_array, update_display=False)
         return smoothed
 
+    def smooth_until_stable(self, parameter: str, direction: str = None) -> None:
+        """
+        Description:
+            Smooths the inputted parameter across the grid until no location is more than 1 away from any neighbors
+                Smoothing passes are calculated on a copy of the parameter's array, and only the final changes are applied to locations
+        Input:
+            string parameter: Parameter to smooth
+            string direction: Up, down, or None - indicates direction of smoothing
+        Output:
+            None
+        """
+        self.apply_parameter_array(
+            parameter,
+            terrain_array_utility.smooth_until_stable(
+                self.get_parameter_array(parameter), direction=direction
+            ),
+            update_display=False,
+        )
+
     def find_average(self, parameter):
         """
         Description:
@@ -812,49 +1038,35 @@ class full_world_handler(world_handlers.world_handler):
         Output:
             float: Returns the average value of the parameter
         """
-        return sum(
-            [cell.get_parameter(parameter) for cell in self.get_flat_cell_list()]
-        ) / (self.world_dimensions**2)
+        return self.get_parameter_sum(parameter) / (self.world_dimensions**2)
 
     def warm(self) -> None:
         """
         Warms the grid, increasing temperature
             Selects the cell with the furthest temperature below its expected temperature
         """
-        self.place_temperature(change=1, bound=11, choice_function=min)
+        self.place_temperature(change=1, bound=11, heap_type="warm")
 
     def cool(self) -> None:
         """
         Cools the grid, decreasing temperature
             Selects the cell with the furthest temperature above its expected temperature
         """
-        self.place_temperature(change=-1, bound=-6, choice_function=max)
+        self.place_temperature(change=-1, bound=-6, heap_type="cool")
 
-    def place_temperature(
-        self, change: int, bound: int, choice_function: callable
-    ) -> None:
+    def place_temperature(self, change: int, bound: int, heap_type: str) -> None:
         """
         Description:
             Changes the temperature of the grid by the inputted amount, selecting the cell that most differs from its expected temperature
         Input:
             int change: Amount to change the temperature by
             int bound: Maximum temperature value in the direction being changed
-            callable choice_function: Function to determine which offset to choose - min or max
+            string heap_type: warm or cool - which temperature outlier heap to select from
         Output:
             None
         """
-        offsets = [
-            (
-                location,
-                location.expected_temperature_offset + location.local_weather_offset,
-            )
-            for location in self.get_flat_location_list()
-            if not location.get_parameter(constants.TEMPERATURE) == bound
-        ]
-        if offsets:
-            outlier = choice_function(offsets, key=lambda x: x[1])[
-                0
-            ]  # Choose baesd on min or max expected temperature offset
+        outlier = self.get_temperature_outlier(heap_type, bound)
+        if outlier:
             outlier.change_parameter(
                 constants.TEMPERATURE, change, update_display=False
             )
@@ -872,65 +1084,90 @@ class full_world_handler(world_handlers.world_handler):
     ):
         """
         Description:
-            Chooses a random terrain from the inputted list and fills a random length chain of adjacent grid cells with the chosen terrain. Can go to the same cell multiple times
+            Changes the inputted parameter along a random length chain of adjacent grid cells. Can go to the same cell multiple times
+                The walk's path is generated in advance, and the changes for every visited cell are applied at once
         Input:
             int min_len: Minimum number of cells whose parameter can be changed
             int max_len: Maximum number of cells whose parameter can be changed, inclusive
             str parameter: Parameter to change
             int change: Amount to change the parameter by
-            bool capped: True if the parameter change should be limited in how far it can go from starting cell's original value, otherwise False
+            int bound: Maximum distance the parameter can be changed from the starting cell's original value, or 0 if unbounded
             bool set: True if the parameter should be set to the change + original, False if it should be changed with each pass
             location start_location: Location to start the worm from, otherwise a random location is chosen
             str weight_parameter: Location parameter to weight direction selection by, if any
         Output:
             None
         """
-        if start_location:
-            start_x, start_y = start_location.x, start_location.y
-        else:
-            start_x = random.randrange(0, self.world_dimensions)
-            start_y = random.randrange(0, self.world_dimensions)
-
-        current_x = start_x
-        current_y = start_y
+        if not start_location:
+            start_location = self.find_location(
+                random.randrange(0, self.world_dimensions),
+                random.randrange(0, self.world_dimensions),
+            )
         worm_length = random.randrange(min_len, max_len + 1)
 
-        original_value = self.find_location(current_x, current_y).get_parameter(
-            parameter
+        if weight_parameter:
+            x_path, y_path = terrain_array_utility.weighted_walk_path(
+                start_location.x,
+                start_location.y,
+                worm_length,
+                self.get_walk_step_table(weight_parameter),
+            )
+        else:
+            x_path, y_path = terrain_array_utility.random_walk_path(
+                start_location.x,
+                start_location.y,
+                worm_length,
+                (self.world_dimensions, self.world_dimensions),
+            )
+        self.apply_parameter_array(
+            parameter,
+            np.clip(
+                terrain_array_utility.apply_walk(
+                    self.get_parameter_array(parameter),
+                    x_path,
+                    y_path,
+                    change,
+                    bound=bound,
+                    set=set,
+                ),
+                start_location.minima.get(parameter, 0),
+                start_location.maxima.get(parameter, 5),
+            ),
+            update_display=False,
         )
-        upper_bound = original_value + bound
-        lower_bound = original_value - bound
-
-        counter = 0
-        while counter != worm_length:
-            current_location = self.find_location(current_x, current_y)
-            if set:
-                resulting_value = original_value + change
-            else:
-                resulting_value = current_location.get_parameter(parameter) + change
 
-            if bound == 0 or (
-                resulting_value <= upper_bound and resulting_value >= lower_bound
-            ):
-                current_location.change_parameter(
-                    parameter, change, update_display=False
+    def get_walk_step_table(self, weight_parameter: str) -> List[List[List[float]]]:
+        """
+        Description:
+            Returns the step table for walks weighted by the inputted terrain parameter or numeric attribute, building it if needed
+        Input:
+            string weight_parameter: Terrain parameter or location attribute name, like pole_distance_multiplier
+        Output:
+            list: Returns cumulative step probabilities from each location, as returned by terrain_array_utility.get_walk_step_table
+        """
+        if not weight_parameter in self.walk_step_tables:
+            self.walk_step_tables[weight_parameter] = (
+                terrain_array_utility.get_walk_step_table(
+                    self.get_location_attribute_array(weight_parameter)
                 )
-            counter = counter + 1
-            if weight_parameter:
-                selected_location = self.parameter_weighted_sample(
-                    weight_parameter, restrict_to=current_location.adjacent_list, k=1
-                )[0]
-                current_x, current_y = selected_location.x, selected_location.y
-            else:
-                direction = random.randrange(1, 5)  # 1 north, 2 east, 3 south, 4 west
-                if direction == 3:
-                    current_y = (current_y + 1) % self.world_dimensions
-                elif direction == 2:
-                    current_x = (current_x + 1) % self.world_dimensions
-                elif direction == 1:
-                    current_y = (current_y - 1) % self.world_dimensions
-                elif direction == 4:
-                    current_x = (current_x - 1) % self.world_dimensions
+            )
+        return self.walk_step_tables[weight_parameter]
+
+    def get_location_attribute_array(self, attribute: str) -> np.ndarray:
+        """
+        Description:
+            Returns an array of each location's value of the inputted terrain parameter or numeric attribute, indexed by [x, y]
+        Input:
+            string attribute: Terrain parameter or location attribute name, like pole_distance_multiplier
+        Output:
+            ndarray: Returns an array of each location's value
+        """
+        if attribute in constants.terrain_parameters:
+            return self.get_parameter_array(attribute)
+        attribute_array = np.zeros((self.world_dimensions, self.world_dimensions))
+        for location in self.get_flat_location_list():
+            attribute_array[location.x, location.y] = getattr(location, attribute)
+        return attribute_array
 
     def generate_terrain_features(self):
         """
@@ -944,7 +1181,7 @@ class full_world_handler(world_handlers.world_handler):
                     location.terrain_features[terrain_feature_type] = {
                         "feature_type": terrain_feature_type
                     }
-                    location.update_image_bundle()
+                    location.publish_events(constants.UPDATE_TERRAIN_FEATURE_ROUTE)
 
     def x_distance(self, location1, location2):
         """
@@ -1102,6 +1339,9 @@ class full_world_handler(world_handlers.world_handler):
         equatorial_distance = (
             self.euclidean_distance(status.north_pole, status.south_pole) / 2
         )
+        self.walk_step_tables = (
+            {}
+        )  # Walk step tables weighted by pole distance multipliers are outdated once they are set below
         for (
             location
         ) in (
@@ -1283,6 +1523,7 @@ class full_world_handler(world_handlers.world_handler):
             for i in range(3)
         ]
         self.steam_color = [min(240, sky_color + 80) for sky_color in self.sky_color]
+        self.terrain_brightness_table = {}
         if update_water:
             inherent_water_color = (11, 24, 144)
             sky_weight = 0.4
@@ -1322,7 +1563,6 @@ class full_world_handler(world_handlers.world_handler):
         Output:
             float: Average water vapor for the planet
         """
-        total_water_vapor = 0
         water_vapor_max_contribution = (
             self.get_tuning("water_boiling_point")
             - self.get_tuning("water_freezing_point")
@@ -1341,20 +1581,19 @@ class full_world_handler(world_handlers.world_handler):
                 average_water_vapor = 0
             return average_water_vapor
         else:
-            for location in self.get_flat_location_list():
+            total_water_vapor = 0
+            for conditions, num_locations in self.water_vapor_histogram.items():
+                temperature, water = conditions
+                # Each location with the same temperature and water contributes the same amount of water vapor
                 water_vapor_contribution = (
-                    location.get_parameter(constants.TEMPERATURE)
-                    - self.get_tuning("water_freezing_point")
-                    + 2
+                    temperature - self.get_tuning("water_freezing_point") + 2
                 )
                 contribution_ratio = (
                     water_vapor_contribution / water_vapor_max_contribution
                 )
                 if contribution_ratio > 0:
                     total_water_vapor += (
-                        (0.4 + (0.6 * contribution_ratio))
-                        * location.get_parameter(constants.WATER)
-                        * 1.5
+                        (0.4 + (0.6 * contribution_ratio)) * water * 1.5 * num_locations
                     )
             return total_water_vapor / (self.world_dimensions**2)
 
@@ -1421,6 +1660,34 @@ class full_world_handler(world_handlers.world_handler):
         if not flags.loading:
             status.current_world.update_globe_projection(update_button=True)
 
+    def get_terrain_brightness(self, image_id_list: List[Any]) -> float:
+        """
+        Description:
+            Returns the average RGB value of the inputted albedo image ID list, only compositing the image the first time each list is seen
+        Input:
+            list image_id_list: Albedo image ID list of a location in this world
+        Output:
+            float: Returns the average RGB value of the inputted image ID list
+        """
+        brightness_key = tuple(image_id_list)
+        if not brightness_key in self.terrain_brightness_table:
+            status.albedo_free_image.set_image(image_id_list)
+            self.terrain_brightness_table[brightness_key] = (
+                sum(
+                    [
+                        sum(
+                            status.albedo_free_image.image.combined_surface.get_at(
+                                (x, y)
+                            )[0:3]
+                        )
+                        / 3
+                        for x, y in [(0, 0), (0, 1), (1, 0), (1, 1)]
+                    ]
+                )
+                / 4
+            )
+        return self.terrain_brightness_table[brightness_key]
+
     def update_albedo_effect_multiplier(self):
         """
         Re-calculates the albedo multiplier to heat received by this planet, based on clouds and location brightnesss
@@ -1575,6 +1842,22 @@ class full_world_handler(world_handlers.world_handler):
             return
         self.latitude_lines = []
         self.alternate_latitude_lines = []
+        # Globe projection layouts only depend on world geometry, so they are calculated once and reused for each projection
+        self.extended_latitude_lines: Dict[Tuple[bool, int], List[Tuple[int, int]]] = {}
+        self.latitude_line_projections: Dict[
+            Tuple[int, int], List[Tuple[Dict[str, Any], Dict[str, Any]]]
+        ] = {}
+        self.extended_latitude_line_arrays: Dict[
+            bool, Tuple[np.ndarray, np.ndarray]
+        ] = {}
+        self.globe_projection_remap: Tuple[
+            np.ndarray, np.ndarray, np.ndarray, np.ndarray
+        ] = None
+        self.orbital_view_colors: np.ndarray = np.zeros(
+            (self.world_dimensions, self.world_dimensions, 3), dtype=np.uint8
+        )
+        self.orbital_view_colors_version: int = None
+        self.orbital_view_color_cache: Dict[Tuple, Tuple[int, int, int]] = {}
         self.latitude_lines_types = [
             [None for _ in range(self.world_dimensions)]
             for _ in range(self.world_dimensions)
@@ -1719,25 +2002,87 @@ class full_world_handler(world_handlers.world_handler):
     ):
         """
         Description:
-            Updates the globe projection to the current state of the world grid
+            Updates the globe projection to the current state of the world grid - composed projections are cached, so returning to a previous
+                rotation with unchanged terrain reuses its projection rather than composing it again
         Input:
             int tuple center_coordinates: Coordinates to center the globe projection on - defaults to currently centered location
             bool update_button: True if the strategic mode button should also be updated
         Output:
             None
         """
-        status.globe_projection_image.set_image(
-            self.create_planet_image(center_coordinates)
+        if not center_coordinates:
+            center_coordinates = (  # Required here since globe appearance is actually determined based on the state of the interface
+                status.scrolling_strategic_map_grid.center_x,
+                status.scrolling_strategic_map_grid.center_y,
+            )
+        index, latitude_lines = self.get_latitude_line(center_coordinates)
+        frame_key = (
+            "globe_projection",
+            self.uuid,
+            latitude_lines is self.latitude_lines,
+            index,
+            constants.current_map_mode,
+            self.orbital_view_version,
+            self.get_globe_sky_effect(),
         )
-        status.globe_projection_surface = status.globe_projection_image.image
-        size = status.globe_projection_surface.get_size()
-        status.globe_projection_surface = pygame.transform.scale(  # Decrease detail of each image before applying pixel mutations to speed processing
-            status.globe_projection_surface,
-            (
-                math.floor(size[0] * constants.GLOBE_PROJECTION_DETAIL_LEVEL),
-                math.floor(size[1] * constants.GLOBE_PROJECTION_DETAIL_LEVEL),
-            ),
+        globe_projection_image = constants.ImageCacheManager.get(frame_key + ("image",))
+        globe_projection_surface = constants.ImageCacheManager.get(
+            frame_key + ("surface",)
+        )
+        if globe_projection_image == None or globe_projection_surface == None:
+            if (
+                constants.GLOBE_PROJECTION_DETAIL_LEVEL
+                <= constants.GLOBE_PROJECTION_REMAP_DETAIL_LEVEL
+            ):  # Trade fidelity for speed at low detail levels
+                globe_projection_image, globe_projection_surface = (
+                    world_utility.create_remapped_globe_projection(
+                        self.get_globe_projection_inputs(latitude_lines), index
+                    )
+                )
+            else:
+                status.globe_projection_image.set_image(
+                    images.image_bundle(
+                        status.globe_projection_image,
+                        self.create_planet_image(center_coordinates),
+                    )
+                )
+                globe_projection_image = status.globe_projection_image.image
+                size = globe_projection_image.get_size()
+                globe_projection_surface = pygame.transform.scale(  # Decrease detail of each image before applying pixel mutations to speed processing
+                    globe_projection_image,
+                    (
+                        math.floor(size[0] * constants.GLOBE_PROJECTION_DETAIL_LEVEL),
+                        math.floor(size[1] * constants.GLOBE_PROJECTION_DETAIL_LEVEL),
+                    ),
+                )
+            constants.ImageCacheManager.set(
+                frame_key + ("image",), globe_projection_image
+            )
+            constants.ImageCacheManager.set(
+                frame_key + ("surface",), globe_projection_surface
+            )
+        self.set_globe_projection(
+            globe_projection_image, globe_projection_surface, update_button
         )
+
+    def set_globe_projection(
+        self,
+        globe_projection_image: pygame.Surface,
+        globe_projection_surface: pygame.Surface,
+        update_button: bool = True,
+    ) -> None:
+        """
+        Description:
+            Shows the inputted globe projection frame on the globe projection image, orbital world, and optionally the strategic mode button
+        Input:
+            pygame.Surface globe_projection_image: Pixellated globe projection, at the size of the globe projection image
+            pygame.Surface globe_projection_surface: Globe projection scaled by the globe projection detail level
+            bool update_button: True if the strategic mode button should also be updated
+        Output:
+            None
+        """
+        status.globe_projection_image.set_image(globe_projection_image)
+        status.globe_projection_surface = globe_projection_surface
         status.current_world.orbital_world.set_image(
             world_utility.generate_abstract_world_image(
                 planet=constants.GLOBE_PROJECTION_WORLD
@@ -1769,14 +2114,9 @@ class full_world_handler(world_handlers.world_handler):
                 status.scrolling_strategic_map_grid.center_y,
             )
         index, latitude_lines = self.get_latitude_line(center_coordinates)
+        sky_effect = self.get_globe_sky_effect()
 
         offset_width = self.world_dimensions // 2
-        largest_size = len(
-            max(
-                self.latitude_lines + self.alternate_latitude_lines,
-                key=len,
-            )
-        )
         return_list = []
         for offset in range(offset_width):
             min_width = (
@@ -1785,61 +2125,362 @@ class full_world_handler(world_handlers.world_handler):
             if (
                 offset == 0
             ):  # For center offset, just draw a straight vertical latitude line
-                current_line = latitude_lines[index]
-                return_list += self.draw_latitude_line(
-                    current_line,
-                    largest_size,
-                    level=offset + 20,
-                    offset=offset,
-                    offset_width=offset_width,
-                )
+                directions = [0]
             else:  # For non-center offsets, draw symmetrical curved latitude lines, progressively farther from center
-                longitude_bulge_factor = (offset / offset_width) ** 0.5
-
-                return_list += self.draw_latitude_line(
-                    latitude_lines[(index + offset) % self.world_dimensions],
-                    largest_size,
-                    longitude_bulge_factor=longitude_bulge_factor,
-                    level=offset + 20,
-                    min_width=min_width,
-                    offset=offset,
-                    offset_width=offset_width,
-                )
-                return_list += self.draw_latitude_line(
-                    latitude_lines[(index - offset) % self.world_dimensions],
-                    largest_size,
-                    longitude_bulge_factor=-1 * longitude_bulge_factor,
-                    level=(-1 * offset) + 20,
-                    min_width=min_width,
-                    offset=offset,
-                    offset_width=offset_width,
+                directions = [1, -1]
+            show_sky_effect = (
+                sky_effect
+                and offset_width - offset <= sky_effect[0]
+                and not (min_width and offset != 0)
+            )  # If 2nd or 3rd farthest latitude line
+            for direction in directions:
+                latitude_line = self.get_extended_latitude_line(
+                    latitude_lines, (index + direction * offset) % self.world_dimensions
                 )
+                for coordinates, (projection, sky_projection) in zip(
+                    latitude_line, self.get_latitude_line_projections(offset, direction)
+                ):
+                    for base_image_id in self.find_location(*coordinates).image_dict[
+                        constants.IMAGE_ID_LIST_ORBITAL_VIEW
+                    ]:
+                        # Apply projection offsets to each image in the location's terrain
+                        if type(base_image_id) == str:
+                            return_list.append(
+                                {"image_id": base_image_id, **projection}
+                            )
+                        else:
+                            return_list.append({**base_image_id, **projection})
+                    if show_sky_effect:
+                        return_list.append(
+                            {
+                                "image_id": "misc/green_screen_base.png",
+                                "detail_level": 1.0,
+                                "green_screen": sky_effect[1],
+                                **sky_projection,
+                                "alpha": sky_effect[2],
+                            }
+                        )
         return return_list
 
-    def draw_latitude_line(
+    def get_globe_projection_inputs(
+        self, latitude_lines: List[List[Tuple[int, int]]]
+    ) -> Dict[str, Any]:
+        """
+        Description:
+            Returns pure data inputs for remapping the globe projection with each location's orbital view color, copied from this world's current
+                state so that frames can be rendered without accessing this world
+        Input:
+            tuple list list latitude_lines: This world's latitude lines or alternate latitude lines, whichever the projection is centered on
+        Output:
+            dictionary: Returns dictionary of globe projection inputs, as used by world_utility.remap_globe_projection
+        """
+        line_x, line_y = self.get_extended_latitude_line_arrays(latitude_lines)
+        line_offsets, line_points, covered, sky_distances = (
+            self.get_globe_projection_remap()
+        )
+        return {
+            "world_dimensions": self.world_dimensions,
+            "line_colors": self.get_orbital_view_colors()[
+                line_x, line_y
+            ],  # Copy of the color of each point of each latitude line
+            "line_offsets": line_offsets,
+            "line_points": line_points,
+            "covered": covered,
+            "sky_distances": sky_distances,
+            "sky_effect": self.get_globe_sky_effect(),
+            "image_size": (
+                status.globe_projection_image.width,
+                status.globe_projection_image.height,
+            ),
+            "detail_level": constants.GLOBE_PROJECTION_DETAIL_LEVEL,
+        }
+
+    def get_orbital_view_colors(self) -> np.ndarray:
+        """
+        Description:
+            Returns a texture of each location's average orbital view color, only recalculating the colors of locations whose orbital view changed
+        Input:
+            None
+        Output:
+            np.ndarray: Returns (world_dimensions, world_dimensions, 3) array of each location's RGB color
+        """
+        if self.orbital_view_colors_version != self.orbital_view_version:
+            for current_location in self.get_flat_location_list():
+                image_id_list = current_location.image_dict[
+                    constants.IMAGE_ID_LIST_ORBITAL_VIEW
+                ]
+                color_key = tuple(image_id_list)
+                if not color_key in self.orbital_view_color_cache:
+                    status.orbital_view_color_free_image.set_image(image_id_list)
+                    self.orbital_view_color_cache[color_key] = (
+                        pygame.transform.average_color(
+                            status.orbital_view_color_free_image.image.combined_surface
+                        )[0:3]
+                    )
+                self.orbital_view_colors[current_location.x][current_location.y] = (
+                    self.orbital_view_color_cache[color_key]
+                )
+            self.orbital_view_colors_version = self.orbital_view_version
+        return self.orbital_view_colors
+
+    def get_extended_latitude_line_arrays(
+        self, latitude_lines: List[List[Tuple[int, int]]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Description:
+            Returns the coordinates sampled by each point of each of the inputted latitude lines, extended to the same length
+        Input:
+            tuple list list latitude_lines: This world's latitude lines or alternate latitude lines
+        Output:
+            np.ndarray: Returns (world_dimensions, max latitude line length) array of the x coordinate sampled by each point
+            np.ndarray: Returns (world_dimensions, max latitude line length) array of the y coordinate sampled by each point
+        """
+        key = latitude_lines is self.latitude_lines
+        if not key in self.extended_latitude_line_arrays:
+            coordinates = np.array(
+                [
+                    self.get_extended_latitude_line(latitude_lines, index)
+                    for index in range(len(latitude_lines))
+                ]
+            )
+            self.extended_latitude_line_arrays[key] = (
+                coordinates[:, :, 0],
+                coordinates[:, :, 1],
+            )
+        return self.extended_latitude_line_arrays[key]
+
+    def get_globe_projection_remap(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Description:
+            Returns the lookup table that maps each pixel of the pixellated globe projection to the latitude line point shown there, rasterizing each
+                point's projection in the same order as the composed projection the first time it is needed
+        Input:
+            None
+        Output:
+            np.ndarray: Returns array of the offset of the latitude line shown by each pixel, relative to the center latitude line
+            np.ndarray: Returns array of the index of the latitude line point shown by each pixel
+            np.ndarray: Returns boolean array of whether each pixel shows any point
+            np.ndarray: Returns array of the distance from the edge of the closest latitude line with sky effects shown by each pixel
+        """
+        if self.globe_projection_remap == None:
+            width = status.globe_projection_image.width
+            height = status.globe_projection_image.height
+            no_sky = self.world_dimensions + 1
+            line_offsets = np.zeros((width, height), dtype=np.int64)
+            line_points = np.zeros((width, height), dtype=np.int64)
+            covered = np.zeros((width, height), dtype=bool)
+            sky_distances = np.full((width, height), no_sky, dtype=np.int64)
+
+            offset_width = self.world_dimensions // 2
+            projections = []
+            for offset in range(offset_width):
+                min_width = offset >= offset_width - 1
+                for direction in [0] if offset == 0 else [1, -1]:
+                    if min_width and offset != 0:
+                        sky_distance = None
+                    else:
+                        sky_distance = offset_width - offset
+                    for idx, (projection, sky_projection) in enumerate(
+                        self.get_latitude_line_projections(offset, direction)
+                    ):
+                        projections.append((projection, direction * offset, idx, None))
+                        if sky_distance != None:
+                            projections.append(
+                                (sky_projection, direction * offset, idx, sky_distance)
+                            )
+            projections.sort(
+                key=lambda projection: projection[0]["level"]
+            )  # Stable sort matches the order that image bundle members are drawn in
+
+            for projection, line_offset, idx, sky_distance in projections:
+                point_width = width * projection["x_size"]
+                point_height = height * projection["y_size"]
+                left = max(
+                    0,
+                    int(
+                        (width * projection["x_offset"])
+                        - (point_width / 2)
+                        + (width / 2)
+                    ),
+                )
+                top = max(
+                    0,
+                    int(
+                        (height * projection["y_offset"] * -1)
+                        - (point_height / 2)
+                        + (height / 2)
+                    ),
+                )
+                right = left + int(point_width)
+                bottom = top + int(point_height)
+                if sky_distance == None:
+                    line_offsets[left:right, top:bottom] = line_offset
+                    line_points[left:right, top:bottom] = idx
+                    covered[left:right, top:bottom] = True
+                    sky_distances[left:right, top:bottom] = no_sky
+                else:
+                    sky_distances[left:right, top:bottom] = np.minimum(
+                        sky_distances[left:right, top:bottom], sky_distance
+                    )
+
+            # Sample the lookup table in the same way that the composed projection is pixellated
+            sampled_x = (
+                np.arange(constants.LIGHT_PIXELLATED_SIZE) * width
+            ) // constants.LIGHT_PIXELLATED_SIZE
+            sampled_y = (
+                np.arange(constants.LIGHT_PIXELLATED_SIZE) * height
+            ) // constants.LIGHT_PIXELLATED_SIZE
+            sampled_pixels = np.ix_(sampled_x, sampled_y)
+            self.globe_projection_remap = (
+                line_offsets[sampled_pixels],
+                line_points[sampled_pixels],
+                covered[sampled_pixels],
+                sky_distances[sampled_pixels],
+            )
+        return self.globe_projection_remap
+
+    def get_globe_sky_effect(self) -> Tuple[int, Tuple[int, int, int], int]:
+        """
+        Description:
+            Returns the appearance of the sky effects on the edges of the globe projection, which depends on this world's atmosphere and the current map
+                mode
+        Input:
+            None
+        Output:
+            tuple: Returns None if there are no sky effects, otherwise returns a tuple of the number of latitude lines from each edge that have sky
+                effects, the sky effect color, and the sky effect alpha
+        """
+        if not (
+            self.get_parameter(constants.PRESSURE) > 0
+            and constants.current_map_mode == "terrain"
+        ):
+            return None
+        pressure_ratio = self.get_pressure_ratio()
+        if (
+            pressure_ratio > 10.0
+        ):  # If high pressure, also have sky effects for 3rd farthest latitude line
+            threshold = 3
+        else:  # If normal or low pressure, only have sky effects for 2nd farthest latitude line
+            threshold = 2
+        if pressure_ratio <= 1.0:  # More transparent for lower pressure
+            alpha = 50 + int(25 * min(pressure_ratio, 1))
+        else:  # Less transparent for higher pressure
+            alpha = 75 + int(25 * min((pressure_ratio - 1) / 99, 1))
+        return (threshold, tuple(self.sky_color), alpha)
+
+    def get_extended_latitude_line(
+        self, latitude_lines: List[List[Tuple[int, int]]], index: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Description:
+            Returns the coordinates sampled by each point of a latitude line of a global map projection - to minimize size warping, latitude lines are
+                extended to all be the same size, duplicating coordinates or inserting nearby coordinates that are not in latitude lines
+            Extended latitude lines only depend on world geometry, so each is only calculated once
+        Input:
+            tuple list list latitude_lines: This world's latitude lines or alternate latitude lines
+            int index: Index of the latitude line to extend
+        Output:
+            tuple list: Returns list of coordinates for each point in the extended latitude line
+        """
+        key = (latitude_lines is self.latitude_lines, index)
+        if not key in self.extended_latitude_lines:
+            max_latitude_line_length = self.get_max_latitude_line_length()
+            # Force latitude lines to be of the same length as the largest line
+            latitude_line = latitude_lines[index].copy()  # Don't modify original
+            while len(latitude_line) > max_latitude_line_length:
+                latitude_line.pop(len(latitude_line) // 4)
+                if len(latitude_line) > max_latitude_line_length:
+                    latitude_line.pop(3 * len(latitude_line) // 4)
+            while len(latitude_line) < max_latitude_line_length:
+                latitude_line.insert(
+                    *self.get_next_unaccounted_coordinates(
+                        latitude_line, latitude_line[len(latitude_line) // 4]
+                    )
+                )
+                if len(latitude_line) < max_latitude_line_length:
+                    latitude_line.insert(
+                        *self.get_next_unaccounted_coordinates(
+                            latitude_line, latitude_line[3 * len(latitude_line) // 4]
+                        )
+                    )
+            self.extended_latitude_lines[key] = latitude_line
+        return self.extended_latitude_lines[key]
+
+    def get_max_latitude_line_length(self) -> int:
+        """
+        Returns the length of this world's longest latitude line
+        """
+        return len(
+            max(
+                self.latitude_lines + self.alternate_latitude_lines,
+                key=len,
+            )
+        )
+
+    def get_latitude_line_projections(
+        self, offset: int, direction: int
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Description:
+            Returns the projection offsets and sizes for each point of a latitude line of a global map projection, creating a curve between poles that
+                bulges at the equator
+            Projections only depend on world size and the latitude line's position in the projection, so each is only calculated once
+        Input:
+            int offset: Number of latitude lines between this latitude line and the center of the projection
+            int direction: 1 if right of center, -1 if left of center, or 0 if the center latitude line
+        Output:
+            tuple list: Returns list of tuples of the location image projection and sky effect projection for each point in the latitude line
+        """
+        key = (offset, direction)
+        if not key in self.latitude_line_projections:
+            offset_width = self.world_dimensions // 2
+            if direction == 0:
+                self.latitude_line_projections[key] = (
+                    self.calculate_latitude_line_projections(
+                        self.get_max_latitude_line_length(),
+                        level=offset + 20,
+                        offset=offset,
+                        offset_width=offset_width,
+                    )
+                )
+            else:
+                self.latitude_line_projections[key] = (
+                    self.calculate_latitude_line_projections(
+                        self.get_max_latitude_line_length(),
+                        longitude_bulge_factor=direction
+                        * (offset / offset_width) ** 0.5,
+                        level=(direction * offset) + 20,
+                        min_width=offset >= offset_width - 1,
+                        offset=offset,
+                        offset_width=offset_width,
+                    )
+                )
+        return self.latitude_line_projections[key]
+
+    def calculate_latitude_line_projections(
         self,
-        latitude_line,
         max_latitude_line_length: int,
         longitude_bulge_factor: float = 0.0,
         level: int = 0,
         min_width: bool = False,
         offset: int = 0,
         offset_width: int = 0,
-    ):
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
         """
         Description:
-            Returns an image ID list for a latitude line of a global map projection, creating a curve between poles that bulges at the equator
+            Calculates and returns the projection offsets and sizes for each point of a latitude line of a global map projection, creating a curve
+                between poles that bulges at the equator
         Input:
-            tuple list latitude_line: List of coordinates for each point in the latitude line
-            int max_latitude_line_length: Length of the longest latitude line - to minimize size warping, latitude lines are extended to all be the same size,
-                duplicating coordinates or inserting nearby coordinates that are not in latitude lines
+            int max_latitude_line_length: Length of the longest latitude line, which each latitude line is extended to
             float longitude_bulge_factor: Factor to determine how much the latitude line bulges outwards at the equator
                 Lines at longitudes farther from the center of the projection bulge further outwards and are thinner
             int level: Image ID level of the latitude line - further right latitude lines have higher levels
             boolean min_width: Whether the latitude line should use the minimum width instead of the calculated one
                 Latitude lines on the edge of the projection look more evenly sized if using the minimum width
         Output:
-            list: List of image IDs for the points of the latitude line
+            tuple list: Returns list of tuples of the location image projection and sky effect projection for each point in the latitude line
         """
         return_list = []
         center_position = (0.0, 0.0)
@@ -1850,25 +2491,6 @@ class full_world_handler(world_handlers.world_handler):
         base_location_width = 0.10
         base_location_height = 0.12
 
-        # Force latitude lines to be of the same length as the largest line
-        latitude_line = latitude_line.copy()  # Don't modify original
-        while len(latitude_line) > max_latitude_line_length:
-            latitude_line.pop(len(latitude_line) // 4)
-            if len(latitude_line) > max_latitude_line_length:
-                latitude_line.pop(3 * len(latitude_line) // 4)
-        while len(latitude_line) < max_latitude_line_length:
-            latitude_line.insert(
-                *self.get_next_unaccounted_coordinates(
-                    latitude_line, latitude_line[len(latitude_line) // 4]
-                )
-            )
-            if len(latitude_line) < max_latitude_line_length:
-                latitude_line.insert(
-                    *self.get_next_unaccounted_coordinates(
-                        latitude_line, latitude_line[3 * len(latitude_line) // 4]
-                    )
-                )
-
         y_step_size = (
             1.4 * total_height / max_latitude_line_length
         )  # Y step size between each coordinate of the latitude line
@@ -1876,11 +2498,11 @@ class full_world_handler(world_handlers.world_handler):
             constants.earth_dimensions**0.5
         )
 
-        for idx, coordinates in enumerate(
-            latitude_line
+        for idx in range(
+            max_latitude_line_length
         ):  # Calculate position and size of each coordinate in the latitude line
             pole_distance_factor = 1.0 - abs(
-                (idx - len(latitude_line) // 2) / (len(latitude_line) // 2)
+                (idx - max_latitude_line_length // 2) / (max_latitude_line_length // 2)
             )
             """
             The ellipse equation (x - h)^2 / a + (y - k)^2 / b = r^2 give an ellipse
@@ -1896,7 +2518,7 @@ class full_world_handler(world_handlers.world_handler):
             h = 0.5
             k = 0
             a = 1
-            x = idx / (len(latitude_line) - 1)
+            x = idx / (max_latitude_line_length - 1)
             b = abs(longitude_bulge_factor**3) * 5
             ellipse_weight = 0.32  # Extent to which x position is determined by ellipse function based on longitude bulge factor
             linear_weight = 0.15  # Extent to which x position is determined by linear function based on distance from center index
@@ -1923,12 +2545,12 @@ class full_world_handler(world_handlers.world_handler):
             x_offset = latitude_bulge_factor / 4.0
             y_offset = 0
             for i in range(
-                abs(idx - len(latitude_line) // 2)
+                abs(idx - max_latitude_line_length // 2)
             ):  # Move up or down for each index away from center
                 change = y_step_size * (
                     0.85**i
                 )  # Since each latitude is shorter than the last, the step size should also decrease
-                if idx < len(latitude_line) // 2:
+                if idx < max_latitude_line_length // 2:
                     y_offset += change
                 else:
                     y_offset -= change
@@ -1962,67 +2584,24 @@ class full_world_handler(world_handlers.world_handler):
                 "y_size": location_height * size_multiplier,
                 "level": level,
             }
-            for base_image_id in self.find_location(*coordinates).image_dict[
-                constants.IMAGE_ID_LIST_ORBITAL_VIEW
-            ]:
-                # Apply projection offsets to each image in the location's terrain
-                if type(base_image_id) == str:
-                    base_image_id = {"image_id": base_image_id}
-                image_id = base_image_id.copy()
-                image_id.update(projection)
-                return_list.append(image_id)
-
-            if (
-                self.get_pressure_ratio() > 10.0
-            ):  # If high pressure, also have sky effects for 3rd farthest latitude line
-                threshold = 3
-            else:  # If normal or low pressure, only have sky effects for 2nd farthest latitude line
-                threshold = 2
-            if (
-                (offset_width - offset <= threshold and not min_width)
-                and self.get_parameter(constants.PRESSURE) > 0
-                and constants.current_map_mode == "terrain"
-            ):  # If 2nd farthest latitude line
-                sky_effect = {
-                    "image_id": "misc/green_screen_base.png",
-                    "detail_level": 1.0,
-                    "green_screen": tuple(self.sky_color),
-                }
-                sky_effect.update(projection)
-                sky_effect["level"] += 10
-                if threshold <= 3 or abs(longitude_bulge_factor) > 0.5:
-                    sky_effect["x_size"] *= 0.4
-
-                sky_effect["alpha"] = 75
-                pressure_ratio = self.get_pressure_ratio()
-                if pressure_ratio <= 1.0:  # More transparent for lower pressure
-                    sky_effect["alpha"] = 50 + int(25 * min(pressure_ratio, 1))
-                else:  # Less transparent for higher pressure
-                    sky_effect["alpha"] = 75 + int(
-                        25 * min((pressure_ratio - 1) / 99, 1)
-                    )
-                if offset != 0:
-                    x_offset_magnitude = 0.02
-                    if (
-                        max_latitude_line_length
-                        <= constants.world_dimensions_options[1]
-                    ):
-                        x_offset_magnitude *= 1.6
-                    elif (
-                        max_latitude_line_length
-                        >= constants.world_dimensions_options[5]
-                    ):
-                        x_offset_magnitude *= 1.6
-                    else:
-                        x_offset_magnitude *= 1.6
-                    x_offset += x_offset_magnitude * (
-                        1 if longitude_bulge_factor >= 0 else -1
-                    )  # Shift right if on right side and vice versa
-                    sky_effect["x_offset"] = (
-                        center_position[0] + x_offset
-                    ) * size_multiplier
-
-                return_list.append(sky_effect)
+            sky_projection = projection.copy()
+            sky_projection["level"] += 10
+            sky_projection["x_size"] *= 0.4
+            if offset != 0:
+                x_offset_magnitude = 0.02
+                if max_latitude_line_length <= constants.world_dimensions_options[1]:
+                    x_offset_magnitude *= 1.6
+                elif max_latitude_line_length >= constants.world_dimensions_options[5]:
+                    x_offset_magnitude *= 1.6
+                else:
+                    x_offset_magnitude *= 1.6
+                x_offset += x_offset_magnitude * (
+                    1 if longitude_bulge_factor >= 0 else -1
+                )  # Shift right if on right side and vice versa
+                sky_projection["x_offset"] = (
+                    center_position[0] + x_offset
+                ) * size_multiplier
+            return_list.append((projection, sky_projection))
         return return_list
 
     def get_next_unaccounted_coordinates(
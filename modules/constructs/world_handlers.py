@@ -1,6 +1,9 @@
 import itertools
+import heapq
+import numpy as np
 from math import log
-from typing import List, Dict, Any
+from contextlib import contextmanager
+from typing import List, Dict, Tuple, Any, Iterator
 from modules.util import utility, actor_utility
 from modules.constants import constants, status, flags
 
@@ -25,6 +28,8 @@ class world_handler:
         self.uuid: str = constants.UuidManager.assign_uuid()
         status.world_list.append(self)
         self.subscribed_grids: List[Any] = []
+        # Incremented whenever any location's orbital view image changes
+        self.orbital_view_version: int = 0
         if not self.is_orbital_world:
             self.name: str = input_dict.get("name")
             self.world_dimensions: int = input_dict.get("world_dimensions")
@@ -79,6 +84,29 @@ class world_handler:
                 )
             self.average_temperature: float = input_dict.get("average_temperature", 0.0)
 
+        self.terrain_parameter_arrays: Dict[str, np.ndarray] = {
+            parameter_name: np.zeros(
+                (self.coordinate_width, self.coordinate_height), dtype=np.int16
+            )
+            for parameter_name in constants.terrain_parameters
+        }  # Locations read and write their terrain parameters through these arrays, allowing world-wide passes to be vectorized
+        num_locations = self.coordinate_width * self.coordinate_height
+        self.terrain_parameter_sums: Dict[str, int] = {
+            parameter_name: 0 for parameter_name in constants.terrain_parameters
+        }
+        self.terrain_parameter_histograms: Dict[str, Dict[int, int]] = {
+            parameter_name: {0: num_locations}
+            for parameter_name in constants.terrain_parameters
+        }  # Number of locations with each value of each parameter
+        self.water_vapor_histogram: Dict[Tuple[int, int], int] = {
+            (0, 0): num_locations
+        }  # Number of locations with each (temperature, water) combination, used to total water vapor contributions
+        # Running aggregates are updated by the difference of each edit, allowing O(1) world averages
+        # Built when first needed for warming or cooling, and cleared when every location's expected temperature shifts
+        self.temperature_outlier_heaps: Dict[str, List[Tuple[float, int]]] = None
+        self.bulk_edit_depth: int = (
+            0  # Number of nested bulk_edit contexts currently open
+        )
         self.location_list: list = []
         if from_save:
             self.location_list = [
@@ -212,6 +240,120 @@ class world_handler:
         self.subscribed_grids.remove(grid)
         grid.world_handler = None
 
+    def get_temperature_outlier_key(self, location: Any) -> float:
+        """
+        Returns how far the inputted location's temperature is from what is expected, with lower values being colder than expected
+        """
+        return location.expected_temperature_offset + location.local_weather_offset
+
+    def build_temperature_outlier_heaps(self) -> None:
+        """
+        Description:
+            Builds heaps of this world's locations ordered by temperature outlier key, used to select which locations to warm or cool
+                The warm heap pops the coldest outlier and the cool heap pops the warmest, with ties going to the first location in the flat list
+        Input:
+            None
+        Output:
+            None
+        """
+        warm_heap = []
+        cool_heap = []
+        for index, location in enumerate(self.get_flat_location_list()):
+            key = self.get_temperature_outlier_key(location)
+            warm_heap.append((key, index))
+            cool_heap.append((-key, index))
+        heapq.heapify(warm_heap)
+        heapq.heapify(cool_heap)
+        self.temperature_outlier_heaps = {"warm": warm_heap, "cool": cool_heap}
+
+    def update_temperature_outlier(self, location: Any) -> None:
+        """
+        Description:
+            Records the inputted location's new temperature outlier key, if the outlier heaps have been built
+                Outdated entries are left in the heaps and skipped when reached
+        Input:
+            location location: Location whose expected temperature offset changed
+        Output:
+            None
+        """
+        if self.temperature_outlier_heaps:
+            key = self.get_temperature_outlier_key(location)
+            index = (location.x * self.coordinate_height) + location.y
+            heapq.heappush(self.temperature_outlier_heaps["warm"], (key, index))
+            heapq.heappush(self.temperature_outlier_heaps["cool"], (-key, index))
+
+    def get_temperature_outlier(self, heap_type: str, bound: int) -> Any:
+        """
+        Description:
+            Returns the location that most differs from its expected temperature in the inputted direction, ignoring locations already at the bound
+        Input:
+            string heap_type: warm to find the coldest outlier, or cool to find the warmest outlier
+            int bound: Temperature value to ignore locations at
+        Output:
+            location: Returns the selected location, or None if every location is at the bound
+        """
+        if not self.temperature_outlier_heaps:
+            self.build_temperature_outlier_heaps()
+        heap = self.temperature_outlier_heaps[heap_type]
+        sign = 1 if heap_type == "warm" else -1
+        while heap:
+            key, index = heap[0]
+            location = self.find_location(*divmod(index, self.coordinate_height))
+            if (
+                key == sign * self.get_temperature_outlier_key(location)
+                and location.get_parameter(constants.TEMPERATURE) != bound
+            ):
+                return location
+            heapq.heappop(
+                heap
+            )  # Discard outdated entries and those at the bound - a new entry is pushed when a location's temperature changes
+        return None
+
+    def reclassify_terrain(self, update_image_bundle: bool = True) -> None:
+        """
+        Description:
+            Classifies the terrain of every location in this world at once, updating locations whose terrain changed
+        Input:
+            boolean update_image_bundle: Whether to update the image bundles of locations whose terrain changed
+        Output:
+            None
+        """
+        terrain_indices = constants.TerrainManager.classify_arrays(
+            self.terrain_parameter_arrays
+        ).tolist()
+        for location in self.get_flat_location_list():
+            new_terrain = constants.TerrainManager.terrain_list[
+                terrain_indices[location.x][location.y]
+            ]
+            if location.terrain != new_terrain:
+                location.set_terrain(
+                    new_terrain, update_image_bundle=update_image_bundle
+                )
+
+    @contextmanager
+    def bulk_edit(self) -> Iterator[None]:
+        """
+        Description:
+            Context manager to wrap bulk edits of this world, like generation
+                Events published within are collected and each subscribed callback is invoked once on exit, so image bundles,
+                    temperature offsets, and habitability are refreshed once per location rather than once per edit
+                Callbacks that must react to each edit immediately, like temperature offsets used during climate simulation, are
+                    not updated until exit
+                Locations skip terrain classification within, and every location is reclassified at once on exit, before the collected events
+        Input:
+            None
+        Output:
+            None
+        """
+        with constants.EventBus.defer_publishing():
+            self.bulk_edit_depth += 1
+            try:
+                yield
+            finally:
+                self.bulk_edit_depth -= 1
+                if self.bulk_edit_depth == 0:
+                    self.reclassify_terrain(update_image_bundle=False)
+
     def get_flat_location_list(self) -> itertools.chain:
         """
         Description:
@@ -226,6 +368,95 @@ class world_handler:
     def find_location(self, x: int, y: int) -> Any:
         return self.location_list[x % self.coordinate_width][y % self.coordinate_height]
 
+    def set_location_parameter(
+        self, x: int, y: int, parameter_name: str, new_value: int
+    ) -> None:
+        """
+        Description:
+            Sets the inputted location's value of a terrain parameter, updating this world's running sums and histograms by the change
+                Parameter arrays should only be modified through this method, which keeps the aggregates up to date
+        Input:
+            int x: X coordinate of the location to set
+            int y: Y coordinate of the location to set
+            string parameter_name: Name of the terrain parameter to set
+            int new_value: New value for the parameter, already bounded by the location
+        Output:
+            None
+        """
+        parameter_array = self.terrain_parameter_arrays[parameter_name]
+        old_value = int(parameter_array[x, y])
+        if old_value == new_value:
+            return
+        parameter_array[x, y] = new_value
+        self.terrain_parameter_sums[parameter_name] += new_value - old_value
+        self.shift_histogram(
+            self.terrain_parameter_histograms[parameter_name], old_value, new_value
+        )
+        if parameter_name == constants.TEMPERATURE:
+            water = int(self.terrain_parameter_arrays[constants.WATER][x, y])
+            self.shift_histogram(
+                self.water_vapor_histogram, (old_value, water), (new_value, water)
+            )
+        elif parameter_name == constants.WATER:
+            temperature = int(
+                self.terrain_parameter_arrays[constants.TEMPERATURE][x, y]
+            )
+            self.shift_histogram(
+                self.water_vapor_histogram,
+                (temperature, old_value),
+                (temperature, new_value),
+            )
+
+    def shift_histogram(self, histogram: Dict[Any, int], old_key: Any, new_key: Any):
+        """
+        Description:
+            Moves 1 count in the inputted histogram from the old key to the new key, removing empty keys
+        Input:
+            dictionary histogram: Histogram to modify
+            any old_key: Key to remove a count from
+            any new_key: Key to add a count to
+        Output:
+            None
+        """
+        histogram[old_key] -= 1
+        if histogram[old_key] == 0:
+            del histogram[old_key]
+        histogram[new_key] = histogram.get(new_key, 0) + 1
+
+    def get_parameter_sum(self, parameter_name: str) -> int:
+        """
+        Description:
+            Returns the total of the inputted terrain parameter across all of this world's locations
+        Input:
+            string parameter_name: Name of the terrain parameter to total
+        Output:
+            int: Returns the total of the inputted terrain parameter
+        """
+        return self.terrain_parameter_sums[parameter_name]
+
+    def get_parameter_histogram(self, parameter_name: str) -> Dict[int, int]:
+        """
+        Description:
+            Returns the number of this world's locations with each value of the inputted terrain parameter
+        Input:
+            string parameter_name: Name of the terrain parameter to get the histogram of
+        Output:
+            dictionary: Returns a dictionary of parameter values and the number of locations with each value - treat as read-only
+        """
+        return self.terrain_parameter_histograms[parameter_name]
+
+    def get_parameter_array(self, parameter_name: str) -> np.ndarray:
+        """
+        Description:
+            Returns the array of the inputted terrain parameter for each of this world's locations, indexed the same as location_list
+                The array is shared with this world's locations - modify values through location.set_parameter to keep terrain and events updated
+        Input:
+            string parameter_name: Name of the terrain parameter to get
+        Output:
+            ndarray: Returns a (coordinate_width, coordinate_height) array of the inputted terrain parameter
+        """
+        return self.terrain_parameter_arrays[parameter_name]
+
     def change_parameter(self, parameter_name: str, change: int) -> None:
         """
         Description:
@@ -570,13 +801,7 @@ class world_handler:
         Re-calculates the average temperature of this world
         """
         return round(
-            sum(
-                [
-                    location.get_parameter(constants.TEMPERATURE)
-                    for location in self.get_flat_location_list()
-                ]
-            )
-            / (self.world_dimensions**2),
+            self.get_parameter_sum(constants.TEMPERATURE) / (self.world_dimensions**2),
             2,
         )
 
@@ -585,13 +810,7 @@ class world_handler:
         Re-calculates the average water of this world
         """
         self.average_water = round(
-            sum(
-                [
-                    location.get_parameter(constants.WATER)
-                    for location in self.get_flat_location_list()
-                ]
-            )
-            / (self.world_dimensions**2),
+            self.get_parameter_sum(constants.WATER) / (self.world_dimensions**2),
             3,
         )
 
@@ -600,13 +819,7 @@ class world_handler:
         Re-calculates the average altitude of this world
         """
         self.average_altitude = round(
-            sum(
-                [
-                    location.get_parameter(constants.ALTITUDE)
-                    for location in self.get_flat_location_list()
-                ]
-            )
-            / (self.world_dimensions**2),
+            self.get_parameter_sum(constants.ALTITUDE) / (self.world_dimensions**2),
             2,
         )
 
@@ -777,6 +990,7 @@ class world_handler:
             * self.get_sun_effect()
         ) + constants.ABSOLUTE_ZERO
         self.average_temperature = utility.reverse_fahrenheit(fahrenheit)
+        self.temperature_outlier_heaps = None  # Every location's offset will change
         constants.EventBus.publish(
             self.uuid, constants.WORLD_UPDATE_TARGET_AVERAGE_TEMPERATURE_ROUTE
         )
@@ -12,6 +12,7 @@ from modules.util import (
     market_utility,
     game_transitions,
     minister_utility,
+    drawing_utility,
 )
 from modules.constructs import item_types, minister_types, equipment_types
 from modules.interface_components import interface_elements
@@ -60,7 +61,10 @@ class button(interface_elements.interface_element):
         self.has_released = True
         self.button_type = input_dict.get("button_type", input_dict["init_type"])
         status.button_list.append(self)
-        self.keybind_id = input_dict.get("keybind_id", None)
+        constants.HitTestManager.register(
+            self, constants.BUTTON_HIT_LAYER, visible=self.showing
+        )
+        constants.KeybindManager.bind(self, input_dict.get("keybind_id", None))
         self.has_keybind = self.keybind_id != None
         if self.has_keybind:
             self.set_keybind(self.keybind_id)
@@ -690,32 +694,23 @@ class button(interface_elements.interface_element):
         """
         if self.showing:
             if self.showing_outline and allow_show_outline:
-                pygame.draw.rect(
-                    constants.game_display,
-                    constants.color_dict[constants.COLOR_WHITE],
-                    self.outline,
-                    width=2,
+                drawing_utility.draw_rect(
+                    constants.color_dict[constants.COLOR_WHITE], self.outline, width=2
                 )
             if self.showing_background and hasattr(self, "color"):
-                pygame.draw.rect(constants.game_display, self.color, self.Rect)
+                drawing_utility.draw_rect(self.color, self.Rect)
             self.image.draw()
             if (
                 self.has_keybind
             ):  # The key to which a button is bound will appear on the button's image
-                message = self.keybind_name
-                color = constants.COLOR_WHITE
-                textsurface = constants.myfont.pygame_font.render(
-                    message, False, constants.color_dict[color]
+                textsurface = text_utility.text(
+                    self.keybind_name, constants.fonts["white"]
                 )
-                constants.game_display.blit(
+                drawing_utility.display_image(
                     textsurface,
-                    (
-                        self.x + scaling.scale_width(10),
-                        (
-                            constants.display_height
-                            - (self.y + self.height - scaling.scale_height(5))
-                        ),
-                    ),
+                    self.x + scaling.scale_width(10),
+                    constants.display_height
+                    - (self.y + self.height - scaling.scale_height(5)),
                 )
 
     def on_rmb_click(self):
@@ -1257,6 +1252,30 @@ class button(interface_elements.interface_element):
                     "You are busy and cannot rename this planet."
                 )
 
+    @property
+    def showing_outline(self) -> bool:
+        """
+        Returns whether this button is currently showing its outline
+        """
+        return self.outline_active
+
+    @showing_outline.setter
+    def showing_outline(self, new_value: bool) -> None:
+        """
+        Description:
+            Sets whether this button is showing its outline, recording outlined buttons so that mouse outline handling only checks outlined
+                buttons and buttons under the mouse
+        Input:
+            boolean new_value: Whether this button should show its outline
+        Output:
+            None
+        """
+        self.outline_active = new_value
+        if new_value:
+            status.outlined_buttons.add(self)
+        else:
+            status.outlined_buttons.discard(self)
+
     def on_rmb_release(self):
         """
         Controls what this button does when right clicked and released. By default, buttons will stop showing their outlines when released.
@@ -1277,6 +1296,9 @@ class button(interface_elements.interface_element):
         """
         super().remove()
         status.button_list = utility.remove_from_list(status.button_list, self)
+        constants.HitTestManager.unregister(self)
+        constants.KeybindManager.unbind(self)
+        status.outlined_buttons.discard(self)
 
     def can_show(self, skip_parent_collection=False):
         """
@@ -1642,16 +1664,12 @@ class same_location_icon(button):
         if self.showing:
             if self.index == 0 and status.displayed_location:
                 if status.displayed_location.subscribed_mobs[0] == status.displayed_mob:
-                    pygame.draw.rect(
-                        constants.game_display,
-                        constants.color_dict[constants.COLOR_BRIGHT_GREEN],
-                        self.outline,
+                    drawing_utility.draw_rect(
+                        constants.color_dict[constants.COLOR_BRIGHT_GREEN], self.outline
                     )
                 else:
-                    pygame.draw.rect(
-                        constants.game_display,
-                        constants.color_dict[constants.COLOR_WHITE],
-                        self.outline,
+                    drawing_utility.draw_rect(
+                        constants.color_dict[constants.COLOR_WHITE], self.outline
                     )
             super().draw()
 
@@ -2242,10 +2260,10 @@ class reorganize_unit_button(button):
             in self.allowed_procedures
         )
         if result:
-            self.keybind_id = None
+            constants.KeybindManager.bind(self, None)
             self.on_release()
         else:
-            self.keybind_id = self.default_keybind_id
+            constants.KeybindManager.bind(self, self.default_keybind_id)
         return result
 
     @property
@@ -2680,12 +2698,10 @@ class anonymous_button(button):
         """
         super().draw()
         if self.showing and self.in_notification:
-            constants.game_display.blit(
+            drawing_utility.display_image(
                 text_utility.text(self.message, self.font),
-                (
-                    self.x + scaling.scale_width(10),
-                    constants.display_height - (self.y + self.height),
-                ),
+                self.x + scaling.scale_width(10),
+                constants.display_height - (self.y + self.height),
             )
 
     @property
@@ -1,6 +1,7 @@
 # Contains functionality for grid cells
 
 import pygame
+from modules.util import drawing_utility
 from modules.constructs import images
 from modules.constants import constants, status, flags
 
@@ -32,6 +33,7 @@ class cell:
         self.Rect: pygame.Rect = pygame.Rect(
             self.pixel_x, self.pixel_y - self.height, self.width, self.height
         )  # (left, top, width, height)
+        constants.HitTestManager.register(self, constants.CELL_HIT_LAYER)
         self.subscribed_location = None
         self.image: images.cell_image = images.cell_image(self)
         self.grid.world_handler.find_location(self.x, self.y).subscribe_cell(self)
@@ -54,6 +56,7 @@ class cell:
             None
         """
         self.image.set_image(*args, **kwargs)
+        self.grid.dirty_cells.add(self)
 
     @property
     def location(self):
@@ -68,24 +71,46 @@ class cell:
         """
         return self.grid.can_show() and self.touching_mouse()
 
-    def draw(self):
+    def render(self, map_surface: pygame.Surface, map_Rect: pygame.Rect) -> None:
         """
-        Draws this cell as a rectangle with a certain color on its grid, depending on this cell's color value, along with actors this cell contains
+        Description:
+            Renders this cell as a rectangle with a certain color, along with the actors this cell contains, onto its grid's cached map surface
+        Input:
+            pygame.Surface map_surface: Cached surface of each of the grid's cells
+            pygame.Rect map_Rect: Region of the display covered by the map surface
+        Output:
+            None
+        """
+        map_surface.set_clip(self.get_map_Rect().move(-map_Rect.x, -map_Rect.y))
+        map_surface.fill((self.color[0], self.color[1], self.color[2]))
+        map_surface.blit(
+            self.image.image.combined_surface,
+            (self.Rect.x - map_Rect.x, self.Rect.y - map_Rect.y),
+        )
+        map_surface.set_clip(None)
+
+    def get_map_Rect(self) -> pygame.Rect:
+        """
+        Description:
+            Returns the region of the display that this cell shows on its grid - cells are 1 pixel larger than their spacing, so each cell's top and
+                right edges are covered by the cells drawn after it, except on the top and right edges of the grid
+        Input:
+            None
+        Output:
+            pygame.Rect: Returns the region of the display that this cell shows
         """
-        pygame.draw.rect(
-            constants.game_display,
-            (self.color[0], self.color[1], self.color[2]),
-            self.Rect,
+        right, top = self.grid.convert_coordinates((self.x + 1, self.y + 1))
+        if self.x == self.grid.coordinate_width - 1:
+            right = self.Rect.right
+        if self.y == self.grid.coordinate_height - 1:
+            top = self.Rect.top
+        return pygame.Rect(
+            self.Rect.x, top, right - self.Rect.x, self.Rect.bottom - top
         )
-        self.image.draw()
-        self.image.show_num_mobs()
 
     def draw_outline(self, color: str) -> None:
-        pygame.draw.rect(
-            constants.game_display,
-            constants.color_dict[color],
-            self.Rect,
-            self.image.outline_width,
+        drawing_utility.draw_rect(
+            constants.color_dict[color], self.Rect, self.image.outline_width
         )
 
     def touching_mouse(self):
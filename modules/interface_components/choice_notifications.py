@@ -2,7 +2,7 @@
 
 from typing import List
 from modules.interface_components import buttons, action_notifications
-from modules.util import utility, text_utility, scaling
+from modules.util import utility, text_utility, scaling, drawing_utility
 from modules.constructs import unit_types
 from modules.constants import constants, status, flags
 
@@ -169,12 +169,10 @@ class choice_button(buttons.button):
         """
         super().draw()
         if self.showing:
-            constants.game_display.blit(
+            drawing_utility.display_image(
                 text_utility.text(self.message, self.font),
-                (
-                    self.x + scaling.scale_width(10),
-                    constants.display_height - (self.y + self.height),
-                ),
+                self.x + scaling.scale_width(10),
+                constants.display_height - (self.y + self.height),
             )
 
     @property
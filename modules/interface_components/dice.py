@@ -5,7 +5,7 @@ import time
 import random
 from typing import List
 from modules.interface_components.buttons import button
-from modules.util import utility
+from modules.util import utility, drawing_utility
 from modules.constants import constants, status, flags
 
 
@@ -230,18 +230,12 @@ class die(button):
                 self.roll()
             super().draw()
             if self.highlighted or not self.normal_die:
-                pygame.draw.rect(
-                    constants.game_display,
-                    constants.color_dict[self.outline_color],
-                    self.Rect,
-                    6,
+                drawing_utility.draw_rect(
+                    constants.color_dict[self.outline_color], self.Rect, 6
                 )
             else:
-                pygame.draw.rect(
-                    constants.game_display,
-                    constants.color_dict[constants.COLOR_BLACK],
-                    self.Rect,
-                    6,
+                drawing_utility.draw_rect(
+                    constants.color_dict[constants.COLOR_BLACK], self.Rect, 6
                 )
 
     def remove(self):
@@ -3,10 +3,10 @@
 import random
 import pygame
 import itertools
-from typing import Dict, Tuple
+from typing import Dict, Tuple, List, Set
 from modules.interface_components import cells, interface_elements
-from modules.util import utility, actor_utility
-from modules.constructs import world_handlers
+from modules.util import utility, actor_utility, drawing_utility
+from modules.constructs import world_handlers, images
 from modules.constants import constants, status, flags
 
 
@@ -52,6 +52,10 @@ class grid(interface_elements.interface_element):
         self.external_line_color = input_dict.get(
             "external_line_color", constants.COLOR_DARK_GRAY
         )
+        self.map_surface: pygame.Surface = None
+        self.map_Rect: pygame.Rect = None
+        self.rendered_images: List[List[images.image_bundle]] = None
+        self.dirty_cells: Set[cells.cell] = set()
         cell_width, cell_height = self.get_cell_width(), self.get_cell_height()
         self.cell_list = [
             [
@@ -94,8 +98,19 @@ class grid(interface_elements.interface_element):
         """
         Draws each cell of this grid
         """
+        with constants.FrameProfiler.time_phase("grid_draws"):
+            self.draw_cells()
+
+    def draw_cells(self):
+        """
+        Draws each cell of this grid, along with grid lines and selection outlines
+        """
+        self.update_map_surface()
+        drawing_utility.display_image(
+            self.map_surface, self.map_Rect.x, self.map_Rect.y
+        )
         for cell in self.get_flat_cell_list():
-            cell.draw()
+            cell.image.show_num_mobs()
         self.draw_grid_lines()
 
         if (
@@ -141,14 +156,42 @@ class grid(interface_elements.interface_element):
                         if destination_cell.grid.showing:
                             destination_cell.draw_outline(constants.COLOR_YELLOW)
 
+    def update_map_surface(self) -> None:
+        """
+        Description:
+            Patches this grid's cached map surface with each cell whose image changed since it was last rendered, creating the map surface if
+                needed - the map surface lets the entire grid be drawn with 1 blit per frame
+        Input:
+            None
+        Output:
+            None
+        """
+        if self.map_surface == None:
+            self.map_Rect = self.cell_list[0][0].Rect.union(self.cell_list[-1][-1].Rect)
+            self.map_surface = pygame.Surface(self.map_Rect.size)
+            self.rendered_images = [
+                [None] * self.coordinate_height for x in range(self.coordinate_width)
+            ]
+            self.dirty_cells = set(self.get_flat_cell_list())
+
+        for cell in self.dirty_cells:
+            rendered_image = self.rendered_images[cell.x][cell.y]
+            if (
+                rendered_image == None
+                or rendered_image.combined_surface != cell.image.image.combined_surface
+            ):  # Cells re-subscribed to an identical image share its combined surface, and don't need to be rendered again
+                cell.render(self.map_surface, self.map_Rect)
+                self.rendered_images[cell.x][cell.y] = cell.image.image
+                constants.RenderManager.mark_dirty(cell.get_map_Rect())
+        self.dirty_cells.clear()
+
     def draw_grid_lines(self):
         """
         Draws lines between grid cells and on the outside of the grid. Also draws an outline of the area on this grid covered by this grid's minimap grid, if applicable
         """
         if flags.show_grid_lines:
             for x in range(0, self.coordinate_width + 1):
-                pygame.draw.line(
-                    constants.game_display,
+                drawing_utility.draw_line(
                     constants.color_dict[self.internal_line_color],
                     self.convert_coordinates((x, 0)),
                     self.convert_coordinates((x, self.coordinate_height)),
@@ -156,8 +199,7 @@ class grid(interface_elements.interface_element):
                 )
 
             for y in range(0, self.coordinate_height + 1):
-                pygame.draw.line(
-                    constants.game_display,
+                drawing_utility.draw_line(
                     constants.color_dict[self.internal_line_color],
                     self.convert_coordinates((0, y)),
                     self.convert_coordinates((self.coordinate_width, y)),
@@ -176,8 +218,7 @@ class grid(interface_elements.interface_element):
                 (self.coordinate_width, self.coordinate_height),
             ),
         ]:
-            pygame.draw.line(
-                constants.game_display,
+            drawing_utility.draw_line(
                 constants.color_dict[self.external_line_color],
                 self.convert_coordinates(origin),
                 self.convert_coordinates(destination),
@@ -208,8 +249,7 @@ class grid(interface_elements.interface_element):
                 ((right_x, up_y), (right_x, down_y)),
                 ((right_x, down_y), (left_x, down_y)),
             ]:
-                pygame.draw.line(
-                    constants.game_display,
+                drawing_utility.draw_line(
                     constants.color_dict[status.minimap_grid.external_line_color],
                     self.convert_coordinates(origin),
                     self.convert_coordinates(destination),
@@ -382,6 +422,8 @@ class grid(interface_elements.interface_element):
         """
         super().remove()
         status.grid_list = utility.remove_from_list(status.grid_list, self)
+        for current_cell in self.get_flat_cell_list():
+            constants.HitTestManager.unregister(current_cell)
         self.world_handler.unsubscribe_grid(self)
 
 
@@ -432,16 +474,22 @@ class mini_grid(grid):
             self.center_x,
             self.center_y,
         ) != (center_x, center_y):
+            if self.map_surface:
+                self.scroll_map_surface(
+                    center_x - self.center_x, center_y - self.center_y
+                )
             self.center_x = center_x
             self.center_y = center_y
 
             for x in range(self.coordinate_width):
                 for y in range(self.coordinate_height):
-                    self.world_handler.find_location(
+                    location = self.world_handler.find_location(
                         *self.get_absolute_coordinates(x, y)
-                    ).subscribe_cell(
-                        self.find_cell(x, y)
-                    )  # Calibrate each cell to its the new location
+                    )
+                    if self.find_cell(x, y).location != location:
+                        location.subscribe_cell(
+                            self.find_cell(x, y)
+                        )  # Calibrate each cell to its the new location
             if self == status.minimap_grid:
                 for (
                     directional_indicator_image
@@ -450,6 +498,48 @@ class mini_grid(grid):
             if self == status.scrolling_strategic_map_grid:
                 status.current_world.update_globe_projection()
 
+    def scroll_map_surface(self, change_x: int, change_y: int) -> None:
+        """
+        Description:
+            Shifts this grid's cached map surface to match a change in its center, keeping the render of each cell that is still visible so that only
+                the newly exposed band of cells needs to be rendered again
+        Input:
+            int change_x: Change in this grid's center x coordinate
+            int change_y: Change in this grid's center y coordinate
+        Output:
+            None
+        """
+        world_dimensions = self.world_handler.world_dimensions
+        change_x, change_y = (
+            (change_x + world_dimensions // 2) % world_dimensions
+            - world_dimensions // 2,
+            (change_y + world_dimensions // 2) % world_dimensions
+            - world_dimensions // 2,
+        )  # Scroll the shortest way around the world, since it wraps around
+        origin_x, origin_y = self.convert_coordinates((0, 0))
+        scrolled_x, scrolled_y = self.convert_coordinates((change_x, change_y))
+        scroll_x, scroll_y = origin_x - scrolled_x, origin_y - scrolled_y
+        self.map_surface.scroll(scroll_x, scroll_y)
+
+        previous_rendered_images = self.rendered_images
+        self.rendered_images = [
+            [None] * self.coordinate_height for x in range(self.coordinate_width)
+        ]
+        for cell in self.get_flat_cell_list():
+            previous_cell = self.find_cell(cell.x + change_x, cell.y + change_y)
+            if (
+                previous_cell
+                and previous_cell.get_map_Rect().move(scroll_x, scroll_y)
+                == cell.get_map_Rect()
+            ):  # Cells might not line up exactly if the grid's width is not a multiple of its cell width
+                self.rendered_images[cell.x][cell.y] = previous_rendered_images[
+                    previous_cell.x
+                ][previous_cell.y]
+        self.dirty_cells.update(
+            self.get_flat_cell_list()
+        )  # Each cell's render is checked against its image, even if it is not re-subscribed to a new location
+        constants.RenderManager.mark_dirty(self.map_Rect)
+
     def get_absolute_coordinates(self, mini_x, mini_y):
         """
         Description:
@@ -546,8 +636,7 @@ class mini_grid(grid):
         right_x, up_y = (self.coordinate_width, self.coordinate_height)
         if flags.show_grid_lines:
             for x in range(0, self.coordinate_width + 1):
-                pygame.draw.line(
-                    constants.game_display,
+                drawing_utility.draw_line(
                     constants.color_dict[self.internal_line_color],
                     self.convert_coordinates((x, 0)),
                     self.convert_coordinates((x, self.coordinate_height)),
@@ -555,8 +644,7 @@ class mini_grid(grid):
                 )
 
             for y in range(0, self.coordinate_height + 1):
-                pygame.draw.line(
-                    constants.game_display,
+                drawing_utility.draw_line(
                     constants.color_dict[self.internal_line_color],
                     self.convert_coordinates((0, y)),
                     self.convert_coordinates((self.coordinate_width, y)),
@@ -564,32 +652,28 @@ class mini_grid(grid):
                 )
 
         for y in range(0, self.coordinate_height + 1):
-            pygame.draw.line(
-                constants.game_display,
+            drawing_utility.draw_line(
                 constants.color_dict[self.external_line_color],
                 self.convert_coordinates((left_x, down_y)),
                 self.convert_coordinates((left_x, up_y)),
                 self.grid_line_width + 1,
             )
 
-        pygame.draw.line(
-            constants.game_display,
+        drawing_utility.draw_line(
             constants.color_dict[self.external_line_color],
             self.convert_coordinates((left_x, up_y)),
             self.convert_coordinates((right_x, up_y)),
             self.grid_line_width + 1,
         )
 
-        pygame.draw.line(
-            constants.game_display,
+        drawing_utility.draw_line(
             constants.color_dict[self.external_line_color],
             self.convert_coordinates((right_x, up_y)),
             self.convert_coordinates((right_x, down_y)),
             self.grid_line_width + 1,
         )
 
-        pygame.draw.line(
-            constants.game_display,
+        drawing_utility.draw_line(
             constants.color_dict[self.external_line_color],
             self.convert_coordinates((right_x, down_y)),
             self.convert_coordinates((left_x, down_y)),
@@ -1,6 +1,5 @@
 # Contains functionality for actor display buttons
 
-import pygame
 from typing import Dict, List, Any, Callable
 from modules.interface_components import buttons
 from modules.constructs import buildings, minister_types
@@ -13,6 +12,7 @@ from modules.util import (
     game_transitions,
     utility,
     scaling,
+    drawing_utility,
 )
 from modules.constructs import minister_types
 from modules.constants import constants, status, flags
@@ -2044,10 +2044,8 @@ class minister_icon(actor_icon):
                 and status.displayed_minister == self.actor
                 and flags.show_selection_outlines
             ):
-                pygame.draw.rect(
-                    constants.game_display,
-                    constants.color_dict[constants.COLOR_BRIGHT_GREEN],
-                    self.outline,
+                drawing_utility.draw_rect(
+                    constants.color_dict[constants.COLOR_BRIGHT_GREEN], self.outline
                 )
         super().draw()
 
@@ -3,7 +3,7 @@
 from typing import List
 from modules.interface_components.labels import label
 from modules.interface_components.buttons import button
-from modules.util import scaling, text_utility
+from modules.util import scaling, text_utility, drawing_utility
 from modules.constants import constants, status, flags
 
 
@@ -96,13 +96,11 @@ class instructions_page(label):
             self.image.draw()
             for text_line_index in range(len(self.message)):
                 text_line = self.message[text_line_index]
-                constants.game_display.blit(
+                drawing_utility.display_image(
                     text_utility.text(text_line, self.font),
-                    (
-                        self.x + 10,
-                        constants.display_height
-                        - (self.y + self.height - (text_line_index * self.font.size)),
-                    ),
+                    self.x + 10,
+                    constants.display_height
+                    - (self.y + self.height - (text_line_index * self.font.size)),
                 )
 
     def format_message(self):
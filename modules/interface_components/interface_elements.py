@@ -62,6 +62,10 @@ class interface_element:
 
         if "image_id" in input_dict:
             self.create_image(input_dict["image_id"])
+        constants.EventBus.publish(
+            constants.INTERFACE_VISIBILITY_ENDPOINT,
+            constants.UPDATE_INTERFACE_ELEMENTS_ROUTE,
+        )
 
     def remove_recursive(self):
         """
@@ -78,6 +82,12 @@ class interface_element:
         status.independent_interface_elements = utility.remove_from_list(
             status.independent_interface_elements, self
         )
+        if hasattr(self, "image") and isinstance(self.image, images.image):
+            self.image.remove()  # Releases any cached image pinned by this element's image
+        constants.EventBus.publish(
+            constants.INTERFACE_VISIBILITY_ENDPOINT,
+            constants.UPDATE_INTERFACE_ELEMENTS_ROUTE,
+        )
 
     def draw(self):
         """
@@ -146,6 +156,7 @@ class interface_element:
         self.Rect.x = self.x
         self.y = new_y
         self.Rect.y = constants.display_height - (self.y + self.height)
+        constants.HitTestManager.update(self)
         if self.has_parent_collection:
             self.x_offset = self.x - self.parent_collection.x
             self.y_offset = self.y - self.parent_collection.y
@@ -411,6 +422,10 @@ class interface_collection(interface_element):
 
         if member_config["calibrate_exempt"] and hasattr(self, "calibrate_exempt_list"):
             self.calibrate_exempt_list.append(new_member)
+        constants.EventBus.publish(
+            constants.INTERFACE_VISIBILITY_ENDPOINT,
+            constants.UPDATE_INTERFACE_ELEMENTS_ROUTE,
+        )
 
     def remove_member(self, removed_member):
         """
@@ -429,6 +444,10 @@ class interface_collection(interface_element):
         removed_member.has_parent_collection = False
         status.independent_interface_elements.append(removed_member)
         self.members.remove(removed_member)
+        constants.EventBus.publish(
+            constants.INTERFACE_VISIBILITY_ENDPOINT,
+            constants.UPDATE_INTERFACE_ELEMENTS_ROUTE,
+        )
 
     def remove_recursive(self):
         """
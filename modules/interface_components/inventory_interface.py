@@ -1,11 +1,10 @@
 # Contains inventory-specific interface classes
 
-import pygame
 import math
 from typing import List
 from modules.interface_components.interface_elements import ordered_collection
 from modules.interface_components.buttons import button
-from modules.util import actor_utility
+from modules.util import actor_utility, drawing_utility
 from modules.constructs import item_types
 from modules.constants import constants, status, flags
 
@@ -263,8 +262,7 @@ class item_icon(button):
         """
         if self.showing:
             if self == getattr(status, f"displayed_{self.actor_type}"):
-                pygame.draw.rect(
-                    constants.game_display,
+                drawing_utility.draw_rect(
                     constants.color_dict[constants.COLOR_BRIGHT_GREEN],
                     self.outline,
                     width=2,
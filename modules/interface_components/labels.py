@@ -3,7 +3,13 @@
 import pygame
 from typing import List
 from modules.interface_components.buttons import button
-from modules.util import scaling, text_utility, utility, market_utility
+from modules.util import (
+    scaling,
+    text_utility,
+    utility,
+    market_utility,
+    drawing_utility,
+)
 from modules.constructs import item_types
 from modules.constants import constants, status, flags
 
@@ -56,6 +62,7 @@ class label(button):
         )
         self.image.width = self.width
         self.Rect.width = self.width
+        constants.HitTestManager.update(self)
         self.image.set_image(self.image.image_id)
         self.image.Rect = self.Rect
 
@@ -78,12 +85,10 @@ class label(button):
         """
         if self.showing:
             super().draw(allow_show_outline=False)
-            constants.game_display.blit(
+            drawing_utility.display_image(
                 text_utility.text(self.message, self.font),
-                (
-                    self.x + scaling.scale_width(10),
-                    constants.display_height - (self.y + self.height),
-                ),
+                self.x + scaling.scale_width(10),
+                constants.display_height - (self.y + self.height),
             )
 
 
@@ -362,6 +367,7 @@ class item_prices_label_template(label):
                 self.width = message_size + scaling.scale_width(20)
                 self.image.width = self.width
                 self.Rect.width = self.width
+                constants.HitTestManager.update(self)
                 self.image.set_image(self.image.image_id)  # update width scaling
                 self.image.Rect = self.Rect
 
@@ -373,13 +379,11 @@ class item_prices_label_template(label):
             self.image.draw()
             for text_line_index in range(len(self.message)):
                 text_line = self.message[text_line_index]
-                constants.game_display.blit(
+                drawing_utility.display_image(
                     text_utility.text(text_line, self.font),
-                    (
-                        self.x + scaling.scale_width(10),
-                        constants.display_height
-                        - (self.y + self.height - (text_line_index * self.font.size)),
-                    ),
+                    self.x + scaling.scale_width(10),
+                    constants.display_height
+                    - (self.y + self.height - (text_line_index * self.font.size)),
                 )
 
     @property
@@ -439,13 +443,11 @@ class multi_line_label(label):
                     )
                 else:
                     x = self.x + scaling.scale_width(10)
-                constants.game_display.blit(
+                drawing_utility.display_image(
                     text_utility.text(text_line, self.font),
-                    (
-                        x,
-                        constants.display_height
-                        - (self.y + self.height - (text_line_index * self.font.size)),
-                    ),
+                    x,
+                    constants.display_height
+                    - (self.y + self.height - (text_line_index * self.font.size)),
                 )
 
     @property
@@ -516,4 +518,5 @@ class multi_line_label(label):
             self.width,
             self.height,
         )
+        constants.HitTestManager.update(self)
         self.image.update_state(self.x, self.y, self.width, self.height)
@@ -1,6 +1,7 @@
 # Contains topic subscription/publication-based event bus management singleton
 
-from typing import List, Dict, Callable
+from contextlib import contextmanager
+from typing import List, Dict, Callable, Iterator
 from modules.constants import constants, status, flags
 
 
@@ -14,6 +15,12 @@ class event_bus:
         Placeholder
         """
         self.subscriptions: Dict[str, List[Callable]] = {}
+        self.deferral_depth: int = (
+            0  # Number of nested defer_publishing contexts currently open
+        )
+        self.deferred_topics: Dict[str, None] = (
+            {}
+        )  # Insertion-ordered set of topics published while deferring
 
     def subscribe(self, callback: Callable, endpoint: str, *routes: List[str]) -> None:
         """
@@ -77,10 +84,52 @@ class event_bus:
         if routes:
             for route in routes:
                 topics.append(f"{topics[-1]}/{route}")
+        if self.deferral_depth > 0:
+            for topic in topics:
+                self.deferred_topics[topic] = None
+            return
         for topic in topics:
             for callback in self.subscriptions.get(topic, []):
                 callback()
 
+    @contextmanager
+    def defer_publishing(self) -> Iterator[None]:
+        """
+        Description:
+            Context manager that collects all topics published within it, invoking each subscribed callback once on exit
+                Allows bulk edits like world generation or loading to refresh each location once, rather than once per edit
+                Nested contexts are merged into the outermost one
+                Callbacks are looked up on exit, so any unsubscribed in the meantime are skipped
+        Input:
+            None
+        Output:
+            None
+        """
+        self.deferral_depth += 1
+        try:
+            yield
+        finally:
+            self.deferral_depth -= 1
+            if self.deferral_depth == 0:
+                self.flush_deferred_topics()
+
+    def flush_deferred_topics(self) -> None:
+        """
+        Description:
+            Invokes each callback subscribed to any deferred topic once, in order of first publication
+        Input:
+            None
+        Output:
+            None
+        """
+        deferred_topics, self.deferred_topics = self.deferred_topics, {}
+        callbacks: Dict[Callable, None] = {}
+        for topic in deferred_topics:
+            for callback in self.subscriptions.get(topic, []):
+                callbacks[callback] = None
+        for callback in callbacks:
+            callback()
+
     def clear_endpoint(self, endpoint: str) -> None:
         """
         Description:
@@ -0,0 +1,213 @@
+# Contains per-subsystem frame time profiling singleton
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Deque, Iterator, Any
+from modules.util import drawing_utility, text_utility, scaling
+from modules.constants import constants, status, flags
+
+# Number of most recent frames that percentiles are calculated from
+PROFILER_WINDOW_SIZE: int = 300
+# Seconds between refreshes of the overlay's percentiles - refreshing every frame would make the overlay itself change each frame
+PROFILER_OVERLAY_INTERVAL: float = 0.5
+# Seconds between writes of buffered frame records to the export file
+PROFILER_EXPORT_INTERVAL: float = 1.0
+# Export file is written alongside save games rather than in the tracked notes folder
+PROFILER_EXPORT_PATH: str = "save_games/frame_profile.jsonl"
+PROFILER_PERCENTILES: List[int] = [50, 95, 99]
+
+
+class frame_profiler:
+    """
+    Object that times each phase of the main loop per frame, like event handling or interface traversal, keeping rolling percentiles of each
+        phase's time
+    Nested phases are timed exclusively - time spent in grid draws during interface traversal only counts towards grid draws
+    The percentiles can be shown in an overlay with the profile_frames effect, and each frame can be exported as a JSON line with the
+        export_frame_profile effect
+    """
+
+    def __init__(self):
+        """
+        Initializes this object
+        """
+        self.active: bool = False
+        self.frame_count: int = 0
+        self.frame_start: float = 0.0
+        self.phase_stack: List[List[Any]] = []
+        self.frame_phase_times: Dict[str, float] = {}
+        self.phase_history: Dict[str, Deque[float]] = {}
+        self.overlay_lines: List[str] = []
+        self.last_overlay_update: float = 0.0
+        self.export_buffer: List[str] = []
+        self.last_export: float = 0.0
+
+    def start_frame(self) -> None:
+        """
+        Starts timing a new frame, if any profiling effect is active
+        """
+        self.active = constants.EffectManager.effect_active(
+            "profile_frames"
+        ) or constants.EffectManager.effect_active("export_frame_profile")
+        if self.active:
+            self.frame_phase_times = {}
+            self.phase_stack = []
+            self.frame_start = time.perf_counter()
+
+    def start_phase(self, phase_name: str) -> None:
+        """
+        Description:
+            Starts timing the inputted phase, nested within any phase currently being timed - each call must be followed by end_phase
+        Input:
+            string phase_name: Name of the main loop phase, like event_handling
+        Output:
+            None
+        """
+        if self.active:
+            self.phase_stack.append(
+                [phase_name, time.perf_counter(), 0.0]
+            )  # Name, start time, and time spent in nested phases
+
+    def end_phase(self) -> None:
+        """
+        Stops timing the most recently started phase, adding its time to the current frame's time for that phase, excluding any nested phases
+        """
+        if self.active and self.phase_stack:
+            phase_name, start_time, nested_time = self.phase_stack.pop()
+            elapsed = time.perf_counter() - start_time
+            self.frame_phase_times[phase_name] = (
+                self.frame_phase_times.get(phase_name, 0.0) + elapsed - nested_time
+            )
+            if self.phase_stack:
+                self.phase_stack[-1][2] += elapsed
+
+    @contextmanager
+    def time_phase(self, phase_name: str) -> Iterator[None]:
+        """
+        Description:
+            Context manager that times the inputted phase while within it, excluding any nested phases
+        Input:
+            string phase_name: Name of the main loop phase, like tooltip_detection
+        Output:
+            None
+        """
+        self.start_phase(phase_name)
+        try:
+            yield
+        finally:
+            self.end_phase()
+
+    def end_frame(self) -> None:
+        """
+        Records the current frame's phase times, updating the overlay and export file as needed
+        """
+        if not self.active:
+            return
+        current_time = time.perf_counter()
+        self.frame_phase_times["frame"] = current_time - self.frame_start
+        self.frame_count += 1
+        for phase_name in self.frame_phase_times:
+            if not phase_name in self.phase_history:
+                self.phase_history[phase_name] = deque(maxlen=PROFILER_WINDOW_SIZE)
+        for phase_name, phase_history in self.phase_history.items():
+            phase_history.append(
+                self.frame_phase_times.get(phase_name, 0.0)
+            )  # Phases that didn't happen this frame, like tooltip drawing, took no time
+
+        if constants.EffectManager.effect_active("export_frame_profile"):
+            self.export_buffer.append(
+                json.dumps(
+                    {
+                        "frame": self.frame_count,
+                        "time": time.time(),
+                        "phases_ms": {
+                            phase_name: round(phase_time * 1000, 3)
+                            for phase_name, phase_time in self.frame_phase_times.items()
+                        },
+                    }
+                )
+            )
+            if current_time > self.last_export + PROFILER_EXPORT_INTERVAL:
+                self.export()
+                self.last_export = current_time
+
+        if current_time > self.last_overlay_update + PROFILER_OVERLAY_INTERVAL:
+            self.overlay_lines = self.get_overlay_lines()
+            self.last_overlay_update = current_time
+
+    def get_percentiles(self, phase_name: str) -> List[float]:
+        """
+        Description:
+            Returns the rolling percentiles of the inputted phase's time
+        Input:
+            string phase_name: Name of the main loop phase
+        Output:
+            float list: Returns the phase's time in milliseconds at each of PROFILER_PERCENTILES, over the most recent frames
+        """
+        phase_times = sorted(self.phase_history.get(phase_name, [0.0]))
+        return [
+            phase_times[
+                min(len(phase_times) - 1, (len(phase_times) * percentile) // 100)
+            ]
+            * 1000
+            for percentile in PROFILER_PERCENTILES
+        ]
+
+    def get_overlay_lines(self) -> List[str]:
+        """
+        Returns a line of text for each phase's rolling percentiles, with the whole frame last
+        """
+        phase_names = [
+            phase_name for phase_name in self.phase_history if phase_name != "frame"
+        ] + ["frame"]
+        overlay_lines = [
+            "Phase: "
+            + "/".join(f"p{percentile}" for percentile in PROFILER_PERCENTILES)
+            + " ms"
+        ]
+        for phase_name in phase_names:
+            overlay_lines.append(
+                f"{phase_name}: "
+                + "/".join(
+                    f"{round(phase_time, 2)}"
+                    for phase_time in self.get_percentiles(phase_name)
+                )
+            )
+        return overlay_lines
+
+    def draw(self) -> None:
+        """
+        Draws the rolling percentiles of each phase in the top right corner of the screen, if the profile_frames effect is active
+        """
+        if not (
+            self.overlay_lines
+            and constants.EffectManager.effect_active("profile_frames")
+        ):
+            return
+        font = constants.fonts["default"]
+        width = max(
+            font.calculate_size(overlay_line) for overlay_line in self.overlay_lines
+        ) + scaling.scale_width(10)
+        height = (font.size * len(self.overlay_lines)) + scaling.scale_height(10)
+        x = constants.display_width - width
+        drawing_utility.draw_rect(
+            constants.color_dict[constants.COLOR_WHITE], (x, 0, width, height)
+        )
+        for line_index, overlay_line in enumerate(self.overlay_lines):
+            drawing_utility.display_image(
+                text_utility.text(overlay_line, font),
+                x + scaling.scale_width(5),
+                scaling.scale_height(5) + (line_index * font.size),
+            )
+
+    def export(self) -> None:
+        """
+        Appends each buffered frame record to the export file as a line of JSON - also called when the game exits, so no records are lost
+        """
+        if self.export_buffer:
+            os.makedirs(os.path.dirname(PROFILER_EXPORT_PATH), exist_ok=True)
+            with open(PROFILER_EXPORT_PATH, "a") as export_file:
+                export_file.write("\n".join(self.export_buffer) + "\n")
+            self.export_buffer = []
@@ -0,0 +1,101 @@
+# Contains main loop frame pacing singleton
+
+import time
+import pygame
+from modules.constants import constants, status, flags
+
+# Frames closer together than this many seconds are not worth blocking between
+MIN_IDLE_WAIT: float = 0.005
+
+
+class frame_scheduler:
+    """
+    Object that paces the main loop, capping its frame rate and, while nothing is animating, blocking until the next input, scheduled job, or
+        timed interface change rather than redrawing an unchanged display
+    """
+
+    def __init__(self):
+        """
+        Initializes this object
+        """
+        self.clock: pygame.time.Clock = pygame.time.Clock()
+
+    def power_save_active(self) -> bool:
+        """
+        Returns whether the main loop should run at a lower frame rate and idle for longer
+        """
+        return constants.EffectManager.effect_active("power_save")
+
+    def get_frame_rate_cap(self) -> int:
+        """
+        Returns the maximum number of frames per second, or 0 for an uncapped frame rate
+        """
+        if self.power_save_active():
+            return constants.POWER_SAVE_FRAME_RATE_CAP
+        return constants.FRAME_RATE_CAP
+
+    def is_idle(self) -> bool:
+        """
+        Description:
+            Returns whether nothing is animating, such that the next frame would look the same as the previous one until input or a timed change
+        Input:
+            None
+        Output:
+            boolean: Returns whether the main loop can block until the next input or timed change
+        """
+        if flags.crashed or flags.loading or not flags.player_turn:
+            return False  # End turn planet rotation and loading need each frame
+        if any(current_die.rolling for current_die in status.dice_list):
+            return False
+        if (
+            constants.RenderManager.retained_mode_active()
+            and constants.RenderManager.has_dirty_regions()
+        ):
+            return False  # Without retained rendering, dirty regions aren't tracked and only timed changes are waited for
+        return True
+
+    def get_idle_timeout(self) -> float:
+        """
+        Description:
+            Returns the number of seconds until the next scheduled job or timed interface change, like a tooltip appearing once the mouse is still
+        Input:
+            None
+        Output:
+            float: Returns the longest time the main loop can block for
+        """
+        current_time = time.time()
+        deadlines = [
+            current_time + constants.MAX_IDLE_WAIT,
+            constants.last_selection_outline_switch + 1,
+        ]
+        if current_time < constants.mouse_moved_time + 0.15:
+            deadlines.append(constants.mouse_moved_time + 0.15)
+        time_until_next_job = constants.JobScheduler.get_time_until_next_job(
+            current_time
+        )
+        if time_until_next_job != None:
+            deadlines.append(current_time + time_until_next_job)
+        return max(0.0, min(deadlines) - current_time)
+
+    def wait_for_event(self, timeout: float) -> None:
+        """
+        Description:
+            Blocks until an event is received or the inputted timeout passes, leaving any received event in the queue for the main loop
+        Input:
+            float timeout: Maximum number of seconds to block for
+        Output:
+            None
+        """
+        event = pygame.event.wait(round(timeout * 1000))
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+    def end_frame(self) -> None:
+        """
+        Waits until the next frame should start - blocks until input or a timed change while idle, then waits out the rest of the frame rate cap
+        """
+        if self.is_idle():
+            timeout = self.get_idle_timeout()
+            if timeout > MIN_IDLE_WAIT:
+                self.wait_for_event(timeout)
+        self.clock.tick(self.get_frame_rate_cap())
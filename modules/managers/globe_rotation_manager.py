@@ -0,0 +1,151 @@
+# Contains background globe rotation frame rendering singleton
+
+import queue
+import threading
+import pygame
+from typing import Dict, List, Any, Tuple
+from modules.util import world_utility
+
+# Maximum number of rendered frames waiting to be shown - the worker waits for frames to be shown before rendering further ahead
+GLOBE_ROTATION_QUEUE_SIZE: int = 8
+
+
+class globe_rotation_manager:
+    """
+    Object that renders the globe projection frames of the end turn planet rotation on a worker thread, using pure data inputs copied from the
+        world when the turn ends
+    The rotation shows each frame as it becomes ready, rendering a frame synchronously instead whenever the worker falls behind
+    """
+
+    def __init__(self):
+        """
+        Initializes this object
+        """
+        self.worker: threading.Thread = None
+        self.stop_event: threading.Event = threading.Event()
+        self.frame_queue: queue.Queue = None
+        self.shown_queue: queue.Queue = None
+        self.next_frame: int = 0
+        self.waiting_frame: Tuple[int, Tuple[pygame.Surface, pygame.Surface]] = None
+
+    def start(
+        self,
+        globe_projection_inputs: Dict[bool, Dict[str, Any]],
+        frames: List[Tuple[int, bool]],
+    ) -> None:
+        """
+        Description:
+            Starts rendering each frame of a planet rotation on a worker thread, stopping any previous rotation
+        Input:
+            dictionary globe_projection_inputs: Globe projection inputs, as returned by full_world_handler.get_globe_projection_inputs, for
+                each set of latitude lines used by the rotation - True for the latitude lines and False for the alternate latitude lines
+            tuple list frames: Tuple of the index of the latitude line to center each frame of the rotation on and whether that index is of the
+                latitude lines rather than the alternate latitude lines, in order
+        Output:
+            None
+        """
+        self.stop()
+        self.stop_event = threading.Event()
+        self.frame_queue = queue.Queue(maxsize=GLOBE_ROTATION_QUEUE_SIZE)
+        self.shown_queue = queue.Queue()
+        self.next_frame = 0
+        self.waiting_frame = None
+        self.worker = threading.Thread(
+            target=self.render_frames,
+            args=(
+                globe_projection_inputs,
+                frames,
+                self.frame_queue,
+                self.shown_queue,
+                self.stop_event,
+            ),
+            daemon=True,
+        )
+        self.worker.start()
+
+    def render_frames(
+        self,
+        globe_projection_inputs: Dict[bool, Dict[str, Any]],
+        frames: List[Tuple[int, bool]],
+        frame_queue: queue.Queue,
+        shown_queue: queue.Queue,
+        stop_event: threading.Event,
+    ) -> None:
+        """
+        Description:
+            Renders each frame of a planet rotation into the inputted queue, skipping frames that were already shown - runs on the worker thread
+        Input:
+            dictionary globe_projection_inputs: Globe projection inputs for each set of latitude lines used by the rotation
+            tuple list frames: Tuple of the latitude line index and set of latitude lines to center each frame of the rotation on, in order
+            queue.Queue frame_queue: Queue to add each rendered frame to
+            queue.Queue shown_queue: Queue of the number of each frame shown by the main thread
+            threading.Event stop_event: Event that is set when the rotation is stopped
+        Output:
+            None
+        """
+        rendered_frames: Dict[
+            Tuple[int, bool], Tuple[pygame.Surface, pygame.Surface]
+        ] = {}  # Planets rotating more than once show each latitude line multiple times
+        next_frame = 0
+        for frame_number, frame in enumerate(frames):
+            if stop_event.is_set():
+                return
+            while True:
+                try:
+                    next_frame = max(next_frame, shown_queue.get_nowait() + 1)
+                except queue.Empty:
+                    break
+            if frame_number < next_frame:
+                continue  # Already rendered synchronously
+            if not frame in rendered_frames:
+                index, primary_lines = frame
+                rendered_frames[frame] = world_utility.create_remapped_globe_projection(
+                    globe_projection_inputs[primary_lines], index
+                )
+            while not stop_event.is_set():
+                try:
+                    frame_queue.put((frame_number, rendered_frames[frame]), timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def get_next_frame(self) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        Description:
+            Returns the next frame of the planet rotation if the worker has rendered it, without waiting for it
+        Input:
+            None
+        Output:
+            tuple: Returns tuple of the next frame's globe projection image and globe projection surface, or None if the next frame must be rendered
+                synchronously
+        """
+        frame_number = self.next_frame
+        self.next_frame += 1
+        if self.frame_queue == None:
+            return None
+        self.shown_queue.put(frame_number)
+        while True:
+            if not self.waiting_frame:
+                try:
+                    self.waiting_frame = self.frame_queue.get_nowait()
+                except queue.Empty:
+                    return None
+            if self.waiting_frame[0] == frame_number:
+                frame = self.waiting_frame[1]
+                self.waiting_frame = None
+                return frame
+            elif self.waiting_frame[0] > frame_number:
+                return None  # Worker already skipped this frame
+            self.waiting_frame = None  # Discard frames that were rendered synchronously
+
+    def stop(self) -> None:
+        """
+        Stops rendering the current planet rotation, discarding any frames that were not shown
+        """
+        self.stop_event.set()
+        if self.worker:
+            self.worker.join()
+        self.worker = None
+        self.frame_queue = None
+        self.shown_queue = None
+        self.waiting_frame = None
@@ -0,0 +1,151 @@
+# Contains screen-space spatial index singleton for mouse hit-testing
+
+import pygame
+from typing import Dict, List, Tuple, Any
+
+# Pixel width and height of each bucket of the spatial index - elements are added to each bucket their Rect overlaps
+HIT_TEST_BUCKET_SIZE: int = 64
+
+
+class hit_test_manager:
+    """
+    Object that indexes the Rects of buttons, cells, and tooltip images in a uniform grid of screen-space buckets, allowing hover and click
+        resolution to only check the elements near the mouse rather than every element
+    Elements are registered on creation, updated when they move, resize, or change visibility, and unregistered on removal
+    """
+
+    def __init__(self):
+        """
+        Initializes this object
+        """
+        self.buckets: Dict[Tuple[str, int, int], List[Any]] = {}
+        self.records: Dict[Any, Dict[str, Any]] = {}
+        self.next_order: int = 0
+
+    def register(self, element: Any, layer: str, visible: bool = True) -> None:
+        """
+        Description:
+            Adds the inputted element to the index, ordered after all previously registered elements of its layer
+        Input:
+            any type element: Element with a Rect, like a button or cell
+            string layer: Layer to add the element to, like constants.BUTTON_HIT_LAYER
+            boolean visible = True: Whether the element is currently visible - invisible elements are not returned by queries
+        Output:
+            None
+        """
+        self.records[element] = {
+            "layer": layer,
+            "order": self.next_order,
+            "bounds": None,
+            "visible": visible,
+            "bucket_keys": [],
+        }
+        self.next_order += 1
+        self.update(element)
+
+    def unregister(self, element: Any) -> None:
+        """
+        Description:
+            Removes the inputted element from the index, if it is registered
+        Input:
+            any type element: Element to remove
+        Output:
+            None
+        """
+        record = self.records.pop(element, None)
+        if record:
+            self.remove_from_buckets(element, record)
+
+    def update(self, element: Any) -> None:
+        """
+        Description:
+            Re-indexes the inputted element if its Rect or visibility changed since it was last indexed - should be called whenever a registered
+                element moves, resizes, or replaces its Rect
+        Input:
+            any type element: Element to update
+        Output:
+            None
+        """
+        record = self.records.get(element, None)
+        if not record:
+            return
+        if record["visible"] and element.Rect:
+            bounds = tuple(element.Rect)
+        else:
+            bounds = None
+        if bounds != record["bounds"]:
+            self.remove_from_buckets(element, record)
+            record["bounds"] = bounds
+            if bounds:
+                x, y, width, height = bounds
+                for bucket_x in range(
+                    x // HIT_TEST_BUCKET_SIZE,
+                    ((x + max(width, 1) - 1) // HIT_TEST_BUCKET_SIZE) + 1,
+                ):
+                    for bucket_y in range(
+                        y // HIT_TEST_BUCKET_SIZE,
+                        ((y + max(height, 1) - 1) // HIT_TEST_BUCKET_SIZE) + 1,
+                    ):
+                        bucket_key = (record["layer"], bucket_x, bucket_y)
+                        self.buckets.setdefault(bucket_key, []).append(element)
+                        record["bucket_keys"].append(bucket_key)
+
+    def set_visible(self, element: Any, visible: bool) -> None:
+        """
+        Description:
+            Records whether the inputted element is visible, if it is registered
+        Input:
+            any type element: Element whose visibility changed
+            boolean visible: Whether the element is now visible
+        Output:
+            None
+        """
+        record = self.records.get(element, None)
+        if record and record["visible"] != visible:
+            record["visible"] = visible
+            self.update(element)
+
+    def remove_from_buckets(self, element: Any, record: Dict[str, Any]) -> None:
+        """
+        Description:
+            Removes the inputted element from each bucket it was indexed in
+        Input:
+            any type element: Element to remove
+            dictionary record: Index record of the element
+        Output:
+            None
+        """
+        for bucket_key in record["bucket_keys"]:
+            bucket = self.buckets[bucket_key]
+            bucket.remove(element)
+            if not bucket:
+                del self.buckets[bucket_key]
+        record["bucket_keys"] = []
+
+    def get_candidates(self, layer: str, point: Tuple[int, int] = None) -> List[Any]:
+        """
+        Description:
+            Returns the visible elements of the inputted layer whose indexed Rect contains the inputted point, in registration order - callers should
+                still check each candidate's own conditions, like can_show_tooltip
+        Input:
+            string layer: Layer to query, like constants.BUTTON_HIT_LAYER
+            int tuple point = None: Pixel coordinates to query, defaulting to the mouse position
+        Output:
+            list: Returns list of elements that may be at the inputted point, in the order they were registered
+        """
+        if point == None:
+            point = pygame.mouse.get_pos()
+        x, y = point
+        bucket = self.buckets.get(
+            (layer, x // HIT_TEST_BUCKET_SIZE, y // HIT_TEST_BUCKET_SIZE), None
+        )
+        if not bucket:
+            return []
+        return sorted(
+            [
+                element
+                for element in bucket
+                if pygame.Rect(self.records[element]["bounds"]).collidepoint(point)
+            ],
+            key=lambda element: self.records[element]["order"],
+        )
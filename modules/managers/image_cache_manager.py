@@ -0,0 +1,171 @@
+# Contains loaded image caching singleton
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Hashable, Any
+
+
+class image_cache_manager:
+    """
+    Object that caches loaded and mutated image surfaces by key, evicting the least recently used unpinned surfaces once their estimated size
+        exceeds a byte budget
+    Pinned surfaces are kept out of the eviction order and don't count towards the budget, so eviction only visits the surfaces it evicts
+    """
+
+    def __init__(self, byte_budget: int):
+        """
+        Description:
+            Initializes this object
+        Input:
+            int byte_budget: Maximum estimated size of all unpinned cached surfaces, in bytes
+        Output:
+            None
+        """
+        self.byte_budget: int = byte_budget
+        self.cached_images: Dict[Hashable, pygame.Surface] = {}
+        self.unpinned_keys: OrderedDict[Hashable, None] = (
+            OrderedDict()
+        )  # Keys of cached surfaces without pins, ordered from least to most recently used
+        self.image_sizes: Dict[Hashable, int] = {}
+        self.pin_counts: Dict[Hashable, int] = {}
+        self.total_bytes: int = 0
+        self.unpinned_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def get_surface_size(self, surface: pygame.Surface) -> int:
+        """
+        Description:
+            Estimates and returns the memory used by the inputted surface
+        Input:
+            pygame.Surface surface: Surface to estimate the size of
+        Output:
+            int: Returns the width x height x bytes per pixel of the surface
+        """
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    def get(self, key: Hashable) -> pygame.Surface:
+        """
+        Description:
+            Returns the cached surface with the inputted key and marks it as most recently used, recording a hit or miss
+        Input:
+            hashable key: Key of the surface to find
+        Output:
+            pygame.Surface: Returns the cached surface, or None if it is not cached
+        """
+        surface = self.cached_images.get(key, None)
+        if surface == None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if key in self.unpinned_keys:
+                self.unpinned_keys.move_to_end(key)
+        return surface
+
+    def set(self, key: Hashable, surface: pygame.Surface) -> None:
+        """
+        Description:
+            Caches the inputted surface with the inputted key as the most recently used surface, then evicts surfaces until within the byte budget
+        Input:
+            hashable key: Key to cache the surface with
+            pygame.Surface surface: Surface to cache
+        Output:
+            None
+        """
+        if key in self.cached_images:
+            self.total_bytes -= self.image_sizes[key]
+            if key in self.unpinned_keys:
+                self.unpinned_bytes -= self.image_sizes[key]
+        self.cached_images[key] = surface
+        self.image_sizes[key] = self.get_surface_size(surface)
+        self.total_bytes += self.image_sizes[key]
+        if not key in self.pin_counts:
+            self.unpinned_keys[key] = None
+            self.unpinned_keys.move_to_end(key)
+            self.unpinned_bytes += self.image_sizes[key]
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Evicts the least recently used unpinned surfaces until the unpinned surfaces are within the byte budget - the most recently used unpinned
+            surface is never evicted
+        """
+        while self.unpinned_bytes > self.byte_budget and len(self.unpinned_keys) > 1:
+            key, _ = self.unpinned_keys.popitem(last=False)
+            del self.cached_images[key]
+            size = self.image_sizes.pop(key)
+            self.total_bytes -= size
+            self.unpinned_bytes -= size
+            self.evictions += 1
+
+    def pin(self, key: Hashable) -> None:
+        """
+        Description:
+            Prevents the surface with the inputted key from being evicted until each pin is released, such as while it is being displayed
+        Input:
+            hashable key: Key of the surface to pin, which does not need to be cached yet
+        Output:
+            None
+        """
+        self.pin_counts[key] = self.pin_counts.get(key, 0) + 1
+        if key in self.unpinned_keys:
+            del self.unpinned_keys[key]
+            self.unpinned_bytes -= self.image_sizes[key]
+
+    def unpin(self, key: Hashable) -> None:
+        """
+        Description:
+            Releases 1 pin on the surface with the inputted key, allowing it to be evicted once no pins remain
+        Input:
+            hashable key: Key of the surface to unpin
+        Output:
+            None
+        """
+        if self.pin_counts.get(key, 0) > 1:
+            self.pin_counts[key] -= 1
+        elif self.pin_counts.pop(key, None) and key in self.cached_images:
+            self.unpinned_keys[key] = None
+            self.unpinned_bytes += self.image_sizes[key]
+            self.evict()
+
+    def clear(self) -> None:
+        """
+        Removes all cached surfaces, such as when starting a new game - pins are kept for any surfaces that are still displayed
+        """
+        self.cached_images.clear()
+        self.unpinned_keys.clear()
+        self.image_sizes.clear()
+        self.total_bytes = 0
+        self.unpinned_bytes = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Description:
+            Returns a summary of this cache's usage and hit, miss, and eviction counters
+        Input:
+            None
+        Output:
+            dictionary: Returns a dictionary of cache statistics
+        """
+        requests = self.hits + self.misses
+        return {
+            "cached_images": len(self.cached_images),
+            "pinned_images": len(self.pin_counts),
+            "total_bytes": self.total_bytes,
+            "unpinned_bytes": self.unpinned_bytes,
+            "byte_budget": self.byte_budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / requests, 4) if requests else 0.0,
+        }
+
+    def print_statistics(self) -> None:
+        """
+        Prints this cache's usage and hit, miss, and eviction counters
+        """
+        print("Image cache:")
+        for statistic, value in self.get_statistics().items():
+            print(f"    {statistic}: {value}")
@@ -74,8 +74,28 @@ class job_scheduler:
             for current_job in activated_jobs:
                 current_job.activate()
                 current_job.remove()
+            constants.EventBus.publish(
+                constants.INTERFACE_VISIBILITY_ENDPOINT, constants.ACTIVATE_JOB_ROUTE
+            )
         self.previous_time = new_time
 
+    def get_time_until_next_job(self, current_time: float) -> float:
+        """
+        Description:
+            Returns the number of seconds until the next scheduled job activates
+        Input:
+            double current_time: Current time
+        Output:
+            double: Returns the number of seconds until the next job activates, or None if no jobs are scheduled
+        """
+        if not self.scheduled_jobs:
+            return None
+        return max(
+            0.0,
+            min(current_job.activation_time for current_job in self.scheduled_jobs)
+            - (current_time - self.previous_time),
+        )
+
     def clear(self):
         """
         Removes this object's events, removing them from storage and stopping them before activation
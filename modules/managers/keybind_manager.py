@@ -0,0 +1,96 @@
+# Contains button keybind dispatch singleton
+
+from typing import Dict, List, Tuple, Any
+
+
+class keybind_manager:
+    """
+    Object that maps each key to the buttons bound to it, allowing key events to only check the relevant buttons rather than every button
+    Buttons are bound on creation, rebound whenever their keybind changes, and unbound on removal
+    """
+
+    def __init__(self):
+        """
+        Initializes this object
+        """
+        self.bound_buttons: Dict[int, List[Any]] = {}
+        self.records: Dict[Any, Tuple[int, int]] = (
+            {}
+        )  # Each bound button's (creation order, keybind_id)
+        self.next_order: int = 0
+        self.pressed_buttons: List[Any] = []
+
+    def bind(self, button: Any, keybind_id: int) -> None:
+        """
+        Description:
+            Sets the inputted button's keybind, keeping the buttons bound to each key in creation order so that key events resolve in the same
+                order as status.button_list
+        Input:
+            button button: Button to bind
+            pygame key object keybind_id: Keybind id that activates this button, like pygame.K_n, or None for no keybind
+        Output:
+            None
+        """
+        if button in self.records:
+            order, previous_keybind_id = self.records[button]
+            if previous_keybind_id != None:
+                self.bound_buttons[previous_keybind_id].remove(button)
+                if not self.bound_buttons[previous_keybind_id]:
+                    del self.bound_buttons[previous_keybind_id]
+        else:
+            order = self.next_order
+            self.next_order += 1
+        self.records[button] = (order, keybind_id)
+        button.keybind_id = keybind_id
+        if keybind_id != None:
+            self.bound_buttons.setdefault(keybind_id, []).append(button)
+            self.bound_buttons[keybind_id].sort(
+                key=lambda bound_button: self.records[bound_button][0]
+            )
+
+    def unbind(self, button: Any) -> None:
+        """
+        Description:
+            Removes the inputted button from the keybind registry, if it is bound
+        Input:
+            button button: Button to remove
+        Output:
+            None
+        """
+        if button in self.records:
+            self.bind(button, None)
+            del self.records[button]
+        self.pressed_buttons = [
+            pressed_button
+            for pressed_button in self.pressed_buttons
+            if pressed_button != button
+        ]
+
+    def get_buttons(self, keybind_id: int) -> List[Any]:
+        """
+        Description:
+            Returns the buttons bound to the inputted key, in creation order
+        Input:
+            pygame key object keybind_id: Key to find the buttons of
+        Output:
+            button list: Returns list of buttons bound to the inputted key
+        """
+        return list(self.bound_buttons.get(keybind_id, []))
+
+    def press(self, button: Any) -> None:
+        """
+        Description:
+            Records that the inputted button is being pressed by its keybind, releasing the press of any other buttons pressed by keybind
+        Input:
+            button button: Button being pressed, or None if a key press didn't press any buttons
+        Output:
+            None
+        """
+        for pressed_button in self.pressed_buttons:
+            if pressed_button != button:
+                pressed_button.confirming = False
+                pressed_button.being_pressed = False
+        if button:
+            self.pressed_buttons = [button]
+        else:
+            self.pressed_buttons = []
@@ -0,0 +1,233 @@
+# Contains retained rendering singleton
+
+import pygame
+from collections import Counter
+from typing import List, Tuple
+from modules.constants import constants, status, flags
+
+# Beyond this many dirty rects, redraw their bounding rect once instead of redrawing each separately
+MAX_DIRTY_RECTS: int = 16
+
+
+class render_manager:
+    """
+    Object that records each frame's draw operations while in retained rendering mode, then redraws and updates only the regions of the display
+        where the operations changed since the previous frame - the display surface keeps each previous frame, acting as a persistent back buffer
+    Cells, free images, buttons, and other elements are dirtied when their image bundle, position, or visibility changes, since any of these
+        changes the surfaces, positions, or presence of the operations they record
+    """
+
+    def __init__(self):
+        """
+        Initializes this object
+        """
+        self.recording: bool = False
+        self.draw_operations: List[Tuple] = []
+        self.previous_draw_operations: List[Tuple] = []
+        self.dirty_rects: List[pygame.Rect] = []
+        self.redraw_all: bool = True
+        self.frame_changed: bool = True
+
+    def retained_mode_active(self) -> bool:
+        """
+        Returns whether frames should be drawn in retained rendering mode
+        """
+        return constants.EffectManager.effect_active("retained_rendering")
+
+    def draw(self, operation: Tuple) -> None:
+        """
+        Description:
+            Records the inputted draw operation if a retained frame is being recorded, otherwise immediately draws it
+        Input:
+            tuple operation: Draw operation, like ("blit", surface, (x, y)), ("rect", color, rect, width), or ("line", color, start, end, width)
+        Output:
+            None
+        """
+        if self.recording:
+            self.draw_operations.append(operation)
+        else:
+            self.execute(operation)
+
+    def execute(self, operation: Tuple) -> None:
+        """
+        Description:
+            Draws the inputted draw operation on the display
+        Input:
+            tuple operation: Draw operation to draw
+        Output:
+            None
+        """
+        if operation[0] == "blit":
+            constants.game_display.blit(operation[1], operation[2])
+        elif operation[0] == "rect":
+            pygame.draw.rect(
+                constants.game_display, operation[1], operation[2], operation[3]
+            )
+        elif operation[0] == "line":
+            pygame.draw.line(
+                constants.game_display,
+                operation[1],
+                operation[2],
+                operation[3],
+                operation[4],
+            )
+
+    def get_operation_rect(self, operation: Tuple) -> pygame.Rect:
+        """
+        Description:
+            Returns the region of the display that the inputted draw operation can change
+        Input:
+            tuple operation: Draw operation to find the region of
+        Output:
+            pygame.Rect: Returns the region that the operation can change
+        """
+        if operation[0] == "blit":
+            return pygame.Rect(operation[2], operation[1].get_size())
+        elif operation[0] == "rect":
+            return pygame.Rect(operation[2])
+        else:
+            (start_x, start_y), (end_x, end_y), width = operation[2:5]
+            return pygame.Rect(
+                min(start_x, end_x),
+                min(start_y, end_y),
+                abs(end_x - start_x) + 1,
+                abs(end_y - start_y) + 1,
+            ).inflate(width * 2, width * 2)
+
+    def surfaces_identical(
+        self, surface: pygame.Surface, other_surface: pygame.Surface
+    ) -> bool:
+        """
+        Description:
+            Returns whether the inputted surfaces would draw the same pixels, even if they are different objects
+        Input:
+            pygame.Surface surface: First surface to compare
+            pygame.Surface other_surface: Second surface to compare
+        Output:
+            boolean: Returns whether the surfaces have the same size, transparency, and pixels
+        """
+        return (
+            surface.get_size() == other_surface.get_size()
+            and surface.get_colorkey() == other_surface.get_colorkey()
+            and surface.get_alpha() == other_surface.get_alpha()
+            and pygame.image.tobytes(surface, "RGBA")
+            == pygame.image.tobytes(other_surface, "RGBA")
+        )
+
+    def discard_identical_blits(
+        self, removed_operations: Counter, added_operations: Counter
+    ) -> None:
+        """
+        Description:
+            Discards each added blit that draws the same pixels at the same position as a removed blit, along with that removed blit - a
+                surface recreated each frame with unchanged contents doesn't change the display
+        Input:
+            Counter removed_operations: Operations in the previous frame but not the current frame, whose counts are reduced in place
+            Counter added_operations: Operations in the current frame but not the previous frame, whose counts are reduced in place
+        Output:
+            None
+        """
+        removed_blits = [
+            operation for operation in removed_operations if operation[0] == "blit"
+        ]
+        for operation in [
+            operation for operation in added_operations if operation[0] == "blit"
+        ]:
+            for removed_operation in removed_blits:
+                if (
+                    removed_operations[removed_operation] > 0
+                    and removed_operation[2] == operation[2]
+                    and self.surfaces_identical(removed_operation[1], operation[1])
+                ):
+                    matches = min(
+                        removed_operations[removed_operation],
+                        added_operations[operation],
+                    )
+                    removed_operations[removed_operation] -= matches
+                    added_operations[operation] -= matches
+                    if added_operations[operation] == 0:
+                        break
+
+    def begin_frame(self) -> None:
+        """
+        Starts recording the draw operations of a retained frame
+        """
+        self.recording = True
+        self.draw_operations = []
+
+    def end_frame(self) -> List[pygame.Rect]:
+        """
+        Description:
+            Stops recording the current frame, then redraws each region where its draw operations differ from the previous frame's, other
+                than blits of recreated surfaces with unchanged pixels
+        Input:
+            None
+        Output:
+            pygame.Rect list: Returns the redrawn regions, which are the only regions of the display that need to be updated
+        """
+        self.recording = False
+        display_rect = constants.game_display.get_rect()
+        if self.redraw_all:
+            dirty_rects = [display_rect]
+        elif self.draw_operations == self.previous_draw_operations:
+            dirty_rects = []
+        else:
+            previous_operations = Counter(self.previous_draw_operations)
+            current_operations = Counter(self.draw_operations)
+            removed_operations = previous_operations - current_operations
+            added_operations = current_operations - previous_operations
+            if removed_operations or added_operations:
+                self.discard_identical_blits(removed_operations, added_operations)
+                dirty_rects = [
+                    self.get_operation_rect(operation)
+                    for operation in removed_operations + added_operations
+                ]
+            else:  # If the same operations were reordered, any overlapping operations may have changed which is in front
+                dirty_rects = [display_rect]
+        dirty_rects += self.dirty_rects
+        dirty_rects = [
+            rect.clip(display_rect)
+            for rect in dirty_rects
+            if rect.colliderect(display_rect)
+        ]
+        if len(dirty_rects) > MAX_DIRTY_RECTS:
+            dirty_rects = [dirty_rects[0].unionall(dirty_rects[1:])]
+
+        for dirty_rect in dirty_rects:
+            constants.game_display.set_clip(dirty_rect)
+            for operation in self.draw_operations:
+                if self.get_operation_rect(operation).colliderect(dirty_rect):
+                    self.execute(operation)
+        constants.game_display.set_clip(None)
+
+        self.previous_draw_operations = self.draw_operations
+        self.draw_operations = []
+        self.dirty_rects = []
+        self.redraw_all = False
+        self.frame_changed = len(dirty_rects) > 0
+        return dirty_rects
+
+    def has_dirty_regions(self) -> bool:
+        """
+        Returns whether the previous retained frame changed the display or any region is waiting to be redrawn - either may mean an animation is
+            in progress
+        """
+        return self.frame_changed or self.redraw_all or len(self.dirty_rects) > 0
+
+    def mark_dirty(self, rect) -> None:
+        """
+        Description:
+            Marks the inputted region of the display to be redrawn and updated next retained frame, such as after drawing directly on the display
+        Input:
+            pygame.Rect/tuple rect: Region to redraw
+        Output:
+            None
+        """
+        if self.retained_mode_active():
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def mark_all_dirty(self) -> None:
+        """
+        Marks the entire display to be redrawn and updated next retained frame, such as after a loading screen
+        """
+        self.redraw_all = True
@@ -59,7 +59,7 @@ class save_load_manager:
         Creates a new game and leaves the main menu
         """
         game_transitions.start_loading()
-        status.cached_images = {}
+        constants.ImageCacheManager.clear()
         flags.creating_new_game = True
         flags.victories_this_game = []
 
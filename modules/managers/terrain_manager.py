@@ -2,6 +2,8 @@
 
 import json
 import os
+import itertools
+import numpy as np
 from typing import List, Dict, Any
 from modules.constants import constants, status, flags
 
@@ -25,6 +27,10 @@ class terrain_manager:
         self.terrain_range_dict: Dict[str, Dict[str, Any]] = {}
 
         self.terrain_list: List[str] = []  # List of all terrain names
+
+        # Dense table of terrain_list indices, indexed by [temperature - minimum_temperature, roughness, vegetation, soil, water]
+        self.terrain_table: np.ndarray = None
+        self.minimum_temperature: int = 0
         self.terrain_parameter_keywords = {
             constants.KNOWLEDGE: {
                 0: "orbital view",
@@ -218,20 +224,89 @@ class terrain_manager:
                     current_variant += 1
                 current_variant -= 1  # back up from index that didn't work
                 self.terrain_variant_dict[special_terrain] = current_variant + 1
+        self.compile_terrain_table()
+
+    def compile_terrain_table(self) -> None:
+        """
+        Description:
+            Compiles parameter_to_terrain into a dense table of terrain_list indices, covering every possible location temperature
+                Temperatures without a defined terrain use the closest temperature from 0 to 5, which the terrain hypercube fully defines
+        Input:
+            None
+        Output:
+            None
+        """
+        temperatures = self.terrain_parameter_keywords[constants.TEMPERATURE].keys()
+        self.minimum_temperature = min(temperatures)
+        terrain_indices = {
+            terrain_name: index for index, terrain_name in enumerate(self.terrain_list)
+        }
+        self.terrain_table = np.zeros(
+            (max(temperatures) - self.minimum_temperature + 1, 6, 6, 6, 6),
+            dtype=np.int16,
+        )
+        for temperature, roughness, vegetation, soil, water in itertools.product(
+            range(self.minimum_temperature, max(temperatures) + 1),
+            range(6),
+            range(6),
+            range(6),
+            range(6),
+        ):
+            parameters = f"{roughness + 1}{vegetation + 1}{soil + 1}{water + 1}"
+            terrain_name = self.parameter_to_terrain.get(
+                f"{temperature + 1}{parameters}",
+                self.parameter_to_terrain.get(
+                    f"{max(min(temperature + 1, 6), 1)}{parameters}"
+                ),
+            )
+            self.terrain_table[
+                temperature - self.minimum_temperature,
+                roughness,
+                vegetation,
+                soil,
+                water,
+            ] = terrain_indices[terrain_name]
 
-    def classify(self, terrain_parameters):
+    def classify(
+        self, temperature: int, roughness: int, vegetation: int, soil: int, water: int
+    ) -> str:
         """
         Description:
             Classifies the inputted terrain parameters into a terrain type
         Input:
-            dictionary terrain_parameters: Dictionary of terrain parameters to classify
+            int temperature: Temperature to classify
+            int roughness: Roughness to classify
+            int vegetation: Vegetation to classify
+            int soil: Soil to classify
+            int water: Water to classify
         Output:
             string: Returns the terrain type that the inputted parameters classify as
         """
-        unbounded_temperature = f"{terrain_parameters['temperature'] + 1}{terrain_parameters['roughness'] + 1}{terrain_parameters['vegetation'] + 1}{terrain_parameters['soil'] + 1}{terrain_parameters['water'] + 1}"
-        default = f"{max(min(terrain_parameters['temperature'] + 1, 6), 1)}{terrain_parameters['roughness'] + 1}{terrain_parameters['vegetation'] + 1}{terrain_parameters['soil'] + 1}{terrain_parameters['water'] + 1}"
-        # Check -5 to 12 for temperature but use 1-6 if not defined
-        # Terrain hypercube is fully defined within 1-6, but temperature terrains can exist outside of this range
-        return self.parameter_to_terrain.get(
-            unbounded_temperature, self.parameter_to_terrain[default]
-        )
+        return self.terrain_list[
+            self.terrain_table[
+                temperature - self.minimum_temperature,
+                roughness,
+                vegetation,
+                soil,
+                water,
+            ]
+        ]
+
+    def classify_arrays(
+        self, terrain_parameter_arrays: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Description:
+            Classifies every location of the inputted terrain parameter arrays at once
+        Input:
+            dictionary terrain_parameter_arrays: Dictionary of terrain parameter names to arrays of values, like a world handler's terrain_parameter_arrays
+        Output:
+            ndarray: Returns an array of terrain_list indices, with the same shape as the inputted arrays
+        """
+        return self.terrain_table[
+            terrain_parameter_arrays[constants.TEMPERATURE] - self.minimum_temperature,
+            terrain_parameter_arrays[constants.ROUGHNESS],
+            terrain_parameter_arrays[constants.VEGETATION],
+            terrain_parameter_arrays[constants.SOIL],
+            terrain_parameter_arrays[constants.WATER],
+        ]
@@ -0,0 +1,73 @@
+# Contains retained interface visibility singleton
+
+from typing import List, Any
+from modules.constants import constants, status, flags
+
+
+class visibility_manager:
+    """
+    Object that retains the result of each interface traversal - each element's showing attribute caches its effective visibility, and the
+        visible elements are compiled into a flat draw list in layer order
+    While in retained visibility mode, frames reuse the compiled draw list until the visibility version is invalidated through the event bus,
+        such as by game mode changes, displayed actor changes, permission changes, interface element creation or removal, input, or timed jobs
+    """
+
+    def __init__(self):
+        """
+        Initializes this object
+        """
+        self.version: int = 0
+        self.compiled_version: int = None
+        self.draw_list: List[Any] = []
+        for endpoint in [
+            constants.INTERFACE_VISIBILITY_ENDPOINT,
+            constants.DISPLAYED_LOCATION_ENDPOINT,
+            constants.DISPLAYED_MOB_ENDPOINT,
+            constants.DISPLAYED_MOB_INVENTORY_ENDPOINT,
+            constants.DISPLAYED_LOCATION_INVENTORY_ENDPOINT,
+            constants.DISPLAYED_MINISTER_ENDPOINT,
+        ]:  # Subscribing to each endpoint invalidates on any of its routes, like DISPLAYED_MOB_ENDPOINT/MOB_SET_PERMISSION_ROUTE
+            constants.EventBus.subscribe(self.invalidate, endpoint)
+
+    def retained_mode_active(self) -> bool:
+        """
+        Returns whether frames should reuse the compiled draw list while the visibility version is unchanged
+        """
+        return constants.EffectManager.effect_active("retained_visibility")
+
+    def invalidate(self) -> None:
+        """
+        Invalidates the compiled draw list, causing the next frame to re-traverse the interface and re-evaluate each element's can_show()
+        """
+        self.version += 1
+
+    def is_current(self) -> bool:
+        """
+        Description:
+            Returns whether the compiled draw list can be reused for this frame - frames outside of the player's turn always re-traverse, since
+                turn processing changes the interface without input
+        Input:
+            None
+        Output:
+            boolean: Returns whether the compiled draw list is up to date
+        """
+        return (
+            self.retained_mode_active()
+            and self.compiled_version == self.version
+            and flags.player_turn
+            and not flags.loading
+        )
+
+    def compile(self, draw_list: List[Any], version: int) -> None:
+        """
+        Description:
+            Records the inputted draw list as the visible elements for the inputted visibility version
+        Input:
+            interface_element list draw_list: Each visible element that can draw, in layer order
+            int version: Visibility version when the traversal started - if anything was invalidated during the traversal, the next frame
+                traverses again
+        Output:
+            None
+        """
+        self.draw_list = draw_list
+        self.compiled_version = version
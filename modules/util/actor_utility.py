@@ -137,6 +137,9 @@ def calibrate_actor_info_display(info_display, new_actor, override_exempt=False)
     if new_actor:
         target = new_actor
     info_display.calibrate(target, override_exempt)
+    constants.EventBus.publish(
+        constants.INTERFACE_VISIBILITY_ENDPOINT, constants.CALIBRATE_INFO_DISPLAY_ROUTE
+    )
 
     if not flags.choosing_destination:  # Don't change tabs while choosing destination
         if info_display == status.mob_info_display:
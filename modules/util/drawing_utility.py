@@ -29,7 +29,7 @@ def display_image(image, x, y):
     Output:
         None
     """
-    constants.game_display.blit(image, (x, y))
+    constants.RenderManager.draw(("blit", image, (x, y)))
 
 
 def display_image_angle(image, x, y, angle):
@@ -47,4 +47,35 @@ def display_image_angle(image, x, y, angle):
     topleft = (x, y)
     rotated_image = pygame.transform.rotate(image, angle)
     new_rect = rotated_image.get_rect(center=image.get_rect(topleft=topleft).center)
-    constants.game_display.blit(rotated_image, new_rect.topleft)
+    constants.RenderManager.draw(("blit", rotated_image, tuple(new_rect.topleft)))
+
+
+def draw_rect(color, rect, width=0):
+    """
+    Description:
+        Draws the inputted rectangle
+    Input:
+        int tuple color: RGB color of the rectangle
+        pygame.Rect/tuple rect: Rectangle to draw
+        int width = 0: Width of the rectangle's outline, or 0 to fill it
+    Output:
+        None
+    """
+    constants.RenderManager.draw(("rect", tuple(color), tuple(rect), width))
+
+
+def draw_line(color, start_pos, end_pos, width=1):
+    """
+    Description:
+        Draws a line between the inputted coordinates
+    Input:
+        int tuple color: RGB color of the line
+        int tuple start_pos: Pixel coordinates of the start of the line
+        int tuple end_pos: Pixel coordinates of the end of the line
+        int width = 1: Width of the line
+    Output:
+        None
+    """
+    constants.RenderManager.draw(
+        ("line", tuple(color), tuple(start_pos), tuple(end_pos), width)
+    )
@@ -94,6 +94,9 @@ def set_game_mode(new_game_mode):
                 previous_game_mode=previous_game_mode, new_game_mode=new_game_mode
             )
         constants.current_game_mode = new_game_mode
+        constants.EventBus.publish(
+            constants.INTERFACE_VISIBILITY_ENDPOINT, constants.SET_GAME_MODE_ROUTE
+        )
         if new_game_mode == constants.STRATEGIC_MODE:
             constants.default_text_box_height = constants.font_size * 5.5
             constants.text_box_height = constants.default_text_box_height
@@ -10,6 +10,7 @@ from modules.util import (
     minister_utility,
     turn_management_utility,
     world_utility,
+    drawing_utility,
 )
 from modules.constants import constants, status, flags
 
@@ -25,45 +26,44 @@ def main_loop():
     """
     locked = False
     while not flags.crashed:
+        constants.FrameProfiler.start_frame()
         if not flags.loading:
             update_display()
         else:
             draw_loading_screen()
         constants.InputManager.update_input()
+        constants.FrameProfiler.start_phase("event_handling")
         for event in pygame.event.get():
             flags.capital = flags.r_shift or flags.l_shift
             flags.ctrl = flags.r_ctrl or flags.l_ctrl
+            if event.type != pygame.MOUSEMOTION:
+                constants.EventBus.publish(
+                    constants.INTERFACE_VISIBILITY_ENDPOINT, constants.INPUT_EVENT_ROUTE
+                )  # Any input other than moving the mouse may change what is showing
             match event.type:
                 case pygame.QUIT:
                     flags.crashed = True
                 case pygame.KEYDOWN:
                     if flags.typing or not locked:
-                        button_keybind_clicked = False
-                        for current_button in status.button_list:
-                            if (
-                                event.key == current_button.keybind_id
-                                and (
-                                    current_button.showing
-                                    or (
-                                        current_button.has_button_press_override
-                                        and current_button.button_press_override()
-                                    )
-                                )
-                                and not flags.typing
-                                and not button_keybind_clicked
+                        pressed_button = None
+                        if not flags.typing:
+                            for current_button in constants.KeybindManager.get_buttons(
+                                event.key
                             ):
-                                if (
-                                    current_button.has_released
-                                ):  # if stuck on loading, don't want multiple 'key down' events to repeat on_click - shouldn't on_click again until released
-                                    current_button.has_released = False
-                                    current_button.being_pressed = True
-                                    current_button.on_click()
-                                    button_keybind_clicked = True  # Prevent any other buttons from being activated by this button press
-                                    current_button.showing_outline = True
-                                break
-                            else:
-                                current_button.confirming = False
-                                current_button.being_pressed = False
+                                if current_button.showing or (
+                                    current_button.has_button_press_override
+                                    and current_button.button_press_override()
+                                ):
+                                    pressed_button = current_button
+                                    if (
+                                        current_button.has_released
+                                    ):  # if stuck on loading, don't want multiple 'key down' events to repeat on_click - shouldn't on_click again until released
+                                        current_button.has_released = False
+                                        current_button.being_pressed = True
+                                        current_button.on_click()
+                                        current_button.showing_outline = True
+                                    break  # Prevent any other buttons from being activated by this button press
+                        constants.KeybindManager.press(pressed_button)
                         match event.key:
                             case pygame.K_RSHIFT:
                                 flags.r_shift = True
@@ -98,15 +98,16 @@ def main_loop():
 
                 case pygame.KEYUP:
                     locked = False
-                    for current_button in status.button_list:
+                    for current_button in constants.KeybindManager.get_buttons(
+                        event.key
+                    ):
                         if (
                             not flags.typing
                             or current_button.keybind_id == pygame.K_TAB
                             or current_button.keybind_id == pygame.K_e
                         ):
                             if current_button.has_keybind:
-                                if event.key == current_button.keybind_id:
-                                    current_button.on_release()
+                                current_button.on_release()
                     match event.key:
                         case pygame.K_RSHIFT:
                             flags.r_shift = False
@@ -146,7 +147,9 @@ def main_loop():
                 clicked_button = False
                 stopping = False
                 if status.current_instructions_page == None:
-                    for current_button in status.button_list:  # here
+                    for current_button in constants.HitTestManager.get_candidates(
+                        constants.BUTTON_HIT_LAYER
+                    ):
                         if (
                             current_button.touching_mouse()
                             and current_button.showing
@@ -167,7 +170,9 @@ def main_loop():
                         clicked_button = True
                         stopping = True
                 if not stopping:
-                    for current_button in status.button_list:
+                    for current_button in constants.HitTestManager.get_candidates(
+                        constants.BUTTON_HIT_LAYER
+                    ):
                         if current_button.touching_mouse() and current_button.showing:
                             current_button.on_rmb_click()
                             current_button.on_rmb_release()
@@ -180,7 +185,9 @@ def main_loop():
                 allow_on_click = True  # Certain buttons, like panels, allow clicking on another button at the same time
                 stopping = False
                 if status.current_instructions_page == None:
-                    for current_button in status.button_list:
+                    for current_button in constants.HitTestManager.get_candidates(
+                        constants.BUTTON_HIT_LAYER
+                    ):
                         if (
                             current_button.touching_mouse()
                             and current_button.showing
@@ -205,7 +212,11 @@ def main_loop():
                         break
 
                 if not stopping:
-                    for current_button in reversed(status.button_list):
+                    for current_button in reversed(
+                        constants.HitTestManager.get_candidates(
+                            constants.BUTTON_HIT_LAYER
+                        )
+                    ):
                         if (
                             current_button.touching_mouse()
                             and current_button.showing
@@ -224,21 +235,32 @@ def main_loop():
                 )  # Whether button was clicked or not determines whether characters are deselected
 
         if flags.lmb_down or flags.rmb_down:
-            for current_button in status.button_list:
-                if current_button.touching_mouse() and current_button.showing:
+            touched_buttons = set(
+                constants.HitTestManager.get_candidates(constants.BUTTON_HIT_LAYER)
+            )
+            for current_button in (
+                touched_buttons | status.outlined_buttons
+            ):  # Buttons that are neither under the mouse nor outlined are unaffected
+                if (
+                    current_button in touched_buttons
+                    and current_button.touching_mouse()
+                    and current_button.showing
+                ):
                     current_button.showing_outline = True
                 elif not current_button.being_pressed:
                     current_button.showing_outline = False
         else:
-            for current_button in status.button_list:
+            for current_button in status.outlined_buttons.copy():
                 if current_button.has_released:
                     current_button.showing_outline = False
+        constants.FrameProfiler.end_phase()
 
         constants.current_time = time.time()
         if constants.current_time - constants.last_selection_outline_switch > 1:
             flags.show_selection_outlines = not flags.show_selection_outlines
             constants.last_selection_outline_switch = constants.current_time
-        constants.JobScheduler.update(constants.current_time)
+        with constants.FrameProfiler.time_phase("jobs"):
+            constants.JobScheduler.update(constants.current_time)
         if (
             not flags.player_turn
             and constants.previous_turn_time + constants.end_turn_wait_time
@@ -257,6 +279,9 @@ def main_loop():
             if constants.EffectManager.effect_active("fast_turn"):
                 constants.end_turn_wait_time = 0
             constants.previous_turn_time = constants.current_time
+        constants.FrameProfiler.end_frame()
+        constants.FrameScheduler.end_frame()
+    constants.FrameProfiler.export()  # Write any frame records buffered since the last export
     pygame.quit()
 
 
@@ -264,6 +289,7 @@ def complete_globe_projection_rotation():
     """
     Completes the world and Earth globe projection rotations, setting them to their static version for the new player turn
     """
+    constants.GlobeRotationManager.stop()
     equatorial_coordinates = constants.TIME_PASSING_EQUATORIAL_COORDINATES
     constants.TIME_PASSING_ROTATION = 0
     status.current_world.update_globe_projection(
@@ -304,12 +330,21 @@ def increment_globe_projection_rotation():
             )
             % status.current_world.world_dimensions
         ]
-        status.current_world.update_globe_projection(
-            center_coordinates=current_coordinates,
-            update_button=constants.EffectManager.effect_active(
-                "rotate_game_mode_buttons"
-            ),
-        )
+        frame = constants.GlobeRotationManager.get_next_frame()
+        if frame:  # Show frame rendered ahead by worker thread, if ready
+            status.current_world.set_globe_projection(
+                *frame,
+                update_button=constants.EffectManager.effect_active(
+                    "rotate_game_mode_buttons"
+                ),
+            )
+        else:
+            status.current_world.update_globe_projection(
+                center_coordinates=current_coordinates,
+                update_button=constants.EffectManager.effect_active(
+                    "rotate_game_mode_buttons"
+                ),
+            )
         if constants.EffectManager.effect_active("save_global_projection"):
             pygame.image.save(
                 status.globe_projection_surface.convert_alpha(),
@@ -355,10 +390,18 @@ def update_display():
     Output:
         None
     """
+    retained_frame = (
+        constants.RenderManager.retained_mode_active() and not flags.loading
+    )
     if flags.loading:
         draw_loading_screen()
     else:
-        traversal_utility.draw_interface_elements(status.independent_interface_elements)
+        if retained_frame:  # Record this frame's draws, then only redraw what changed
+            constants.RenderManager.begin_frame()
+        with constants.FrameProfiler.time_phase("interface_traversal"):
+            traversal_utility.draw_interface_elements(
+                status.independent_interface_elements
+            )
         # could modify with a layer dictionary to display elements on different layers - currently, drawing elements in order of collection creation is working w/o overlap
         # issues
 
@@ -373,16 +416,31 @@ def update_display():
         if (
             time.time() > constants.mouse_moved_time + 0.15
         ):  # Wait until mouse is still before drawing tooltips
-            tooltip_drawer = detect_tooltip_drawer()
+            with constants.FrameProfiler.time_phase("tooltip_detection"):
+                tooltip_drawer = detect_tooltip_drawer()
 
         if tooltip_drawer:
-            manage_tooltip_drawing(tooltip_drawer)
+            with constants.FrameProfiler.time_phase("tooltip_drawing"):
+                manage_tooltip_drawing(tooltip_drawer)
+
+        constants.FrameProfiler.draw()
 
         if (constants.old_mouse_x, constants.old_mouse_y) != pygame.mouse.get_pos():
             constants.mouse_moved_time = constants.current_time
             constants.old_mouse_x, constants.old_mouse_y = pygame.mouse.get_pos()
 
-    pygame.display.update()
+    constants.FrameProfiler.start_phase("display_update")
+    if retained_frame:
+        dirty_rects = constants.RenderManager.end_frame()
+        if dirty_rects:
+            # A static screen should redraw nothing - rects printed while nothing visibly changes come from surfaces recreated each frame
+            if constants.EffectManager.effect_active("debug_dirty_rects"):
+                print(f"Dirty rects: {dirty_rects}")
+            pygame.display.update(dirty_rects)
+    else:
+        constants.RenderManager.mark_all_dirty()  # Redraw everything if retained rendering resumes
+        pygame.display.update()
+    constants.FrameProfiler.end_phase()
 
     if constants.EffectManager.effect_active("track_fps"):
         current_time = time.time()
@@ -416,7 +474,9 @@ def detect_tooltip_drawer():
         return status.current_instructions_page
 
     tooltip_drawer = None
-    for current_button in status.button_list:
+    for current_button in constants.HitTestManager.get_candidates(
+        constants.BUTTON_HIT_LAYER
+    ):
         if current_button.can_show_tooltip():
             if current_button.in_notification:
                 return current_button  # Notifications take precedence over other interface elements, which they cover
@@ -425,19 +485,15 @@ def detect_tooltip_drawer():
     if tooltip_drawer:
         return tooltip_drawer
 
-    for current_grid in status.grid_list:
-        tooltip_drawer = next(
-            (
-                current_cell
-                for current_cell in current_grid.get_flat_cell_list()
-                if current_cell.can_show_tooltip()
-            ),
-            None,
-        )
-        if tooltip_drawer:
-            return tooltip_drawer
+    for current_cell in constants.HitTestManager.get_candidates(
+        constants.CELL_HIT_LAYER
+    ):  # Cells are registered in grid order
+        if current_cell.can_show_tooltip():
+            return current_cell
 
-    for current_free_image in status.free_image_list:
+    for current_free_image in constants.HitTestManager.get_candidates(
+        constants.FREE_IMAGE_HIT_LAYER
+    ):
         if current_free_image.can_show_tooltip():
             return current_free_image
 
@@ -471,6 +527,7 @@ def draw_loading_screen():
     Output:
         None
     """
+    constants.RenderManager.mark_all_dirty()  # Loading screen covers the retained frame
     status.loading_image.draw()
     status.loading_screen_quote_banner.showing = True
     status.loading_screen_quote_banner.draw()
@@ -483,15 +540,18 @@ def draw_loading_screen():
             pygame.event.get()
             for current_button in status.button_list:
                 current_button.on_release()
+            pygame.display.update()
             while True:
-                for event in pygame.event.get():
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                        return
-                    elif event.type == pygame.QUIT:
-                        pygame.quit()
-                        return
-                    elif event.type == constants.music_endevent:
-                        constants.SoundManager.song_done()
+                event = (
+                    pygame.event.wait()
+                )  # Block until input rather than redrawing the unchanged loading screen
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                    return
+                elif event.type == pygame.QUIT:
+                    pygame.quit()
+                    return
+                elif event.type == constants.music_endevent:
+                    constants.SoundManager.song_done()
                 pygame.display.update()
 
 
@@ -584,24 +644,18 @@ def draw_tooltip(tooltip, below_screen, beyond_screen, height, width, y_displace
     tooltip["box"].y = mouse_y
     tooltip["outline"].x = tooltip["box"].x - tooltip["outline_width"]
     tooltip["outline"].y = tooltip["box"].y - tooltip["outline_width"]
-    pygame.draw.rect(
-        constants.game_display,
-        constants.color_dict[constants.COLOR_BLACK],
-        tooltip["outline"],
+    drawing_utility.draw_rect(
+        constants.color_dict[constants.COLOR_BLACK], tooltip["outline"]
     )
-    pygame.draw.rect(
-        constants.game_display,
-        constants.color_dict[constants.COLOR_WHITE],
-        tooltip["box"],
+    drawing_utility.draw_rect(
+        constants.color_dict[constants.COLOR_WHITE], tooltip["box"]
     )
     for text_line_index in range(len(tooltip["text"])):
         text_line = tooltip["text"][text_line_index]
-        constants.game_display.blit(
+        drawing_utility.display_image(
             text_utility.text(text_line, constants.myfont),
-            (
-                tooltip["box"].x + scaling.scale_width(10),
-                tooltip["box"].y + (text_line_index * constants.fonts["default"].size),
-            ),
+            tooltip["box"].x + scaling.scale_width(10),
+            tooltip["box"].y + (text_line_index * constants.fonts["default"].size),
         )
 
 
@@ -641,8 +695,7 @@ def draw_text_box():
         )  # manages width of user input
     text_box_width = greatest_width + scaling.scale_width(10)
     x, y = (0, constants.display_height - constants.text_box_height)
-    pygame.draw.rect(
-        constants.game_display,
+    drawing_utility.draw_rect(
         constants.color_dict[constants.COLOR_WHITE],
         (x, y, text_box_width, constants.text_box_height),
     )  # draws white rect to prevent overlapping
@@ -650,19 +703,17 @@ def draw_text_box():
         color = constants.COLOR_RED
     else:
         color = constants.COLOR_BLACK
-    pygame.draw.rect(
-        constants.game_display,
+    drawing_utility.draw_rect(
         constants.color_dict[color],
         (x, y, text_box_width, constants.text_box_height),
         scaling.scale_height(3),
     )  # black text box outline
-    pygame.draw.line(
-        constants.game_display,
+    drawing_utility.draw_line(
         constants.color_dict[color],
         (
             0,
             constants.display_height - (font.size + scaling.scale_height(5)),
-        ),  # input line
+        ),
         (
             text_box_width,
             constants.display_height - (font.size + scaling.scale_height(5)),
@@ -675,32 +726,26 @@ def draw_text_box():
 
     for text_index in range(len(status.text_list)):
         if text_index < max_text_box_lines:
-            textsurface = constants.myfont.pygame_font.render(
-                status.text_list[(-1 * text_index) - 1], False, (0, 0, 0)
+            textsurface = text_utility.text(
+                status.text_list[(-1 * text_index) - 1], constants.myfont
             )
-            constants.game_display.blit(
+            drawing_utility.display_image(
                 textsurface,
-                (
-                    scaling.scale_width(10),
-                    (-1 * font.size * text_index)
-                    + constants.display_height
-                    - ((2 * font.size) + scaling.scale_height(5)),
-                ),
+                scaling.scale_width(10),
+                (-1 * font.size * text_index)
+                + constants.display_height
+                - ((2 * font.size) + scaling.scale_height(5)),
             )
     if constants.InputManager.taking_input:
-        textsurface = constants.myfont.pygame_font.render(
-            "Response: " + constants.message, False, (0, 0, 0)
+        textsurface = text_utility.text(
+            "Response: " + constants.message, constants.myfont
         )
     else:
-        textsurface = constants.myfont.pygame_font.render(
-            constants.message, False, (0, 0, 0)
-        )
-    constants.game_display.blit(
+        textsurface = text_utility.text(constants.message, constants.myfont)
+    drawing_utility.display_image(
         textsurface,
-        (
-            scaling.scale_width(10),
-            constants.display_height - (font.size + scaling.scale_height(5)),
-        ),
+        scaling.scale_width(10),
+        constants.display_height - (font.size + scaling.scale_height(5)),
     )
 
 
@@ -986,3 +1031,5 @@ def debug_print():
         None
     """
     print("")
+    if constants.EffectManager.effect_active("debug_image_cache"):
+        constants.ImageCacheManager.print_statistics()
@@ -67,6 +67,9 @@ def calibrate_minister_info_display(new_minister):
     if status.displayed_minister:
         target = new_minister
     status.minister_info_display.calibrate(target)
+    constants.EventBus.publish(
+        constants.INTERFACE_VISIBILITY_ENDPOINT, constants.CALIBRATE_INFO_DISPLAY_ROUTE
+    )
     flags.show_selection_outlines = True
     constants.last_selection_outline_switch = constants.current_time
 
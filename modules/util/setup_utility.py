@@ -11,6 +11,7 @@ from modules.managers import (
     terrain_manager,
     value_tracker,
     notification_manager,
+    visibility_manager,
 )
 from modules.util import (
     scaling,
@@ -59,6 +60,44 @@ def setup(*args):
     flags.creating_new_game = False
 
 
+def setup_game():
+    """
+    Description:
+        Runs every setup function needed to start the game, in order
+    Input:
+        None
+    Output:
+        None
+    """
+    setup(
+        misc,
+        item_types_config,
+        terrain_feature_types_config,
+        minister_types_config,
+        building_types_config,
+        unit_types_config,
+        new_game_setup_screen,
+        info_displays,
+        transactions,
+        actions,
+        value_trackers,
+        buttons,
+        earth_screen,
+        ministers_screen,
+        trial_screen,
+        location_interface,
+        mob_interface,
+        organization_interface,
+        vehicle_organization_interface,
+        unit_organization_interface,
+        terrain_interface,
+        settlement_interface,
+        inventory_interface,
+        mob_sub_interface,
+        minister_interface,
+    )
+
+
 def info_displays():
     """
     Description:
@@ -100,6 +139,7 @@ def misc():
     """
     constants.ActorCreationManager = actor_creation_manager.actor_creation_manager()
     constants.TerrainManager = terrain_manager.terrain_manager()
+    constants.VisibilityManager = visibility_manager.visibility_manager()
 
     constants.font_size = scaling.scale_height(constants.default_font_size)
     constants.notification_font_size = scaling.scale_height(
@@ -3432,6 +3472,19 @@ def terrain_interface():
             )
         )
 
+    status.orbital_view_color_free_image = (
+        constants.ActorCreationManager.create_interface_element(
+            {
+                "coordinates": (0, 200),
+                "image_id": "misc/empty.png",
+                "modes": [],
+                "width": 8,
+                "height": 8,
+                "init_type": constants.FREE_IMAGE,
+            }
+        )
+    )  # Used to find each location's average color in the globe projection
+
 
 def organization_interface():
     """
@@ -0,0 +1,352 @@
+# Contains vectorized functions that operate on world terrain parameter arrays, treating each array as a wrap-around torus
+
+import random
+import bisect
+import numpy as np
+from typing import List, Tuple
+
+NEIGHBOR_SHIFTS: Tuple[Tuple[int, int], ...] = (
+    (1, 0),
+    (-1, 0),
+    (1, 1),
+    (-1, 1),
+)  # (shift, axis) pairs for np.roll that align each location with its left, right, down, and up neighbors
+
+WALK_OFFSETS: np.ndarray = np.array(
+    [(-1, 0), (1, 0), (0, 1), (0, -1)]
+)  # (x, y) offsets to the left, right, up, and down neighbors, matching the order of each location's adjacent_list
+
+
+def get_generator() -> np.random.Generator:
+    """
+    Description:
+        Returns a NumPy random generator seeded from Python's random module, so that seeding random also seeds vectorized generation
+    Input:
+        None
+    Output:
+        Generator: Returns a NumPy random generator
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def smooth_step(
+    values: np.ndarray, direction: str = None, generator: np.random.Generator = None
+) -> Tuple[np.ndarray, bool]:
+    """
+    Description:
+        Applies 1 parallel smoothing pass to the inputted values - each location more than 1 away from any neighbor moves 1 towards them
+            If direction is None, emulates sequential smoothing in a random order - each location is given a random priority, and a location
+                only moves if it has a higher priority than each of its uneven neighbors, since moving either location of an uneven pair evens it
+    Input:
+        ndarray values: 2-dimensional array of parameter values
+        string direction: Up, down, or None - if up, locations can only increase, if down, locations can only decrease
+        Generator generator: Random generator for priorities when direction is None, defaulting to one seeded from Python's random module
+    Output:
+        ndarray: Returns a smoothed copy of the inputted values
+        bool: Returns True if any locations were more than 1 away from a neighbor, otherwise False
+    """
+    if generator == None:
+        generator = get_generator()
+    priorities = generator.random(values.shape)
+    higher_neighbors = np.zeros(values.shape, dtype=np.int8)
+    lower_neighbors = np.zeros(values.shape, dtype=np.int8)
+    blocked = np.zeros(values.shape, dtype=bool)
+    for shift, axis in NEIGHBOR_SHIFTS:
+        difference = np.roll(values, shift, axis=axis) - values
+        higher = difference >= 2
+        lower = difference <= -2
+        higher_neighbors += higher
+        lower_neighbors += lower
+        if direction == None:
+            blocked |= (higher | lower) & (
+                np.roll(priorities, shift, axis=axis) > priorities
+            )
+
+    if direction == "up":
+        new_values = values + (higher_neighbors > 0)
+    elif direction == "down":
+        new_values = values - (lower_neighbors > 0)
+    else:
+        new_values = values.copy()
+        for shift, axis in NEIGHBOR_SHIFTS:
+            # Each moving location compares itself to its neighbors in turn, moving 1 towards each neighbor still 2+ away
+            difference = np.roll(values, shift, axis=axis) - new_values
+            new_values += ~blocked & (difference >= 2)
+            new_values -= ~blocked & (difference <= -2)
+    uneven = bool(higher_neighbors.any())
+    return new_values, uneven
+
+
+def smooth_until_stable(
+    values: np.ndarray, direction: str = None, max_iterations: int = 1000
+) -> np.ndarray:
+    """
+    Description:
+        Repeatedly applies parallel smoothing passes until no location is more than 1 away from any neighbor
+    Input:
+        ndarray values: 2-dimensional array of parameter values
+        string direction: Up, down, or None - if up, locations can only increase, if down, locations can only decrease
+        int max_iterations: Maximum number of passes to apply, as a safeguard against unexpected oscillation
+    Output:
+        ndarray: Returns a smoothed copy of the inputted values
+    """
+    generator = get_generator()
+    for _ in range(max_iterations):
+        values, uneven = smooth_step(values, direction=direction, generator=generator)
+        if not uneven:
+            break
+    return values
+
+
+def random_walk_path(
+    start_x: int,
+    start_y: int,
+    length: int,
+    shape: Tuple[int, int],
+    generator: np.random.Generator = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Description:
+        Generates the path of a random walk that moves to a uniformly random adjacent location at each step
+    Input:
+        int start_x: x coordinate to start the walk from
+        int start_y: y coordinate to start the walk from
+        int length: Number of locations visited by the walk, including the starting location
+        int tuple shape: Shape of the wrap-around grid to walk on
+        Generator generator: Random generator for each step, defaulting to one seeded from Python's random module
+    Output:
+        ndarray: Returns the x coordinates visited by the walk, in order
+        ndarray: Returns the y coordinates visited by the walk, in order
+    """
+    if generator == None:
+        generator = get_generator()
+    offsets = np.zeros((max(length, 1), 2), dtype=np.int64)
+    offsets[1:] = WALK_OFFSETS[generator.integers(0, 4, size=max(length - 1, 0))]
+    path = (np.cumsum(offsets, axis=0) + (start_x, start_y)) % shape
+    return path[:length, 0], path[:length, 1]
+
+
+def get_walk_step_table(weights: np.ndarray) -> List[List[List[float]]]:
+    """
+    Description:
+        Returns the cumulative probability of each step of a weighted walk from each location, with the probability of each adjacent location
+            being chosen proportional to its weight
+        Tables only depend on the weights, so they can be kept and reused by each walk with the same weights
+    Input:
+        ndarray weights: 2-dimensional array of non-negative weights for each location
+    Output:
+        list: Returns nested lists of the cumulative probability of each of WALK_OFFSETS, indexed by [x][y] - nested lists are much faster than
+            arrays for scalar lookups
+    """
+    neighbor_weights = np.stack(
+        [
+            np.roll(weights, (-x_offset, -y_offset), axis=(0, 1))
+            for x_offset, y_offset in WALK_OFFSETS
+        ],
+        axis=-1,
+    ).astype(float)
+    cumulative_weights = np.cumsum(neighbor_weights, axis=-1)
+    return (cumulative_weights / cumulative_weights[..., -1:]).tolist()
+
+
+def weighted_walk_path(
+    start_x: int,
+    start_y: int,
+    length: int,
+    step_table: List[List[List[float]]],
+    generator: np.random.Generator = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Description:
+        Generates the path of a random walk that moves to an adjacent location at each step, with the probability of each adjacent location
+            being chosen proportional to its weight
+        Step probabilities for each location are precomputed, so each step is only a lookup and a bisection
+    Input:
+        int start_x: x coordinate to start the walk from
+        int start_y: y coordinate to start the walk from
+        int length: Number of locations visited by the walk, including the starting location
+        list step_table: Cumulative step probabilities from each location, as returned by get_walk_step_table
+        Generator generator: Random generator for each step, defaulting to one seeded from Python's random module
+    Output:
+        ndarray: Returns the x coordinates visited by the walk, in order
+        ndarray: Returns the y coordinates visited by the walk, in order
+    """
+    if generator == None:
+        generator = get_generator()
+    steps = WALK_OFFSETS.tolist()
+    width, height = len(step_table), len(step_table[0])
+    x_path, y_path = [0] * length, [0] * length
+    current_x, current_y = start_x, start_y
+    for index, draw in enumerate(generator.random(length).tolist()):
+        x_path[index], y_path[index] = current_x, current_y
+        x_offset, y_offset = steps[
+            bisect.bisect_right(step_table[current_x][current_y], draw)
+        ]
+        current_x = (current_x + x_offset) % width
+        current_y = (current_y + y_offset) % height
+    return np.array(x_path, dtype=np.int64), np.array(y_path, dtype=np.int64)
+
+
+def apply_walk(
+    values: np.ndarray,
+    x_path: np.ndarray,
+    y_path: np.ndarray,
+    change: int,
+    bound: int = 0,
+    set: bool = False,
+) -> np.ndarray:
+    """
+    Description:
+        Applies a change to each location visited by a walk, as if each visit were applied in order
+            Visits are accumulated per location, and each location receives as many of its visits' changes as fit within the bound
+        Returns values without clamping to any parameter limits
+    Input:
+        ndarray values: 2-dimensional array of parameter values
+        ndarray x_path: x coordinates visited by the walk, starting at the walk's origin
+        ndarray y_path: y coordinates visited by the walk, starting at the walk's origin
+        int change: Amount to change the value by at each visit
+        int bound: Maximum distance from the walk's original starting value that changed values can reach, or 0 if unbounded
+        bool set: True if the bound should be checked against the original starting value + change, rather than each location's value + change
+    Output:
+        ndarray: Returns a copy of the inputted values with the walk applied
+    """
+    visits = np.zeros(values.shape, dtype=np.int64)
+    if len(x_path) == 0 or change == 0:
+        return values.copy()
+    np.add.at(visits, (x_path, y_path), 1)
+    original_value = int(values[x_path[0], y_path[0]])
+    upper_bound, lower_bound = original_value + bound, original_value - bound
+    if bound == 0:
+        accepted = visits
+    elif set:
+        accepted = visits * (lower_bound <= original_value + change <= upper_bound)
+    else:
+        # A visit is rejected once value + change leaves the bound, and since the change is constant, every later visit is also rejected
+        if change > 0:
+            allowed = (upper_bound - values) // change
+        else:
+            allowed = (values - lower_bound) // -change
+        allowed[(values + change < lower_bound) | (values + change > upper_bound)] = 0
+        accepted = np.minimum(visits, allowed)
+    return values + (accepted * change).astype(values.dtype)
+
+
+def sample_best_candidate(
+    candidates: "ranked_pool",
+    num_samples: int,
+    generator: np.random.Generator,
+    ordered: bool = True,
+) -> int:
+    """
+    Description:
+        Returns the candidate that would be found by uniformly sampling num_samples of the inputted candidates with replacement and keeping the
+            best one, without drawing each sample - the best rank is drawn from the distribution of the minimum of num_samples uniform ranks
+    Input:
+        ranked_pool candidates: Flat indices of eligible locations, ordered from best to worst
+        int num_samples: Number of candidates that would be sampled
+        Generator generator: Random generator for the draws
+        bool ordered: True if the best candidate should be returned, False if any sampled candidate is equally good
+    Output:
+        int: Returns the flat index of the chosen candidate, or None if no candidates would be sampled
+    """
+    num_candidates = len(candidates)
+    if num_candidates == 0 or num_samples == 0:
+        return None
+    elif not ordered:
+        return int(candidates[generator.integers(0, num_candidates)])
+    rank = int(num_candidates * (1 - (1 - generator.random()) ** (1 / num_samples)))
+    return int(candidates[min(rank, num_candidates - 1)])
+
+
+class ranked_pool:
+    """
+    Pool of flat location indices ordered by an integer sort key, with ties ordered by a fixed random tie order
+    Each (key, tie order) pair has a slot in a Fenwick tree of slot counts, so adding, removing, and finding the candidate at a rank each take
+        O(log n) rather than copying the pool
+    """
+
+    def __init__(
+        self,
+        indices: np.ndarray,
+        keys: np.ndarray,
+        key_range: Tuple[int, int],
+        tie_order: np.ndarray,
+        tie_locations: List[int],
+    ):
+        """
+        Description:
+            Initializes this object
+        Input:
+            ndarray indices: Flat indices of the locations initially in this pool
+            ndarray keys: Sort key of each initial location, like its altitude
+            int tuple key_range: Minimum and maximum sort key of any location that could be added
+            ndarray tie_order: Random rank of each location among locations with the same key, indexed by flat index
+            int list tie_locations: Flat index of the location with each tie rank - the inverse of tie_order
+        Output:
+            None
+        """
+        self.min_key: int = key_range[0]
+        self.num_locations: int = len(tie_order)
+        self.tie_order: List[int] = tie_order.tolist()
+        self.tie_locations: List[int] = tie_locations
+        num_slots = (key_range[1] - key_range[0] + 1) * self.num_locations
+        slot_counts = np.zeros(num_slots + 1, dtype=np.int64)
+        slot_counts[
+            ((keys.astype(np.int64) - self.min_key) * self.num_locations)
+            + tie_order[indices]
+            + 1
+        ] = 1
+        prefix_counts = np.cumsum(slot_counts)
+        positions = np.arange(num_slots + 1)
+        self.tree: List[int] = (
+            prefix_counts - prefix_counts[positions - (positions & -positions)]
+        ).tolist()  # Each position holds the count of the (position & -position) slots ending at it
+        self.size: int = len(indices)
+        self.top_step: int = 1 << (num_slots.bit_length() - 1) if num_slots else 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of locations in this pool
+        """
+        return self.size
+
+    def __getitem__(self, rank: int) -> int:
+        """
+        Description:
+            Returns the location at the inputted rank, with rank 0 having the lowest key
+        Input:
+            int rank: Rank of the location to find, from 0 to len(self) - 1
+        Output:
+            int: Returns the flat index of the location at the inputted rank
+        """
+        position = 0
+        remaining = rank + 1
+        step = self.top_step
+        while step:
+            if (
+                position + step < len(self.tree)
+                and self.tree[position + step] < remaining
+            ):
+                position += step
+                remaining -= self.tree[position]
+            step >>= 1
+        return self.tie_locations[position % self.num_locations]
+
+    def update(self, index: int, key: int, change: int) -> None:
+        """
+        Description:
+            Adds or removes the inputted location from this pool
+        Input:
+            int index: Flat index of the location
+            int key: Sort key of the location
+            int change: 1 to add the location, or -1 to remove it
+        Output:
+            None
+        """
+        position = (
+            ((key - self.min_key) * self.num_locations) + self.tie_order[index] + 1
+        )
+        while position < len(self.tree):
+            self.tree[position] += change
+            position += position & -position
+        self.size += change
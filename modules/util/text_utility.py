@@ -7,7 +7,8 @@ from modules.constants import constants, status, flags
 def text(message, font):
     """
     Description:
-        Returns a rendered pygame.Surface of the inputted text
+        Returns a rendered pygame.Surface of the inputted text, reusing the cached surface if the same text was already rendered - text is drawn
+            every frame, so reusing surfaces also lets retained rendering recognize unchanged text
     Input:
         string message: Text to be rendered
         font font: Constructs font with which the text is rendered
@@ -15,7 +16,11 @@ def text(message, font):
         pygame.Surface: Rendered pygame.Surface of the inputted text
     """
     try:
-        text_surface = font.pygame_font.render(message, False, font.color)
+        key = ("text", message, font, str(font.color))
+        text_surface = constants.ImageCacheManager.get(key)
+        if text_surface == None:
+            text_surface = font.pygame_font.render(message, False, font.color)
+            constants.ImageCacheManager.set(key, text_surface)
     except:
         text_surface = pygame.Surface(
             (1, 1), pygame.HWSURFACE | pygame.DOUBLEBUF
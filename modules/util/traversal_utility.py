@@ -8,21 +8,27 @@ def draw_interface_elements(interface_elements):
     Description:
         Recursively traverses through each of the inputted interface elements and their member trees, updating each element's showing attribute to its current can_show()
             value and, if it showing, drawing it - if an element is not showing, elements below it can not show either
+        While the retained visibility is current, skips the traversal and draws the elements that were showing after the previous traversal
     Input:
         interface_element list interface_elements: List of interface elements to traverse through - no element in the list should be a member of any other element in the
             list, either directly or indirectly. This will preferably be the list of all 'root' elements
     """
-    for current_interface_element in interface_elements:
-        collection_traversal(
-            current_interface_element,
-            pretraversal_action=set_showing,
-            alternative_action=set_not_showing,
-            condition=check_showing,
-            posttraversal_action=update_collection,
-        )
-    for current_interface_element in status.draw_list:
+    if (
+        not constants.VisibilityManager.is_current()
+    ):  # Otherwise, no element's visibility can have changed since the previous traversal
+        version = constants.VisibilityManager.version
+        for current_interface_element in interface_elements:
+            collection_traversal(
+                current_interface_element,
+                pretraversal_action=set_showing,
+                alternative_action=set_not_showing,
+                condition=check_showing,
+                posttraversal_action=update_collection,
+            )
+        constants.VisibilityManager.compile(status.draw_list, version)
+        status.draw_list = []
+    for current_interface_element in constants.VisibilityManager.draw_list:
         current_interface_element.draw()
-    status.draw_list = []
 
 
 def collection_traversal(current_element, **kwargs):
@@ -94,6 +100,7 @@ def set_showing(current_element):
     """
     old_showing = current_element.showing
     current_element.showing = current_element.can_show()
+    constants.HitTestManager.set_visible(current_element, current_element.showing)
     return (
         old_showing or current_element.showing
     )  # if wasn't showing and still not showing, lower collection elements don't need to be updated - can skip traversal
@@ -124,6 +131,7 @@ def set_not_showing(current_element):
     Output:
         None
     """
+    constants.HitTestManager.set_visible(current_element, False)
     if not current_element.showing:
         return False
     current_element.showing = False
@@ -180,6 +180,40 @@ def prepare_planet_rotation():
     for i in range(round(planet_frames * num_planet_rotations)):
         constants.TIME_PASSING_PLANET_SCHEDULE[round(i * planet_step_interval)] = True
 
+    if (
+        constants.GLOBE_PROJECTION_DETAIL_LEVEL
+        <= constants.GLOBE_PROJECTION_REMAP_DETAIL_LEVEL
+    ):  # Remapped frames only depend on copied world data, so they can be rendered ahead on a worker thread
+        frames = []
+        rotation = 0
+        for scheduled in constants.TIME_PASSING_PLANET_SCHEDULE:
+            if scheduled:
+                frame_index, frame_latitude_lines = (
+                    status.current_world.get_latitude_line(
+                        constants.TIME_PASSING_EQUATORIAL_COORDINATES[
+                            (rotation + constants.TIME_PASSING_INITIAL_ORIENTATION)
+                            % status.current_world.world_dimensions
+                        ]
+                    )
+                )
+                frames.append(
+                    (
+                        frame_index,
+                        frame_latitude_lines is status.current_world.latitude_lines,
+                    )
+                )  # Some equatorial coordinates resolve to the other set of latitude lines
+                rotation += frame_interval * status.current_world.rotation_direction
+        globe_projection_inputs = {}
+        for primary_lines in set(primary_lines for index, primary_lines in frames):
+            if primary_lines:
+                frame_latitude_lines = status.current_world.latitude_lines
+            else:
+                frame_latitude_lines = status.current_world.alternate_latitude_lines
+            globe_projection_inputs[primary_lines] = (
+                status.current_world.get_globe_projection_inputs(frame_latitude_lines)
+            )
+        constants.GlobeRotationManager.start(globe_projection_inputs, frames)
+
 
 def start_enemy_turn():
     """
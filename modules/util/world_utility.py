@@ -1,6 +1,9 @@
 import random
 import os
-from typing import Dict, List, Any
+import math
+import pygame
+import numpy as np
+from typing import Dict, List, Any, Tuple
 from math import ceil
 from modules.constants import constants, status, flags
 
@@ -40,6 +43,69 @@ def generate_abstract_world_image(
     ]
 
 
+def remap_globe_projection(
+    globe_projection_inputs: Dict[str, Any], index: int
+) -> np.ndarray:
+    """
+    Description:
+        Remaps each location's orbital view color to the pixellated globe projection centered on the inputted latitude line - only uses the inputted
+            pure data, so it can safely run outside of the main thread
+    Input:
+        dictionary globe_projection_inputs: Globe projection inputs, as returned by full_world_handler.get_globe_projection_inputs
+        int index: Index of the latitude line to center the projection on
+    Output:
+        np.ndarray: Returns (width, height, 3) array of the RGB color of each pixel of the pixellated globe projection
+    """
+    pixels = globe_projection_inputs["line_colors"][
+        (index + globe_projection_inputs["line_offsets"])
+        % globe_projection_inputs["world_dimensions"],
+        globe_projection_inputs["line_points"],
+    ].astype(np.float64)
+
+    if globe_projection_inputs["sky_effect"]:
+        threshold, sky_color, alpha = globe_projection_inputs["sky_effect"]
+        sky_mask = globe_projection_inputs["sky_distances"] <= threshold
+        pixels[sky_mask] += (np.array(sky_color) - pixels[sky_mask]) * (alpha / 255)
+    pixels[~globe_projection_inputs["covered"]] = constants.color_dict[
+        constants.COLOR_TRANSPARENT
+    ]
+    return np.rint(pixels).astype(np.uint8)
+
+
+def create_remapped_globe_projection(
+    globe_projection_inputs: Dict[str, Any], index: int
+) -> Tuple[pygame.Surface, pygame.Surface]:
+    """
+    Description:
+        Creates the globe projection centered on the inputted latitude line by remapping each location's orbital view color - only uses the inputted
+            pure data and offscreen surfaces, so it can safely run outside of the main thread
+    Input:
+        dictionary globe_projection_inputs: Globe projection inputs, as returned by full_world_handler.get_globe_projection_inputs
+        int index: Index of the latitude line to center the projection on
+    Output:
+        pygame.Surface: Returns the pixellated globe projection, at the size of the globe projection image
+        pygame.Surface: Returns the globe projection scaled by the globe projection detail level
+    """
+    pixels = remap_globe_projection(globe_projection_inputs, index)
+    globe_projection_image = pygame.Surface(pixels.shape[0:2])
+    pygame.surfarray.blit_array(globe_projection_image, pixels)
+    globe_projection_image.set_colorkey(
+        constants.color_dict[constants.COLOR_TRANSPARENT]
+    )
+    globe_projection_image = pygame.transform.scale(
+        globe_projection_image, globe_projection_inputs["image_size"]
+    )
+    width, height = globe_projection_inputs["image_size"]
+    globe_projection_surface = pygame.transform.scale(  # Decrease detail of each image before applying pixel mutations to speed processing
+        globe_projection_image,
+        (
+            math.floor(width * globe_projection_inputs["detail_level"]),
+            math.floor(height * globe_projection_inputs["detail_level"]),
+        ),
+    )
+    return globe_projection_image, globe_projection_surface
+
+
 def get_preset() -> str:
     """
     Description:
@@ -63,12 +129,14 @@ def save_worlds() -> Dict[str, Dict[str, Any]]:
 
 
 def load_worlds(save_dicts: Dict[str, Dict[str, Any]]) -> None:
-    status.current_world = constants.ActorCreationManager.create(
-        True, save_dicts["current_world"]
-    )
-    status.earth_world = constants.ActorCreationManager.create(
-        True, save_dicts["earth_world"]
-    )
+    with constants.EventBus.defer_publishing():
+        # Each loaded location and mob is refreshed once after loading, rather than once per loaded edit
+        status.current_world = constants.ActorCreationManager.create(
+            True, save_dicts["current_world"]
+        )
+        status.earth_world = constants.ActorCreationManager.create(
+            True, save_dicts["earth_world"]
+        )
     for current_mob in status.mob_list:
         current_mob.load_end_turn_destination()
         # Loading end turn destinations depends on worlds being fully loaded
@@ -85,25 +153,28 @@ def new_worlds() -> None:
     )
 
 
-def generate_current_world_input_dict() -> Dict[str, Any]:
+def generate_current_world_input_dict(world_dimensions: int = None) -> Dict[str, Any]:
     return_dict: Dict[str, Any] = {}
     return_dict["init_type"] = constants.FULL_WORLD
     return_dict["green_screen"] = generate_world_green_screen()
 
     preset = get_preset()
     if preset:
-        return_dict.update(generate_preset_world(preset))
+        return_dict.update(generate_preset_world(preset, world_dimensions))
     else:
-        return_dict.update(generate_random_world())
+        return_dict.update(generate_random_world(world_dimensions))
     return return_dict
 
 
-def generate_preset_world(preset: str) -> Dict[str, Any]:
+def generate_preset_world(preset: str, world_dimensions: int = None) -> Dict[str, Any]:
     return_dict: Dict[str, Any] = {}
     return_dict["name"] = preset.capitalize()
-    return_dict["world_dimensions"] = constants.world_dimensions_options[
-        constants.TerrainManager.get_tuning(f"{preset}_dimensions_index")
-    ]
+    if world_dimensions:
+        return_dict["world_dimensions"] = world_dimensions
+    else:
+        return_dict["world_dimensions"] = constants.world_dimensions_options[
+            constants.TerrainManager.get_tuning(f"{preset}_dimensions_index")
+        ]
     ideal_atmosphere_size = (return_dict["world_dimensions"] ** 2) * 6
     return_dict["rotation_direction"] = constants.TerrainManager.get_tuning(
         f"{preset}_rotation_direction"
@@ -154,12 +225,17 @@ def generate_preset_world(preset: str) -> Dict[str, Any]:
     return return_dict
 
 
-def generate_random_world() -> Dict[str, Any]:
+def generate_random_world(world_dimensions: int = None) -> Dict[str, Any]:
     return_dict: Dict[str, Any] = {}
     return_dict["name"] = constants.FlavorTextManager.generate_flavor_text(
         "planet_names"
     )
-    return_dict["world_dimensions"] = random.choice(constants.world_dimensions_options)
+    if world_dimensions:
+        return_dict["world_dimensions"] = world_dimensions
+    else:
+        return_dict["world_dimensions"] = random.choice(
+            constants.world_dimensions_options
+        )
     ideal_atmosphere_size = (
         return_dict["world_dimensions"] ** 2
     ) * 6  # Atmosphere units required for 1 atm pressure (like Earth) - 6 units per location
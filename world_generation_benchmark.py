@@ -0,0 +1,150 @@
+# Generates worlds without opening a display and records how long each generation phase takes, for tracking performance regressions
+#   Run with python world_generation_benchmark.py --preset mars --seed 1 --output benchmarks.json
+#   Worlds are deterministic for a given preset, world dimensions, and seed, so terrain digests can also be compared across runs
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Must be set before pygame is initialized by importing constants
+
+import argparse
+import hashlib
+import json
+import random
+import time
+from typing import Dict, List, Any
+from modules.util import setup_utility, world_utility
+from modules.constants import constants, status, flags
+
+PRESETS: List[str] = [
+    constants.EARTH_WORLD,
+    constants.MARS_WORLD,
+    constants.VENUS_WORLD,
+]
+
+
+def generate_world(preset: str, world_dimensions: int, seed: int) -> Dict[str, Any]:
+    """
+    Description:
+        Generates a full world with the inputted configuration and returns a record of its generation phase times and resulting terrain
+    Input:
+        string preset: earth, mars, venus, or random
+        int world_dimensions: Width and height of the world, in locations
+        int seed: Seed for all random generation
+    Output:
+        dictionary: Returns a JSON-serializable record of the generated world
+    """
+    for current_preset in PRESETS:
+        constants.EffectManager.set_effect(
+            f"{current_preset}_preset", current_preset == preset
+        )
+    for terrain_feature_type in status.terrain_feature_types.values():
+        terrain_feature_type.clear_tracking()  # Forget poles and equator of previously generated worlds
+    random.seed(seed)
+    flags.loading = True  # Matches new game creation, which generates worlds during the loading screen
+    start_time = time.perf_counter()
+    world = constants.ActorCreationManager.create(
+        from_save=False,
+        input_dict=world_utility.generate_current_world_input_dict(
+            world_dimensions=world_dimensions
+        ),
+    )
+    total_time = time.perf_counter() - start_time
+
+    terrain_digest = hashlib.sha256()
+    for parameter in constants.terrain_parameters:
+        terrain_digest.update(world.get_parameter_array(parameter).tobytes())
+    terrain_counts: Dict[str, int] = {}
+    for terrain_index in constants.TerrainManager.classify_arrays(
+        world.terrain_parameter_arrays
+    ).ravel():
+        terrain_name = constants.TerrainManager.terrain_list[terrain_index]
+        terrain_counts[terrain_name] = terrain_counts.get(terrain_name, 0) + 1
+
+    record = {
+        "preset": preset,
+        "world_dimensions": world_dimensions,
+        "seed": seed,
+        "total_seconds": round(total_time, 4),
+        "phase_seconds": {
+            phase_name: round(phase_time, 4)
+            for phase_name, phase_time in world.generation_phase_times.items()
+        },
+        "unattributed_seconds": round(
+            total_time - sum(world.generation_phase_times.values()), 4
+        ),  # Deferred event callbacks, setup, and orbital world creation
+        "average_temperature": world.average_temperature,
+        "average_water": world.average_water,
+        "average_altitude": world.average_altitude,
+        "terrain_counts": dict(sorted(terrain_counts.items())),
+        "terrain_digest": terrain_digest.hexdigest(),
+    }
+    world.orbital_world.remove()
+    world.remove()
+    return record
+
+
+def main() -> None:
+    """
+    Description:
+        Parses command line arguments, generates each requested world, and writes the records as JSON
+    Input:
+        None
+    Output:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark headless world generation for each requested preset, world size, and seed"
+    )
+    parser.add_argument(
+        "--preset",
+        nargs="+",
+        default=["random"],
+        choices=PRESETS + ["random"],
+        help="world presets to generate",
+    )
+    parser.add_argument(
+        "--world-dimensions",
+        nargs="+",
+        type=int,
+        default=None,
+        help="world sizes to generate, defaulting to every entry in world_dimensions_options",
+    )
+    parser.add_argument(
+        "--seed", nargs="+", type=int, default=[0], help="seeds to generate"
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="file to write JSON results to, otherwise printed",
+    )
+    args = parser.parse_args()
+
+    setup_utility.setup_game()
+    records = []
+    for preset in args.preset:
+        for world_dimensions in (
+            args.world_dimensions or constants.world_dimensions_options
+        ):
+            for seed in args.seed:
+                records.append(generate_world(preset, world_dimensions, seed))
+                if args.output:  # Otherwise, only the results are printed
+                    print(
+                        f"Generated {preset} world of size {world_dimensions} with seed {seed} in {records[-1]['total_seconds']} seconds"
+                    )
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "world_dimensions_options": constants.world_dimensions_options,
+        "results": records,
+    }
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=4)
+    else:
+        print(json.dumps(results, indent=4))
+
+
+if __name__ == "__main__":
+    main()